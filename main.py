@@ -6,6 +6,7 @@ Point d'entrée principal de l'application (PySide6)
 
 import sys
 import os
+import logging
 from pathlib import Path
 
 # Configurer les variables d'environnement Qt AVANT tout import Qt
@@ -50,6 +51,12 @@ from src.ui.main_window import MainWindow
 def main():
     """Point d'entrée principal de l'application"""
     
+    # Journalisation: WARNING par défaut (messages de debug non formatés),
+    # niveau réglable avec MUSICPARTMATE_LOG=DEBUG
+    log_level = os.environ.get('MUSICPARTMATE_LOG', 'WARNING').upper()
+    logging.basicConfig(level=getattr(logging, log_level, logging.WARNING),
+                        format="%(levelname)s %(name)s: %(message)s")
+    
     # Configuration de l'application
     app = QApplication(sys.argv)
     app.setApplicationName("MusicPartMate")
@@ -61,7 +68,7 @@ def main():
         QMainWindow {
             background-color: #f5f5f5;
         }
-        QTreeWidget {
+        QTreeView {
             background-color: white;
             border: 1px solid #ddd;
         }
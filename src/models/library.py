@@ -2,15 +2,80 @@
 Gestionnaire de la bibliothèque musicale
 """
 
+import io
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, BinaryIO, Callable, Tuple, Iterator
 from dataclasses import dataclass
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from operator import attrgetter
 import shutil
+import atexit
+import threading
 from datetime import datetime
 
+from sortedcontainers import SortedList
+
 from .song import Song
 
+# Sérialisation JSON rapide si orjson est installé
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+# Lecture en flux de la bibliothèque si ijson est installé
+IJSON_AVAILABLE = False
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+# Décodage typé (schéma compilé) de la bibliothèque si msgspec est installé
+MSGSPEC_AVAILABLE = False
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    pass
+
+
+if MSGSPEC_AVAILABLE:
+    class _SongRecord(msgspec.Struct, kw_only=True):
+        """Schéma d'une chanson dans library.json (mêmes champs que Song)"""
+        title: str = ""
+        artist: str = ""
+        tempo: str = ""
+        style: str = ""
+        path: Optional[str] = None
+        documents: List[str] = []
+        audios: List[str] = []
+        videos: List[str] = []
+        links: List[str] = []
+        metadata: Dict[str, Any] = {}
+    
+    class _LibraryFile(msgspec.Struct):
+        """Schéma de library.json (les autres clés sont ignorées)"""
+        config: Optional[Dict[str, Any]] = None
+        songs: List[_SongRecord] = []
+    
+    _LIBRARY_DECODER = msgspec.json.Decoder(_LibraryFile)
+
+
+# Tampon d'écriture des exports
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_PROGRESS_STEP = 256  # Chansons écrites entre deux rappels de progression
+
+# Entrée de l'index trié: champs affichés et présence des médias, lus sans
+# repasser par les attributs de la chanson
+SongIdx = namedtuple('SongIdx', 'song title artist has_docs has_audio has_video has_links has_meta')
+
 
 @dataclass
 class LibraryConfig:
@@ -42,12 +107,50 @@ class Library:
         self.config = config
         self.songs: List[Song] = []
         self._observers: List[Callable] = []  # Observateurs pour les changements
+        self._batching = 0  # Profondeur des lots en cours (notifications suspendues)
+        self._pending = False  # Changement survenu pendant un lot
+        
+        # Journal des modifications (une opération JSON par ligne), compacté
+        # dans le fichier principal quand il devient plus gros que celui-ci
+        self._log_path = self.config.library_path.with_suffix('.jsonl')
+        self._log_size = 0
+        self._snapshot_size = 0
+        self._song_ids: Dict[int, str] = {}  # id(song) -> identifiant journalisé
+        
+        # Compaction différée: les réécritures complètes rapprochées sont
+        # regroupées par un minuteur en arrière-plan
+        self._save_lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Index de recherche, maintenus à chaque ajout/suppression/modification
+        self._song_set: set = set()  # Appartenance par identité en O(1)
+        self._by_key: Dict[Tuple[str, str], Song] = {}  # (artiste, titre) en minuscules
+        self._by_id: Dict[str, Song] = {}
+        self._by_artist: Dict[str, List[Song]] = {}
+        self._by_style: Dict[str, List[Song]] = {}
+        self._artist_counts: Counter = Counter()
+        self._style_counts: Counter = Counter()
+        self._artists_sorted = SortedList()  # Artistes distincts, triés
+        self._styles_sorted = SortedList()  # Styles distincts, triés
+        self._index_keys: Dict[int, Tuple[str, ...]] = {}  # id(song) -> clés indexées
+        self._sorted_index: Dict[str, List[SongIdx]] = {}  # Champ de tri -> index trié
+        
+        # Version incrémentée à chaque modification (mémoïsation des statistiques)
+        self._version = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_version = -1
+        self._stats_hits = 0
+        self._stats_misses = 0
         
         # Créer le dossier de données si nécessaire
         self.config.library_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Charger la bibliothèque
         self.load_library()
+        
+        # Ne pas perdre une compaction en attente à la fermeture
+        atexit.register(self.flush)
     
     def add_observer(self, callback: Callable) -> None:
         """Ajoute un observateur qui sera notifié des changements"""
@@ -61,28 +164,65 @@ class Library:
     
     def _notify_observers(self, event_type: str, song: Song = None) -> None:
         """Notifie tous les observateurs d'un changement"""
+        if self._batching:
+            # Une seule notification "bulk_changed" sera émise en fin de lot
+            self._pending = True
+            return
+        
         for callback in self._observers:
             try:
                 callback(event_type, song)
             except Exception as e:
                 print(f"Erreur dans l'observateur: {e}")
     
+    def begin_batch(self) -> None:
+        """Suspend les notifications jusqu'à l'appel de end_batch"""
+        self._batching += 1
+    
+    def end_batch(self) -> None:
+        """Termine un lot et notifie une seule fois s'il y a eu des changements"""
+        if self._batching == 0:
+            return
+        self._batching -= 1
+        if self._batching == 0 and self._pending:
+            self._pending = False
+            self._notify_observers("bulk_changed", None)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Regroupe plusieurs modifications en une seule notification
+        
+        Exemple:
+            with library.batch():
+                for song in songs:
+                    library.add_song(song)
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+    
     @property
     def song_count(self) -> int:
         """Nombre de chansons dans la bibliothèque"""
         return len(self.songs)
     
+    @property
+    def version(self) -> int:
+        """Compteur de modifications (change à chaque ajout, retrait ou mise à jour)"""
+        return self._version
+    
     @property
     def artists(self) -> List[str]:
         """Liste unique des artistes"""
-        artists = {song.artist for song in self.songs if song.artist}
-        return sorted(list(artists))
+        return list(self._artists_sorted)
     
     @property
     def styles(self) -> List[str]:
         """Liste unique des styles"""
-        styles = {song.style for song in self.songs if song.style}
-        return sorted(list(styles))
+        return list(self._styles_sorted)
     
     def add_song(self, song: Song) -> bool:
         """
@@ -94,8 +234,42 @@ class Library:
         Returns:
             bool: True si ajouté avec succès
         """
+        # Liste, index et journal modifiés ensemble: la compaction (minuteur en
+        # arrière-plan) ne voit jamais une liste en cours de modification
+        with self._save_lock:
+            if not self._insert_song(song):
+                return False
+            self._append_log({'op': 'add', 'song': song.to_dict()})
+        
+        self._notify_observers("song_added", song)
+        return True
+    
+    def add_songs(self, songs: List[Song]) -> List[Song]:
+        """
+        Ajoute plusieurs chansons: une seule écriture du journal et une seule
+        notification ("bulk_changed") pour tout le lot
+        
+        Args:
+            songs: Chansons à ajouter
+            
+        Returns:
+            List[Song]: Chansons effectivement ajoutées (valides, sans doublon)
+        """
+        # Un seul listing par dossier pour valider tout le lot
+        dir_cache: Dict[str, set] = {}
+        with self._save_lock:
+            added = [song for song in songs if self._insert_song(song, dir_cache)]
+            if added:
+                self._append_log(*({'op': 'add', 'song': song.to_dict()} for song in added))
+        
+        if added:
+            self._notify_observers("bulk_changed", None)
+        return added
+    
+    def _insert_song(self, song: Song, dir_cache: Optional[Dict[str, set]] = None) -> bool:
+        """Valide puis insère une chanson dans la liste et les index (sans journal)"""
         # Valider la chanson
-        if not song.is_valid():
+        if not song.is_valid(dir_cache):
             return False
         
         # Vérifier les doublons
@@ -103,8 +277,9 @@ class Library:
             return False
         
         self.songs.append(song)
-        self.save_library()
-        self._notify_observers("song_added", song)
+        song.invalidate_labels()
+        self._index_song(song)
+        self._song_ids[id(song)] = song.song_id
         return True
     
     def remove_song(self, song: Song) -> bool:
@@ -117,12 +292,16 @@ class Library:
         Returns:
             bool: True si supprimé avec succès
         """
-        if song in self.songs:
+        with self._save_lock:
+            if song not in self._song_set:
+                return False
             self.songs.remove(song)
-            self.save_library()
-            self._notify_observers("song_removed", song)
-            return True
-        return False
+            self._unindex_song(song)
+            song_id = self._song_ids.pop(id(song), song.song_id)
+            self._append_log({'op': 'del', 'id': song_id})
+        
+        self._notify_observers("song_removed", song)
+        return True
     
     def update_song(self, song: Song) -> bool:
         """
@@ -134,19 +313,45 @@ class Library:
         Returns:
             bool: True si mis à jour avec succès
         """
-        if song in self.songs and song.is_valid():
-            self.save_library()
-            self._notify_observers("song_updated", song)
-            return True
-        return False
+        with self._save_lock:
+            if song not in self._song_set or not song.is_valid():
+                return False
+            # L'ancien identifiant permet de retrouver la chanson au rechargement
+            # si son titre ou son artiste ont changé
+            old_id = self._song_ids.get(id(song), song.song_id)
+            song.invalidate_labels()
+            self._unindex_song(song)
+            self._index_song(song)
+            self._song_ids[id(song)] = song.song_id
+            self._append_log({'op': 'upd', 'id': old_id, 'song': song.to_dict()})
+        
+        self._notify_observers("song_updated", song)
+        return True
+    
+    def validate_all(self, dir_cache: Optional[Dict[str, set]] = None) -> Dict[str, List[str]]:
+        """
+        Valide toutes les chansons en partageant le listing des dossiers
+        
+        Args:
+            dir_cache: Cache des dossiers déjà listés (créé si absent)
+            
+        Returns:
+            Dict[str, List[str]]: Erreurs par identifiant de chanson invalide
+        """
+        if dir_cache is None:
+            dir_cache = {}
+        
+        invalid = {}
+        for song in self.songs:
+            errors = song.validate(dir_cache)
+            if errors:
+                invalid[song.song_id] = errors
+        return invalid
     
     def find_song_by_id(self, song_id: str) -> Optional[Song]:
         """Trouve une chanson par son ID unique"""
         # Pour l'instant, on utilise le titre + artiste comme ID
-        for song in self.songs:
-            if f"{song.artist}#{song.title}" == song_id:
-                return song
-        return None
+        return self._by_id.get(song_id)
     
     def find_duplicate(self, song: Song) -> Optional[Song]:
         """
@@ -158,11 +363,7 @@ class Library:
         Returns:
             Song: Chanson similaire trouvée ou None
         """
-        for existing_song in self.songs:
-            if (existing_song.title.lower() == song.title.lower() and 
-                existing_song.artist.lower() == song.artist.lower()):
-                return existing_song
-        return None
+        return self._by_key.get((song.artist.lower(), song.title.lower()))
     
     def search_songs(self, query: str, search_in: List[str] = None) -> List[Song]:
         """
@@ -179,31 +380,105 @@ class Library:
             search_in = ['title', 'artist', 'style']
         
         query = query.lower()
-        results = []
         
+        # Cas courant: tous les champs, un seul test par chanson sur le texte en cache
+        if {'title', 'artist', 'style'}.issubset(search_in):
+            return [song for song in self.songs if query in song.search_blob]
+        
+        results = []
         for song in self.songs:
             # Recherche dans les champs spécifiés
-            match_found = False
-            
-            if 'title' in search_in and query in song.title.lower():
-                match_found = True
-            elif 'artist' in search_in and query in song.artist.lower():
-                match_found = True
-            elif 'style' in search_in and query in song.style.lower():
-                match_found = True
+            title, artist, style = song.search_blob.split('\x1f')
             
-            if match_found:
+            if (('title' in search_in and query in title) or
+                    ('artist' in search_in and query in artist) or
+                    ('style' in search_in and query in style)):
                 results.append(song)
         
         return results
     
     def filter_by_artist(self, artist: str) -> List[Song]:
         """Filtre les chansons par artiste"""
-        return [song for song in self.songs if song.artist.lower() == artist.lower()]
+        return self._by_artist.get(artist.lower(), [])[:]
     
     def filter_by_style(self, style: str) -> List[Song]:
         """Filtre les chansons par style"""
-        return [song for song in self.songs if song.style.lower() == style.lower()]
+        return self._by_style.get(style.lower(), [])[:]
+    
+    def _index_song(self, song: Song) -> None:
+        """Ajoute une chanson aux index"""
+        self._version += 1
+        self._sorted_index.clear()
+        self._song_set.add(song)
+        artist_key = song.artist.lower()
+        style_key = song.style.lower()
+        song_id = song.song_id
+        
+        self._by_key[(artist_key, song.title.lower())] = song
+        self._by_id[song_id] = song
+        self._by_artist.setdefault(artist_key, []).append(song)
+        self._by_style.setdefault(style_key, []).append(song)
+        for counts, sorted_values, value in (
+                (self._artist_counts, self._artists_sorted, song.artist),
+                (self._style_counts, self._styles_sorted, song.style)):
+            if value:
+                if not counts[value]:
+                    sorted_values.add(value)
+                counts[value] += 1
+        
+        # Conserver les clés utilisées: titre/artiste peuvent changer avant update_song
+        self._index_keys[id(song)] = (artist_key, song.title.lower(), style_key,
+                                      song_id, song.artist, song.style)
+    
+    def _unindex_song(self, song: Song) -> None:
+        """Retire une chanson des index"""
+        self._version += 1
+        self._sorted_index.clear()
+        self._song_set.discard(song)
+        keys = self._index_keys.pop(id(song), None)
+        if keys is None:
+            return
+        artist_key, title_key, style_key, song_id, artist, style = keys
+        
+        if self._by_key.get((artist_key, title_key)) is song:
+            del self._by_key[(artist_key, title_key)]
+        if self._by_id.get(song_id) is song:
+            del self._by_id[song_id]
+        
+        for index, key in ((self._by_artist, artist_key), (self._by_style, style_key)):
+            bucket = index.get(key, [])
+            for i, existing in enumerate(bucket):
+                if existing is song:
+                    del bucket[i]
+                    break
+            if not bucket:
+                index.pop(key, None)
+        
+        for counts, sorted_values, value in (
+                (self._artist_counts, self._artists_sorted, artist),
+                (self._style_counts, self._styles_sorted, style)):
+            if value:
+                counts[value] -= 1
+                if counts[value] <= 0:
+                    del counts[value]
+                    sorted_values.discard(value)
+    
+    def _rebuild_indexes(self) -> None:
+        """Reconstruit tous les index à partir de la liste des chansons"""
+        self._song_set = set()
+        self._by_key = {}
+        self._by_id = {}
+        self._by_artist = {}
+        self._by_style = {}
+        self._artist_counts = Counter()
+        self._style_counts = Counter()
+        self._artists_sorted = SortedList()
+        self._styles_sorted = SortedList()
+        self._index_keys = {}
+        self._sorted_index = {}
+        self._version += 1
+        for song in self.songs:
+            self._index_song(song)
     
     def get_songs_sorted(self, sort_by: str = 'title', reverse: bool = False) -> List[Song]:
         """
@@ -216,15 +491,34 @@ class Library:
         Returns:
             List[Song]: Chansons triées
         """
-        if sort_by == 'title':
-            return sorted(self.songs, key=lambda s: s.title.lower(), reverse=reverse)
-        elif sort_by == 'artist':
-            return sorted(self.songs, key=lambda s: s.artist.lower(), reverse=reverse)
-        elif sort_by == 'style':
-            return sorted(self.songs, key=lambda s: s.style.lower(), reverse=reverse)
+        if sort_by in ('title', 'artist', 'style'):
+            # Clés casefold précalculées dans Song
+            return sorted(self.songs, key=attrgetter(f'_{sort_by}_ci'), reverse=reverse)
         else:
             return self.songs.copy()
     
+    def iter_sorted_index(self, sort_by: str = 'title') -> Iterator[SongIdx]:
+        """
+        Parcourt les chansons triées sous forme d'entrées d'index précalculées
+        
+        L'index est construit au premier appel puis conservé jusqu'au
+        prochain ajout, retrait ou modification.
+        
+        Args:
+            sort_by: Champ de tri ('title', 'artist', 'style')
+            
+        Returns:
+            Iterator[SongIdx]: Entrées dans l'ordre du tri
+        """
+        index = self._sorted_index.get(sort_by)
+        if index is None:
+            index = [SongIdx(song, song.title, song.artist,
+                             bool(song.documents), bool(song.audios), bool(song.videos),
+                             bool(song.links), bool(song.tempo or song.style or song.metadata))
+                     for song in self.get_songs_sorted(sort_by)]
+            self._sorted_index[sort_by] = index
+        return iter(index)
+    
     def save_library(self) -> bool:
         """
         Sauvegarde la bibliothèque sur disque
@@ -232,34 +526,52 @@ class Library:
         Returns:
             bool: True si sauvegarde réussie
         """
-        try:
-            # Backup automatique si configuré
-            if self.config.auto_backup and self.config.library_path.exists():
-                self._create_backup()
-            
-            # Préparer les données
-            data = {
-                'version': '1.0',
-                'created_date': datetime.now().isoformat(),
-                'song_count': len(self.songs),
-                'config': {
-                    'auto_backup': self.config.auto_backup,
-                    'backup_count': self.config.backup_count,
-                    'cloud_sync': self.config.cloud_sync,
-                    'cloud_provider': self.config.cloud_provider
-                },
-                'songs': [song.to_dict() for song in self.songs]
-            }
-            
-            # Sauvegarder
-            with open(self.config.library_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde: {e}")
-            return False
+        with self._save_lock:
+            # Instantané pris sous le verrou: les ajouts/suppressions l'attendent
+            songs = list(self.songs)
+            try:
+                # Backup automatique si configuré
+                if self.config.auto_backup and self.config.library_path.exists():
+                    self._create_backup()
+                
+                # Préparer les données
+                data = {
+                    'version': '1.0',
+                    'created_date': datetime.now().isoformat(),
+                    'song_count': len(songs),
+                    'config': {
+                        'auto_backup': self.config.auto_backup,
+                        'backup_count': self.config.backup_count,
+                        'cloud_sync': self.config.cloud_sync,
+                        'cloud_provider': self.config.cloud_provider
+                    },
+                    'songs': [song.to_dict() for song in songs]
+                }
+                
+                # Sauvegarder dans un fichier temporaire puis le renommer: le
+                # fichier principal change d'inode, les backups en lien dur
+                # conservent donc l'ancien contenu
+                tmp_path = self.config.library_path.with_name(self.config.library_path.name + '.tmp')
+                if ORJSON_AVAILABLE:
+                    tmp_path.write_bytes(
+                        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                    )
+                else:
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.config.library_path)
+                
+                # Le fichier principal contient tout: le journal peut être vidé
+                self._log_path.unlink(missing_ok=True)
+                self._log_size = 0
+                self._dirty = False
+                self._snapshot_size = self.config.library_path.stat().st_size
+                
+                return True
+                
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde: {e}")
+                return False
     
     def load_library(self) -> bool:
         """
@@ -268,18 +580,31 @@ class Library:
         Returns:
             bool: True si chargement réussi
         """
-        if not self.config.library_path.exists():
+        # Une compaction en attente ne doit pas écrire une liste à moitié chargée
+        with self._save_lock:
+            return self._load_library()
+    
+    def _load_library(self) -> bool:
+        """Chargement proprement dit (appelé sous le verrou de sauvegarde)"""
+        self.songs = []
+        self._song_ids = {}
+        self._log_size = 0
+        self._snapshot_size = 0
+        
+        if not self.config.library_path.exists() and not self._log_path.exists():
             # Créer une bibliothèque vide
-            self.songs = []
+            self._rebuild_indexes()
             return True
         
         try:
-            with open(self.config.library_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if self.config.library_path.exists():
+                config_data, songs_data = self._read_snapshot()
+                self._snapshot_size = self.config.library_path.stat().st_size
+            else:
+                config_data, songs_data = None, []
             
             # Charger les chansons
-            self.songs = []
-            for song_data in data.get('songs', []):
+            for song_data in songs_data:
                 try:
                     song = Song.from_dict(song_data)
                     self.songs.append(song)
@@ -287,21 +612,176 @@ class Library:
                     print(f"Erreur lors du chargement d'une chanson: {e}")
             
             # Charger la configuration si présente
-            if 'config' in data:
-                config_data = data['config']
+            if config_data is not None:
                 self.config.auto_backup = config_data.get('auto_backup', True)
                 self.config.backup_count = config_data.get('backup_count', 5)
                 self.config.cloud_sync = config_data.get('cloud_sync', False)
                 self.config.cloud_provider = config_data.get('cloud_provider', '')
             
+            # Rejouer les modifications enregistrées depuis la dernière compaction
+            self._replay_log()
+            self._song_ids = {id(song): song.song_id for song in self.songs}
+            self._rebuild_indexes()
+            
             print(f"Bibliothèque chargée: {len(self.songs)} chansons")
             return True
             
         except Exception as e:
             print(f"Erreur lors du chargement de la bibliothèque: {e}")
             self.songs = []
+            self._song_ids = {}
+            self._rebuild_indexes()
             return False
     
+    def _read_snapshot(self) -> Tuple[Optional[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """
+        Lit le fichier principal de la bibliothèque
+        
+        Returns:
+            Tuple: (configuration ou None, itérateur sur les chansons)
+        """
+        if MSGSPEC_AVAILABLE:
+            # Décodeur spécialisé au schéma: pas d'arbre de dict intermédiaire
+            try:
+                with self._map_snapshot() as view:
+                    library_file = _LIBRARY_DECODER.decode(view)
+                return library_file.config, map(msgspec.structs.asdict, library_file.songs)
+            except msgspec.ValidationError as e:
+                # Une seule chanson mal typée invalide tout le décodage: relecture
+                # sans schéma, les chansons invalides sont ignorées une à une
+                print(f"⚠️ Schéma de la bibliothèque inattendu ({e}), lecture tolérante")
+        elif IJSON_AVAILABLE:
+            # Lecture en flux: chaque chanson est décodée puis libérée
+            # avant la suivante, sans charger tout l'arbre JSON en mémoire
+            with open(self.config.library_path, 'rb') as f:
+                config_data = next(ijson.items(f, 'config', use_float=True), None)
+            return config_data, self._stream_songs()
+        
+        if ORJSON_AVAILABLE:
+            with self._map_snapshot() as view:
+                data = orjson.loads(view)
+        else:
+            with open(self.config.library_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        return data.get('config'), iter(data.get('songs', []))
+    
+    @contextmanager
+    def _map_snapshot(self):
+        """
+        Projette le fichier principal en mémoire (lecture seule)
+        
+        Le décodeur lit directement le cache de pages du système,
+        sans copie préalable du fichier dans un objet bytes
+        """
+        with open(self.config.library_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    yield view
+    
+    def _stream_songs(self) -> Iterator[Dict[str, Any]]:
+        """Itère sur les chansons du fichier principal sans le charger entièrement"""
+        with open(self.config.library_path, 'rb') as f:
+            yield from ijson.items(f, 'songs.item', use_float=True)
+    
+    def _replay_log(self) -> None:
+        """Applique les opérations du journal aux chansons chargées"""
+        if not self._log_path.exists():
+            return
+        
+        songs: List[Optional[Song]] = list(self.songs)
+        positions = {song.song_id: i for i, song in enumerate(songs)}
+        
+        with open(self._log_path, 'rb') as f:
+            for line in f:
+                self._log_size += len(line)
+                try:
+                    entry = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+                    op = entry['op']
+                    
+                    if op == 'del':
+                        index = positions.pop(entry['id'], None)
+                        if index is not None:
+                            songs[index] = None
+                        continue
+                    
+                    song = Song.from_dict(entry['song'])
+                    index = positions.pop(entry['id'], None) if op == 'upd' else None
+                    if index is None:
+                        index = positions.get(song.song_id)
+                    
+                    if index is None:
+                        positions[song.song_id] = len(songs)
+                        songs.append(song)
+                    else:
+                        positions[song.song_id] = index
+                        songs[index] = song
+                        
+                except Exception as e:
+                    # Une ligne tronquée (arrêt brutal) ne doit pas bloquer le chargement
+                    print(f"Entrée de journal ignorée: {e}")
+        
+        self.songs = [song for song in songs if song is not None]
+    
+    def _append_log(self, *entries: Dict[str, Any]) -> None:
+        """
+        Ajoute des opérations au journal (écriture O(1) au lieu de réécrire
+        toute la bibliothèque, un seul ajout pour un lot), puis compacte si nécessaire
+        """
+        try:
+            if ORJSON_AVAILABLE:
+                lines = b''.join(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+                                 for entry in entries)
+            else:
+                lines = b''.join(json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n'
+                                 for entry in entries)
+            
+            with self._save_lock:
+                with open(self._log_path, 'ab') as f:
+                    f.write(lines)
+                self._log_size += len(lines)
+            
+        except Exception as e:
+            print(f"Erreur lors de l'écriture du journal: {e}")
+            # Repli: réécrire la bibliothèque complète
+            self.save_library()
+            return
+        
+        if self._log_size > self._snapshot_size:
+            self._mark_dirty()
+    
+    def _mark_dirty(self) -> None:
+        """Programme une compaction dans 0,5 s, en repoussant celle en attente"""
+        self._dirty = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(0.5, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def flush(self) -> None:
+        """Effectue immédiatement la compaction en attente, s'il y en a une"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        with self._save_lock:
+            if self._dirty:
+                self.compact()
+    
+    def compact(self, force: bool = False) -> bool:
+        """
+        Réécrit le fichier principal et vide le journal quand celui-ci
+        dépasse la taille du fichier principal
+        
+        Args:
+            force: Compacter même si le journal est petit
+            
+        Returns:
+            bool: True si une compaction a eu lieu
+        """
+        if not force and self._log_size <= self._snapshot_size:
+            return False
+        return self.save_library()
+    
     def _create_backup(self) -> None:
         """Crée une sauvegarde de la bibliothèque"""
         backup_dir = self.config.library_path.parent / "backups"
@@ -312,16 +792,20 @@ class Library:
         backup_name = f"library_backup_{timestamp}.json"
         backup_path = backup_dir / backup_name
         
-        # Copier le fichier
-        shutil.copy2(self.config.library_path, backup_path)
+        # Lien dur (aucune copie), copie seulement si impossible (autre volume...)
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(self.config.library_path, backup_path)
+        except OSError:
+            shutil.copy2(self.config.library_path, backup_path)
         
         # Nettoyer les anciens backups
         self._cleanup_old_backups(backup_dir)
     
     def _cleanup_old_backups(self, backup_dir: Path) -> None:
         """Supprime les anciens backups en gardant seulement backup_count fichiers"""
-        backup_files = list(backup_dir.glob("library_backup_*.json"))
-        backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        # L'horodatage du nom (AAAAMMJJ_HHMMSS) se trie comme la date: pas de stat()
+        backup_files = sorted(backup_dir.glob("library_backup_*.json"), key=lambda x: x.name, reverse=True)
         
         # Supprimer les fichiers en excès
         for old_backup in backup_files[self.config.backup_count:]:
@@ -330,94 +814,146 @@ class Library:
             except Exception as e:
                 print(f"Erreur lors de la suppression du backup {old_backup}: {e}")
     
-    def export_library(self, export_path: Path, format_type: str = 'json') -> bool:
+    def export_library(self, export_path: Path, format_type: str = 'json',
+                       progress: Optional[Callable[[int, int], bool]] = None) -> bool:
         """
         Exporte la bibliothèque dans différents formats
         
         Args:
             export_path: Chemin d'export
             format_type: Format ('json', 'csv')
+            progress: Appelé avec (chansons écrites, total); False pour annuler
             
         Returns:
-            bool: True si export réussi
+            bool: True si export réussi (False si annulé: le fichier partiel est supprimé)
         """
+        if format_type not in ('json', 'csv'):
+            return False
         try:
-            if format_type == 'json':
-                return self._export_json(export_path)
-            elif format_type == 'csv':
-                return self._export_csv(export_path)
-            else:
-                return False
+            # Écriture en flux à travers un tampon de 1 Mio
+            with open(export_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                completed = self.stream_export(f, format_type, progress)
+            if not completed:
+                export_path.unlink(missing_ok=True)
+            return completed
         except Exception as e:
             print(f"Erreur lors de l'export: {e}")
             return False
     
-    def _export_json(self, export_path: Path) -> bool:
-        """Exporte en JSON"""
-        data = {
-            'exported_date': datetime.now().isoformat(),
-            'song_count': len(self.songs),
-            'songs': [song.to_dict() for song in self.songs]
-        }
+    def stream_export(self, f: BinaryIO, format_type: str = 'json',
+                      progress: Optional[Callable[[int, int], bool]] = None) -> bool:
+        """
+        Écrit l'export chanson par chanson dans un fichier binaire ouvert
         
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        Args:
+            f: Fichier de destination (mode binaire)
+            format_type: Format ('json', 'csv')
+            progress: Appelé toutes les EXPORT_PROGRESS_STEP chansons avec
+                (chansons écrites, total); False pour interrompre
         
+        Returns:
+            bool: False si l'export a été interrompu
+        """
+        songs = list(self.songs)  # Instantané: la liste peut changer pendant l'écriture
+        if format_type == 'json':
+            write = self._export_json
+        elif format_type == 'csv':
+            write = self._export_csv
+        else:
+            raise ValueError(f"Format d'export inconnu: {format_type}")
+        
+        total = len(songs)
+        
+        def should_continue(done: int) -> bool:
+            if progress is None or (done % EXPORT_PROGRESS_STEP and done != total):
+                return True
+            return progress(done, total) is not False
+        
+        return write(f, songs, should_continue)
+    
+    @staticmethod
+    def _export_json(f: BinaryIO, songs: List[Song], should_continue: Callable[[int], bool]) -> bool:
+        """Exporte en JSON, un élément du tableau 'songs' à la fois"""
+        if ORJSON_AVAILABLE:
+            def dumps(value) -> bytes:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            def dumps(value) -> bytes:
+                return json.dumps(value, ensure_ascii=False).encode('utf-8')
+        
+        f.write(b'{\n  "exported_date": ' + dumps(datetime.now().isoformat())
+                + b',\n  "song_count": ' + str(len(songs)).encode()
+                + b',\n  "songs": [')
+        separator = b'\n    '
+        for done, song in enumerate(songs, 1):
+            f.write(separator)
+            f.write(dumps(song.to_dict()))
+            separator = b',\n    '
+            if not should_continue(done):
+                return False
+        f.write(b'\n  ]\n}\n')
         return True
     
-    def _export_csv(self, export_path: Path) -> bool:
+    @staticmethod
+    def _export_csv(f: BinaryIO, songs: List[Song], should_continue: Callable[[int], bool]) -> bool:
         """Exporte en CSV"""
         import csv
         
-        with open(export_path, 'w', newline='', encoding='utf-8') as csvfile:
+        text = io.TextIOWrapper(f, encoding='utf-8', newline='', write_through=False)
+        try:
             fieldnames = ['title', 'artist', 'tempo', 'style', 'documents', 'audios', 'videos']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(text)
             
-            writer.writeheader()
-            for song in self.songs:
-                writer.writerow({
-                    'title': song.title,
-                    'artist': song.artist,
-                    'tempo': song.tempo,
-                    'style': song.style,
-                    'documents': ';'.join([str(d) for d in song.documents]),
-                    'audios': ';'.join([str(a) for a in song.audios]),
-                    'videos': ';'.join([str(v) for v in song.videos])
-                })
-        
-        return True
+            # Lignes positionnelles: pas de dictionnaire intermédiaire par chanson
+            writer.writerow(fieldnames)
+            for done, song in enumerate(songs, 1):
+                writer.writerow((song.title, song.artist, song.tempo, song.style,
+                                 ';'.join(song.documents),
+                                 ';'.join(song.audios),
+                                 ';'.join(song.videos)))
+                if not should_continue(done):
+                    return False
+            return True
+        finally:
+            # Rendre le fichier à l'appelant (le wrapper le fermerait sinon)
+            text.flush()
+            text.detach()
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Retourne des statistiques sur la bibliothèque"""
-        return {
+        """Retourne des statistiques sur la bibliothèque (recalculées après modification)"""
+        if self._stats_version == self._version:
+            self._stats_hits += 1
+            return dict(self._stats_cache)
+        self._stats_misses += 1
+        
+        self._stats_cache = {
             'total_songs': len(self.songs),
-            'total_artists': len(self.artists),
-            'total_styles': len(self.styles),
+            'total_artists': len(self._artists_sorted),
+            'total_styles': len(self._styles_sorted),
             'songs_with_documents': len([s for s in self.songs if s.has_documents]),
             'songs_with_audio': len([s for s in self.songs if s.has_audio]),
             'songs_with_video': len([s for s in self.songs if s.has_video]),
             'most_common_style': self._get_most_common_style(),
             'most_prolific_artist': self._get_most_prolific_artist()
         }
+        self._stats_version = self._version
+        return dict(self._stats_cache)
+    
+    def statistics_cache_info(self) -> Tuple[int, int]:
+        """
+        Efficacité du cache des statistiques
+        
+        Returns:
+            Tuple[int, int]: (appels servis par le cache, recalculs)
+        """
+        return self._stats_hits, self._stats_misses
     
     def _get_most_common_style(self) -> str:
         """Retourne le style le plus fréquent"""
-        style_counts = {}
-        for song in self.songs:
-            if song.style:
-                style_counts[song.style] = style_counts.get(song.style, 0) + 1
-        
-        if style_counts:
-            return max(style_counts, key=style_counts.get)
-        return ""
+        most_common = self._style_counts.most_common(1)
+        return most_common[0][0] if most_common else ""
     
     def _get_most_prolific_artist(self) -> str:
         """Retourne l'artiste avec le plus de chansons"""
-        artist_counts = {}
-        for song in self.songs:
-            if song.artist:
-                artist_counts[song.artist] = artist_counts.get(song.artist, 0) + 1
-        
-        if artist_counts:
-            return max(artist_counts, key=artist_counts.get)
-        return ""
\ No newline at end of file
+        most_common = self._artist_counts.most_common(1)
+        return most_common[0][0] if most_common else ""
\ No newline at end of file
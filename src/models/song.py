@@ -2,18 +2,41 @@
 Modèle de données pour une chanson
 """
 
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field, fields, MISSING
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import json
 
+from ..utils.fast_stat import is_dir_fast
+from ..utils.file_utils import (
+    AUDIO_EXTENSIONS, DOCUMENT_EXTENSIONS, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
+)
 
-@dataclass
+
+# Champs dont dépendent les valeurs mises en cache (recherche)
+_SEARCH_FIELDS = frozenset(('title', 'artist', 'style'))
+
+# Champs dont dépendent les libellés d'affichage mis en cache
+_LABEL_FIELDS = frozenset(('title', 'artist', 'tempo', 'style', 'metadata'))
+
+# Libellés de la chanson dans l'arbre et les résultats de recherche
+SongLabels = namedtuple('SongLabels', 'title display tempo_line style_line metadata_lines')
+
+# Ensembles parallèles aux listes de médias, pour des tests d'appartenance en O(1)
+_MEDIA_SETS = {'documents': '_docs_set', 'audios': '_audios_set', 'videos': '_videos_set'}
+
+
+@dataclass(eq=False)
 class Song:
     """
     Représente une chanson avec ses métadonnées et médias associés
     
-    Utilise @dataclass pour simplifier la création et la gestion des données
+    Utilise @dataclass pour simplifier la création et la gestion des données.
+    L'égalité est l'identité (eq=False): une chanson est hachable et les tests
+    d'appartenance ne comparent pas les champs un à un.
     """
     
     # Métadonnées principales
@@ -26,9 +49,10 @@ class Song:
     path: Optional[Path] = None
     
     # Listes de médias (utilisation de field pour éviter les listes mutables partagées)
-    documents: List[Path] = field(default_factory=list)
-    audios: List[Path] = field(default_factory=list)
-    videos: List[Path] = field(default_factory=list)
+    # Les chemins sont stockés en str; Path(...) seulement là où c'est utile
+    documents: List[str] = field(default_factory=list)
+    audios: List[str] = field(default_factory=list)
+    videos: List[str] = field(default_factory=list)
     links: List[str] = field(default_factory=list)
     
     # Métadonnées supplémentaires extensibles
@@ -40,12 +64,54 @@ class Song:
         if isinstance(self.path, str):
             self.path = Path(self.path) if self.path else None
         
-        # Normaliser les listes de médias
-        self.documents = [Path(p) if isinstance(p, str) else p for p in self.documents]
-        self.audios = [Path(p) if isinstance(p, str) else p for p in self.audios]
-        self.videos = [Path(p) if isinstance(p, str) else p for p in self.videos]
+        # Les listes de médias sont normalisées en str par __setattr__
         self.links = [str(p) if isinstance(p, str) else p for p in self.links]
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Met à jour les caches quand un champ de recherche est modifié"""
+        object.__setattr__(self, name, value)
+        if name in _LABEL_FIELDS:
+            self.__dict__.pop('_labels', None)
+        if name in _SEARCH_FIELDS:
+            self.__dict__.pop('_search_blob', None)
+            # Clé de tri insensible à la casse (_title_ci, _artist_ci, _style_ci),
+            # None (anciens fichiers, saisie vide) trié comme une chaîne vide
+            object.__setattr__(self, f'_{name}_ci', (value or '').casefold())
+        elif name in _MEDIA_SETS:
+            value = [os.fspath(p) for p in value]
+            object.__setattr__(self, name, value)
+            object.__setattr__(self, _MEDIA_SETS[name], set(value))
+    
+    @property
+    def search_blob(self) -> str:
+        """Titre, artiste et style en minuscules, pour la recherche"""
+        blob = self.__dict__.get('_search_blob')
+        if blob is None:
+            # Le séparateur \x1f évite les correspondances à cheval sur deux champs
+            blob = f"{self.title}\x1f{self.artist}\x1f{self.style}".lower()
+            self.__dict__['_search_blob'] = blob
+        return blob
+    
+    @property
+    def cached_labels(self) -> SongLabels:
+        """Libellés d'affichage (avec emoji), calculés une fois puis mis en cache"""
+        labels = self.__dict__.get('_labels')
+        if labels is None:
+            labels = SongLabels(
+                title=f"🎵 {self.title}",
+                display=f"🎵 {self.display_name}",
+                tempo_line=f"Tempo: {self.tempo}" if self.tempo else None,
+                style_line=f"Style: {self.style}" if self.style else None,
+                # Les notes ne s'affichent pas dans l'arbre
+                metadata_lines=tuple(f"{key}: {value}" for key, value in self.metadata.items()
+                                     if key != 'notes'))
+            self.__dict__['_labels'] = labels
+        return labels
+    
+    def invalidate_labels(self) -> None:
+        """Oublie les libellés en cache (métadonnées modifiées sur place)"""
+        self.__dict__.pop('_labels', None)
+    
     @property
     def display_name(self) -> str:
         """Nom d'affichage de la chanson"""
@@ -58,6 +124,11 @@ class Song:
         else:
             return "Chanson sans titre"
     
+    @property
+    def song_id(self) -> str:
+        """Identifiant de la chanson (artiste#titre)"""
+        return f"{self.artist}#{self.title}"
+    
     @property
     def has_documents(self) -> bool:
         """Vérifie si la chanson a des documents"""
@@ -81,45 +152,47 @@ class Song:
     @property
     def primary_document(self) -> Optional[Path]:
         """Retourne le document principal (premier de la liste)"""
-        return self.documents[0] if self.documents else None
+        return Path(self.documents[0]) if self.documents else None
     
-    def add_document(self, file_path: Path) -> None:
+    def add_document(self, file_path: Union[Path, str]) -> None:
         """Ajoute un document à la chanson"""
-        if file_path not in self.documents:
+        file_path = os.fspath(file_path)
+        if file_path not in self._docs_set:
+            self._docs_set.add(file_path)
             self.documents.append(file_path)
     
-    def add_audio(self, file_path: Path) -> None:
+    def add_audio(self, file_path: Union[Path, str]) -> None:
         """Ajoute un fichier audio à la chanson"""
-        if file_path not in self.audios:
+        file_path = os.fspath(file_path)
+        if file_path not in self._audios_set:
+            self._audios_set.add(file_path)
             self.audios.append(file_path)
     
-    def add_video(self, file_path: Path) -> None:
+    def add_video(self, file_path: Union[Path, str]) -> None:
         """Ajoute un fichier vidéo à la chanson"""
-        if file_path not in self.videos:
+        file_path = os.fspath(file_path)
+        if file_path not in self._videos_set:
+            self._videos_set.add(file_path)
             self.videos.append(file_path)
 
     def add_link(self, file_path: str) -> None:
         """Ajoute une url"""
         self.links.append(file_path)
     
-    def remove_media(self, file_path: Path) -> bool:
+    def remove_media(self, file_path: Union[Path, str]) -> bool:
         """
         Supprime un média de toutes les listes
         Retourne True si le fichier a été trouvé et supprimé
         """
         removed = False
+        file_path = os.fspath(file_path)
         
-        if file_path in self.documents:
-            self.documents.remove(file_path)
-            removed = True
-        
-        if file_path in self.audios:
-            self.audios.remove(file_path)
-            removed = True
-        
-        if file_path in self.videos:
-            self.videos.remove(file_path)
-            removed = True
+        for name, set_name in _MEDIA_SETS.items():
+            media_set = getattr(self, set_name)
+            if file_path in media_set:
+                media_set.discard(file_path)
+                getattr(self, name).remove(file_path)
+                removed = True
 
         if file_path in self.links:
             self.links.remove(file_path)
@@ -127,13 +200,18 @@ class Song:
         
         return removed
     
-    def get_all_media_files(self) -> List[Path]:
+    def get_all_media_files(self) -> List[str]:
         """Retourne tous les fichiers média de la chanson"""
         return self.documents + self.audios + self.videos
     
-    def validate(self) -> List[str]:
+    def validate(self, dir_cache: Optional[Dict[str, set]] = None) -> List[str]:
         """
         Valide la chanson et retourne une liste des erreurs trouvées
+        
+        Args:
+            dir_cache: Contenu des dossiers déjà listés (dossier -> noms),
+                partagé entre les chansons d'un même lot; sans cache,
+                chaque fichier est vérifié par os.path.exists
         """
         errors = []
         
@@ -145,48 +223,32 @@ class Song:
         if not self.has_documents and not self.has_audio and not self.has_video:
             errors.append("La chanson doit avoir au moins un document, audio ou vidéo")
         
-        # Vérifier que les fichiers existent
+        # Vérifier que les fichiers existent. Avec un cache partagé (validation
+        # en lot), un seul listing par dossier; un nom absent du listing est
+        # revérifié par stat() (casse, normalisation NFC/NFD)
         for file_path in self.get_all_media_files():
-            if not file_path.exists():
+            if dir_cache is not None:
+                parent, name = os.path.split(file_path)
+                names = dir_cache.get(parent)
+                if names is None:
+                    try:
+                        names = set(os.listdir(parent or '.'))
+                    except OSError:
+                        names = set()
+                    dir_cache[parent] = names
+                if name in names:
+                    continue
+            if not os.path.exists(file_path):
                 errors.append(f"Fichier introuvable: {file_path}")
         
         return errors
     
-    def is_valid(self) -> bool:
+    def is_valid(self, dir_cache: Optional[Dict[str, set]] = None) -> bool:
         """Retourne True si la chanson est valide"""
-        return len(self.validate()) == 0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convertit la chanson en dictionnaire pour la sauvegarde"""
-        return {
-            'title': self.title,
-            'artist': self.artist,
-            'tempo': self.tempo,
-            'style': self.style,
-            'path': str(self.path) if self.path else None,
-            'documents': [str(doc) for doc in self.documents],
-            'audios': [str(audio) for audio in self.audios],
-            'videos': [str(video) for video in self.videos],
-            'links': [str(link) for link in self.links],
-            'metadata': self.metadata
-        }
+        return len(self.validate(dir_cache)) == 0
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Song':
-        """Crée une chanson à partir d'un dictionnaire"""
-        song = cls(
-            title=data.get('title', ''),
-            artist=data.get('artist', ''),
-            tempo=data.get('tempo', ''),
-            style=data.get('style', ''),
-            path=Path(data['path']) if data.get('path') else None,
-            documents=[Path(doc) for doc in data.get('documents', [])],
-            audios=[Path(audio) for audio in data.get('audios', [])],
-            videos=[Path(video) for video in data.get('videos', [])],
-            links=[str(link) for link in data.get('links', [])],
-            metadata=data.get('metadata', {})
-        )
-        return song
+    # to_dict() / from_dict() sont générés à partir des champs du dataclass,
+    # voir _compile_serializers() en fin de classe
     
     @classmethod
     def from_json(cls, json_str: str) -> 'Song':
@@ -210,7 +272,70 @@ class Song:
 
 
 # Fonctions utilitaires pour les chansons
-def create_song_from_folder(folder_path: Path, title: str = None, artist: str = None) -> Song:
+def _compile_serializers(cls) -> None:
+    """
+    Génère to_dict/from_dict spécialisés à partir des champs du dataclass
+    
+    Le code produit est une suite d'accès directs aux attributs, sans boucle
+    ni conversion inutile (les médias sont déjà stockés en str)
+    """
+    to_items = []
+    from_args = []
+    for f in fields(cls):
+        name = f.name
+        if f.default is not MISSING:
+            default = repr(f.default)
+        else:
+            default = f"{f.default_factory.__name__}()"
+        
+        if f.type == Optional[Path]:
+            to_items.append(f"{name!r}: str(self.{name}) if self.{name} else None")
+            from_args.append(f"{name}=Path(data[{name!r}]) if get({name!r}) else None")
+        elif f.type == List[str]:
+            to_items.append(f"{name!r}: list(self.{name})")
+            from_args.append(f"{name}=get({name!r}, {default})")
+        else:
+            to_items.append(f"{name!r}: self.{name}")
+            from_args.append(f"{name}=get({name!r}, {default})")
+    
+    source = (
+        "def to_dict(self):\n"
+        f"    return {{{', '.join(to_items)}}}\n"
+        "def from_dict(cls, data):\n"
+        "    get = data.get\n"
+        f"    return cls({', '.join(from_args)})\n"
+    )
+    namespace = {}
+    exec(source, {'Path': Path}, namespace)
+    
+    to_dict = namespace['to_dict']
+    to_dict.__doc__ = "Convertit la chanson en dictionnaire pour la sauvegarde"
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    from_dict = namespace['from_dict']
+    from_dict.__doc__ = "Crée une chanson à partir d'un dictionnaire"
+    from_dict.__qualname__ = f"{cls.__name__}.from_dict"
+    
+    cls.to_dict = to_dict
+    cls.from_dict = classmethod(from_dict)
+
+
+_compile_serializers(Song)
+
+
+# Les images d'un dossier de chanson (partitions scannées) sont rangées
+# avec ses documents; les extensions viennent de file_utils
+_SONG_DOCUMENT_EXTENSIONS = DOCUMENT_EXTENSIONS | IMAGE_EXTENSIONS
+
+# Nombre de lectures de dossiers simultanées dans create_song_from_folder
+_SCAN_WORKERS = 16
+
+# Exécuteur partagé par tous les appels (threads créés à la demande), utilisé
+# seulement pour les niveaux de plusieurs dossiers
+_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=_SCAN_WORKERS, thread_name_prefix="song-scan")
+
+
+def create_song_from_folder(folder_path: Union[Path, str], title: str = None, artist: str = None,
+                            parallel: bool = True) -> Song:
     """
     Crée une chanson en analysant automatiquement un dossier
     
@@ -218,17 +343,17 @@ def create_song_from_folder(folder_path: Path, title: str = None, artist: str =
         folder_path: Chemin vers le dossier contenant les médias
         title: Titre optionnel (par défaut: nom du dossier)
         artist: Artiste optionnel
+        parallel: False pour tout lire dans le thread appelant (appelant
+            déjà exécuté dans un pool)
     
     Returns:
         Song: Nouvelle chanson avec les médias trouvés
     """
-    if not folder_path.exists() or not folder_path.is_dir():
+    # Path seulement à l'entrée et pour Song.path, des str dans le parcours
+    folder = os.fspath(folder_path)
+    if not is_dir_fast(folder):
         raise ValueError(f"Dossier invalide: {folder_path}")
-    
-    # Extensions supportées
-    DOCUMENT_EXTENSIONS = {'.pdf', '.txt', '.doc', '.docx', '.odt', '.png', '.jpg', '.jpeg', '.gif', '.bmp'}
-    AUDIO_EXTENSIONS = {'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', '.wma'}
-    VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
+    folder_path = Path(folder)
     
     # Créer la chanson
     song = Song(
@@ -237,16 +362,52 @@ def create_song_from_folder(folder_path: Path, title: str = None, artist: str =
         path=folder_path
     )
     
-    # Parcourir tous les fichiers du dossier
-    for file_path in folder_path.rglob("*"):
-        if file_path.is_file():
-            extension = file_path.suffix.lower()
-            
-            if extension in DOCUMENT_EXTENSIONS:
-                song.add_document(file_path)
-            elif extension in AUDIO_EXTENSIONS:
-                song.add_audio(file_path)
-            elif extension in VIDEO_EXTENSIONS:
-                song.add_video(file_path)
-    
-    return song
\ No newline at end of file
+    # Parcourir le dossier niveau par niveau: les lectures de répertoires d'un
+    # même niveau sont lancées en parallèle (utile sur les montages réseau/cloud).
+    # Un niveau d'un seul dossier, le cas courant, est lu sur place
+    directories = [folder]
+    while directories:
+        scan = map if not parallel or len(directories) == 1 else _SCAN_EXECUTOR.map
+        next_directories = []
+        for files, subdirectories in scan(_scan_directory, directories):
+            for file_path, extension in files:
+                if extension in _SONG_DOCUMENT_EXTENSIONS:
+                    song.add_document(file_path)
+                elif extension in AUDIO_EXTENSIONS:
+                    song.add_audio(file_path)
+                elif extension in VIDEO_EXTENSIONS:
+                    song.add_video(file_path)
+            next_directories.extend(subdirectories)
+        directories = next_directories
+    
+    return song
+
+
+def _scan_directory(directory: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    Liste un dossier en une seule lecture (os.scandir)
+    
+    Args:
+        directory: Dossier à lister
+    
+    Returns:
+        Tuple: ([(fichier, extension en minuscules)], sous-dossiers)
+    """
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # DirEntry.is_file/is_dir évitent un stat() supplémentaire
+                if entry.is_file():
+                    # Extension tirée du nom, comme Path.suffix ('.bashrc' -> '')
+                    name = entry.name
+                    dot = name.rfind('.')
+                    files.append((entry.path, name[dot:].lower() if dot > 0 else ''))
+                elif entry.is_dir(follow_symlinks=False):
+                    # Comme rglob, ne pas suivre les liens vers des dossiers
+                    subdirectories.append(entry.path)
+    except OSError:
+        # Dossier illisible: ignoré, comme avec rglob
+        pass
+    return files, subdirectories
\ No newline at end of file
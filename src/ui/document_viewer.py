@@ -3,34 +3,266 @@ Widget pour afficher les documents (PDF, TXT, images, etc.) - Version PySide6 am
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QScrollArea, QLabel, QTextEdit, 
+    QWidget, QVBoxLayout, QScrollArea, QLabel, QTextEdit, QPlainTextEdit,
     QHBoxLayout, QPushButton, QSpinBox, QProgressBar, QFrame
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QPixmap, QFont, QPainter, QPen, QTextDocument
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QObject, QThreadPool, QSize, QRect, QUrl, QByteArray
+from PySide6.QtGui import QPixmap, QImage, QFont, QPainter, QPen, QTextDocument, QTextCursor
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from collections import OrderedDict
+import mmap
+import posixpath
+import re
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
 import fitz  # PyMuPDF pour les PDF
 import tempfile
-import base64
 import io
 
+# Import conditionnel de lxml (filtrage des balises ODT en C)
+LXML_AVAILABLE = False
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    lxml_etree = None
+
+
+# Balises WordprocessingML utiles à l'extraction DOCX
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = f'{_W_NS}p'
+_W_T = f'{_W_NS}t'
+_W_TAB = f'{_W_NS}tab'
+_W_BR = f'{_W_NS}br'
+_W_CR = f'{_W_NS}cr'
+_A_BLIP = '{http://schemas.openxmlformats.org/drawingml/2006/main}blip'
+_R_EMBED = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+
+# Balises du contenu ODT (content.xml)
+_TEXT_NS = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+_TEXT_P = f'{_TEXT_NS}p'
+_TEXT_H = f'{_TEXT_NS}h'
+# Schéma des images intégrées, fournies au QTextDocument comme ressources
+_IMAGE_SCHEME = 'memimg'
+
+_ODT_ERRORS = (KeyError, ET.ParseError) + ((lxml_etree.XMLSyntaxError,) if LXML_AVAILABLE else ())
+
+# Classification des lignes pour create_html_with_images, en une seule passe:
+# "[Image N]" (produit par l'extraction DOCX), titre markdown, ligne vide, texte
+_LINE_RE = re.compile(
+    r'^(?:[^\S\n]*\[Image (\d+)\][^\S\n]*'
+    r'|(#{1,3}) (.*)'
+    r'|([^\S\n]*)'
+    r'|(.*))$',
+    re.MULTILINE
+)
+
+# Documents PyMuPDF ouverts par thread (un fitz.Document n'est pas thread-safe).
+# Seul le thread principal garde le sien (fermé par reset_page_cache); les
+# pré-chargements ouvrent et ferment le leur à chaque tâche
+_thread_docs = threading.local()
+
+
+def _open_pdf(file_path: str) -> fitz.Document:
+    """
+    Retourne le document ouvert par le thread courant (ouvert une seule fois)
+    
+    Un seul document est gardé par thread: ouvrir un autre fichier ferme le précédent
+    """
+    if getattr(_thread_docs, 'path', None) != file_path:
+        _close_pdf()
+        _thread_docs.doc = fitz.open(file_path)
+        _thread_docs.path = file_path
+    return _thread_docs.doc
+
+
+def _close_pdf() -> None:
+    """Ferme le document ouvert par le thread courant"""
+    doc = getattr(_thread_docs, 'doc', None)
+    if doc is not None:
+        doc.close()
+    _thread_docs.doc = None
+    _thread_docs.path = None
+
+
+def _to_qimage(pix: fitz.Pixmap) -> QImage:
+    """
+    Convertit un pixmap PyMuPDF en QImage sans passer par un format intermédiaire
+    
+    Les pixels bruts (samples) sont lus directement puis copiés, car le
+    tampon de PyMuPDF est libéré avec le pixmap
+    """
+    fmt = QImage.Format.Format_RGBA8888 if pix.alpha else QImage.Format.Format_RGB888
+    return QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt).copy()
+
+
+def _render_pdf_page(doc: fitz.Document, page_num: int, zoom: float,
+                     stop_event: threading.Event) -> Tuple[int, Optional[QImage]]:
+    """
+    Rend une page PDF (PyMuPDF libère le GIL pendant le rendu)
+    
+    Args:
+        doc: Document ouvert par le thread appelant
+        page_num: Index de la page (0-based)
+        zoom: Facteur de rendu
+        stop_event: Annulation coopérative
+    
+    Returns:
+        Tuple: (index de page, image ou None si annulé)
+    """
+    if stop_event.is_set():
+        return page_num, None
+    page = doc.load_page(page_num)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    return page_num, _to_qimage(pix)
+
+
+def _render_pdf_tile(file_path: str, page_num: int, scale: float, tile: QRect) -> QImage:
+    """
+    Rend une seule zone (tuile) d'une page PDF
+    
+    Args:
+        file_path: Chemin du PDF
+        page_num: Index de la page (0-based)
+        scale: Facteur de rendu
+        tile: Zone à rendre, en pixels à l'échelle demandée
+    
+    Returns:
+        QImage: Image de la tuile
+    """
+    page = _open_pdf(file_path).load_page(page_num)
+    origin = page.rect
+    clip = fitz.Rect(
+        origin.x0 + tile.left() / scale, origin.y0 + tile.top() / scale,
+        origin.x0 + (tile.left() + tile.width()) / scale, origin.y0 + (tile.top() + tile.height()) / scale
+    )
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), clip=clip)
+    return _to_qimage(pix)
+
+
+class PdfTileView(QWidget):
+    """
+    Page PDF affichée par tuiles de 512 px
+    
+    Utilisé pour les très grandes pages / forts zooms: seules les tuiles
+    visibles sont rendues (via le clip de PyMuPDF), au fil du défilement
+    """
+    
+    TILE_SIZE = 512
+    CACHE_SIZE = 64
+    
+    def __init__(self, file_path: str, page_num: int, scale: float):
+        super().__init__()
+        self.file_path = file_path
+        self.page_num = page_num
+        self.scale = scale
+        self._tiles: OrderedDict = OrderedDict()  # (colonne, ligne) -> QPixmap
+        
+        rect = _open_pdf(file_path).load_page(page_num).rect
+        self.setFixedSize(QSize(int(rect.width * scale), int(rect.height * scale)))
+    
+    def paintEvent(self, event):
+        """Dessine les tuiles qui recoupent la zone exposée"""
+        painter = QPainter(self)
+        exposed = event.rect()
+        size = self.TILE_SIZE
+        
+        first_col, last_col = exposed.left() // size, exposed.right() // size
+        first_row, last_row = exposed.top() // size, exposed.bottom() // size
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                tile = QRect(col * size, row * size, size, size).intersected(self.rect())
+                if tile.isEmpty():
+                    continue
+                painter.drawPixmap(tile.topLeft(), self.get_tile(col, row, tile))
+        painter.end()
+    
+    def get_tile(self, col: int, row: int, tile: QRect) -> QPixmap:
+        """Retourne une tuile, depuis le cache ou rendue à la demande"""
+        pixmap = self._tiles.get((col, row))
+        if pixmap is not None:
+            self._tiles.move_to_end((col, row))
+            return pixmap
+        
+        pixmap = QPixmap.fromImage(_render_pdf_tile(self.file_path, self.page_num, self.scale, tile))
+        self._tiles[(col, row)] = pixmap
+        # Évincer les tuiles les plus anciennes (hors écran)
+        while len(self._tiles) > self.CACHE_SIZE:
+            self._tiles.popitem(last=False)
+        return pixmap
+
+
+# Marques d'ordre des octets (BOM) et encodage correspondant
+_TEXT_BOMS = (
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+)
+
+
+# Au-delà de cette taille, un fichier texte est projeté en mémoire (mmap)
+_MMAP_TEXT_MIN_SIZE = 1 << 20
+
+
+def _decode_text(data) -> str:
+    """
+    Décode un fichier texte d'encodage inconnu
+    
+    Args:
+        data: Contenu brut du fichier (bytes ou mmap, décodé sans copie préalable)
+    
+    Returns:
+        str: Texte décodé (BOM, puis UTF-8, latin-1, cp1252)
+    """
+    head = bytes(data[:3])
+    for bom, encoding in _TEXT_BOMS:
+        if head.startswith(bom):
+            return str(data, encoding, 'replace')
+    
+    for encoding in ('utf-8', 'latin-1', 'cp1252'):
+        try:
+            return str(data, encoding)
+        except UnicodeDecodeError:
+            continue
+    
+    # Dernier recours
+    return str(data, 'utf-8', 'replace')
+
+
+# Résolution de rendu des pages PDF au zoom 100% (150%)
+PDF_RENDER_SCALE = 1.5
+
+
+class PageRenderSignals(QObject):
+    """Signaux des rendus de pages PDF faits dans le QThreadPool"""
+    
+    page_rendered = Signal(str, int, float, QImage)  # Fichier, index de page, zoom, image
+
 
 class DocumentLoadWorker(QThread):
     """Worker thread pour charger les documents en arrière-plan"""
     
     document_loaded = Signal(list)  # Liste des pages/contenu chargées
+    pages_ready = Signal(list)      # Pages PDF disponibles (émises par lots au fil de l'eau)
+    loading_finished = Signal(int)  # Fin du chargement PDF (nombre de pages)
     progress_updated = Signal(int)  # Progression du chargement
     error_occurred = Signal(str)    # Erreur lors du chargement
     
     def __init__(self, file_path: Path):
         super().__init__()
         self.file_path = file_path
-        self.should_stop = False
+        self._stop_event = threading.Event()
+    
+    @property
+    def should_stop(self) -> bool:
+        """True si l'arrêt a été demandé"""
+        return self._stop_event.is_set()
     
     def stop(self):
         """Arrête le chargement"""
-        self.should_stop = True
+        self._stop_event.set()
     
     def run(self):
         """Charge le document en arrière-plan"""
@@ -54,58 +286,58 @@ class DocumentLoadWorker(QThread):
             self.error_occurred.emit(f"Erreur lors du chargement: {str(e)}")
     
     def load_pdf(self):
-        """Charge un fichier PDF"""
-        doc = fitz.open(str(self.file_path))
-        pages = []
-        
-        total_pages = len(doc)
-        for page_num in range(total_pages):
-            if self.should_stop:
-                break
-                
-            page = doc.load_page(page_num)
-            
-            # Convertir en image avec une résolution raisonnable
-            matrix = fitz.Matrix(1.5, 1.5)  # Zoom 150%
-            pix = page.get_pixmap(matrix=matrix)
-            img_data = pix.tobytes("ppm")
-            
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_data)
-            
-            pages.append({
-                'type': 'image',
-                'content': pixmap,
-                'page_number': page_num + 1
-            })
-            
-            # Mettre à jour la progression
-            progress = int((page_num + 1) / total_pages * 100)
-            self.progress_updated.emit(progress)
+        """
+        Charge un fichier PDF
         
-        doc.close()
+        Les pages sont émises par lots d'environ 1% (pages_ready): la première
+        part seule, rendue ici pour être affichée dès sa réception, les autres
+        le seront à la demande par le viewer
+        """
+        file_path = str(self.file_path)
+        progress = 0
         
-        if not self.should_stop:
-            self.document_loaded.emit(pages)
+        with fitz.open(file_path) as doc:
+            total_pages = len(doc)
+            batch_size = max(1, total_pages // 100)
+            batch = []
+            for page_num in range(total_pages):
+                if self.should_stop:
+                    return
+                
+                page = {
+                    'type': 'pdf_page',
+                    'file_path': file_path,
+                    'page_number': page_num + 1
+                }
+                if page_num == 0:
+                    pix = doc.load_page(0).get_pixmap(
+                        matrix=fitz.Matrix(PDF_RENDER_SCALE, PDF_RENDER_SCALE))
+                    page['image'] = _to_qimage(pix)
+                batch.append(page)
+                
+                if page_num == 0 or len(batch) >= batch_size or page_num == total_pages - 1:
+                    self.pages_ready.emit(batch)
+                    batch = []
+                    
+                    # Mettre à jour la progression (seulement quand elle change)
+                    new_progress = int((page_num + 1) / total_pages * 100)
+                    if new_progress != progress:
+                        progress = new_progress
+                        self.progress_updated.emit(progress)
+        
+        self.loading_finished.emit(total_pages)
     
     def load_text(self):
         """Charge un fichier texte"""
-        try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Essayer avec d'autres encodages
-            try:
-                with open(self.file_path, 'r', encoding='latin-1') as f:
-                    content = f.read()
-            except Exception:
-                try:
-                    with open(self.file_path, 'r', encoding='cp1252') as f:
-                        content = f.read()
-                except Exception:
-                    # Dernier recours
-                    with open(self.file_path, 'rb') as f:
-                        content = f.read().decode('utf-8', errors='replace')
+        # Une seule lecture du fichier, les encodages sont essayés en mémoire
+        if self.file_path.stat().st_size > _MMAP_TEXT_MIN_SIZE:
+            # Gros fichier: décoder directement depuis le cache de pages,
+            # sans copie intermédiaire dans un objet bytes
+            with open(self.file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content = _decode_text(mapped)
+        else:
+            content = _decode_text(self.file_path.read_bytes())
         
         pages = [{
             'type': 'text',
@@ -123,15 +355,26 @@ class DocumentLoadWorker(QThread):
             try:
                 import mammoth
                 
+                # Images gardées en octets et référencées par index, plutôt
+                # qu'encodées en base64 dans le HTML
+                images = []
+                
+                def convert_image(image):
+                    with image.open() as image_bytes:
+                        images.append(image_bytes.read())
+                    return {'src': f'{_IMAGE_SCHEME}://{len(images) - 1}'}
+                
                 with open(self.file_path, 'rb') as docx_file:
-                    result = mammoth.convert_to_html(docx_file)
+                    result = mammoth.convert_to_html(
+                        docx_file, convert_image=mammoth.images.img_element(convert_image))
                     html_content = result.value
                     
                     # Convertir en HTML enrichi
                     pages = [{
                         'type': 'html',
                         'content': html_content,
-                        'page_number': 1
+                        'page_number': 1,
+                        'images': images
                     }]
                     
                     self.progress_updated.emit(100)
@@ -139,34 +382,10 @@ class DocumentLoadWorker(QThread):
                     return
                     
             except ImportError:
-                print("📝 Mammoth non disponible, utilisation de python-docx")
-            
-            # Méthode 2: python-docx standard
-            from docx import Document
-            doc = Document(str(self.file_path))
-            
-            # Extraire le contenu avec les images
-            content_parts = []
-            images = []
-            
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    content_parts.append(paragraph.text)
-                
-                # Chercher les images dans le paragraphe
-                for run in paragraph.runs:
-                    for inline_shape in run.element.xpath('.//a:blip'):
-                        try:
-                            # Extraire l'image
-                            image_id = inline_shape.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
-                            if image_id:
-                                image_part = doc.part.related_parts[image_id]
-                                image_data = image_part.blob
-                                images.append(image_data)
-                                content_parts.append(f"[Image {len(images)}]")
-                        except Exception as e:
-                            print(f"Erreur extraction image: {e}")
+                print("📝 Mammoth non disponible, lecture directe du DOCX")
             
+            # Méthode 2: lecture directe de l'archive (document.xml + word/media)
+            content_parts, images = self.extract_docx_content()
             content = "\n".join(content_parts)
             
             pages = [{
@@ -179,89 +398,111 @@ class DocumentLoadWorker(QThread):
             self.progress_updated.emit(100)
             self.document_loaded.emit(pages)
             
-        except ImportError:
-            self.error_occurred.emit("Module python-docx non installé")
         except Exception as e:
             self.error_occurred.emit(f"Erreur lors de la lecture du fichier Word: {str(e)}")
     
+    def extract_docx_content(self) -> Tuple[List[str], List[bytes]]:
+        """
+        Extrait le texte et les images d'un DOCX en une seule passe XML
+        
+        Returns:
+            Tuple: (paragraphes et marqueurs [Image N], données des images)
+        """
+        content_parts = []
+        images = []
+        
+        with zipfile.ZipFile(str(self.file_path), 'r') as docx_zip:
+            # Relations: identifiant -> fichier de l'archive (lues une seule fois)
+            targets = {}
+            rels = ET.fromstring(docx_zip.read('word/_rels/document.xml.rels'))
+            for rel in rels:
+                if rel.get('TargetMode') == 'External':
+                    continue
+                target = rel.get('Target', '')
+                if target.startswith('/'):
+                    target = target[1:]
+                else:
+                    target = posixpath.normpath(f"word/{target}")
+                targets[rel.get('Id')] = target
+            
+            media = {}  # Chaque média n'est lu qu'une fois dans l'archive
+            paragraphs = []  # Pile: paragraphes imbriqués (zones de texte)
+            
+            with docx_zip.open('word/document.xml') as document_xml:
+                for event, element in ET.iterparse(document_xml, events=('start', 'end')):
+                    tag = element.tag
+                    if event == 'start':
+                        if tag == _W_P:
+                            paragraphs.append(([], []))
+                        continue
+                    
+                    if not paragraphs:
+                        continue
+                    text_parts, image_parts = paragraphs[-1]
+                    
+                    if tag == _W_T:
+                        text_parts.append(element.text or '')
+                    elif tag == _W_TAB:
+                        text_parts.append('\t')
+                    elif tag in (_W_BR, _W_CR):
+                        text_parts.append('\n')
+                    elif tag == _A_BLIP:
+                        try:
+                            # Extraire l'image
+                            target = targets.get(element.get(_R_EMBED))
+                            if target:
+                                if target not in media:
+                                    media[target] = docx_zip.read(target)
+                                images.append(media[target])
+                                image_parts.append(f"[Image {len(images)}]")
+                        except Exception as e:
+                            print(f"Erreur extraction image: {e}")
+                    elif tag == _W_P:
+                        paragraphs.pop()
+                        text = ''.join(text_parts)
+                        if text.strip():
+                            content_parts.append(text)
+                        content_parts.extend(image_parts)
+                        element.clear()  # Libérer le sous-arbre déjà traité
+        
+        return content_parts, images
+    
     def load_odt(self):
         """Charge un fichier ODT (OpenDocument Text)"""
         try:
-            # Méthode 1: Utiliser odfpy
-            try:
-                from odf.opendocument import load
-                from odf.text import P
-                from odf.element import Text
-                
-                doc = load(str(self.file_path))
-                content_parts = []
-                
-                # Extraire tous les paragraphes
-                paragraphs = doc.getElementsByType(P)
-                for paragraph in paragraphs:
-                    text_content = ""
-                    for node in paragraph.childNodes:
-                        if node.nodeType == node.TEXT_NODE:
-                            text_content += str(node.data)
-                        elif hasattr(node, 'childNodes'):
-                            for child in node.childNodes:
-                                if child.nodeType == child.TEXT_NODE:
-                                    text_content += str(child.data)
-                    
-                    if text_content.strip():
-                        content_parts.append(text_content.strip())
-                
-                content = "\n".join(content_parts)
-                
-                pages = [{
-                    'type': 'text',
-                    'content': content,
-                    'page_number': 1
-                }]
-                
-                self.progress_updated.emit(100)
-                self.document_loaded.emit(pages)
-                return
-                
-            except ImportError:
-                print("📝 odfpy non disponible, tentative méthode alternative")
-            
-            # Méthode 2: Extraction XML manuelle
-            import zipfile
-            import xml.etree.ElementTree as ET
-            
             content_parts = []
             
             with zipfile.ZipFile(str(self.file_path), 'r') as odt_zip:
-                # Lire le contenu principal
+                # Lire le contenu principal en un seul passage, dans l'ordre du document
                 try:
-                    content_xml = odt_zip.read('content.xml')
-                    root = ET.fromstring(content_xml)
-                    
-                    # Définir les namespaces ODT
-                    namespaces = {
-                        'text': 'urn:oasis:names:tc:opendocument:xmlns:text:1.0',
-                        'office': 'urn:oasis:names:tc:opendocument:xmlns:office:1.0'
-                    }
-                    
-                    # Extraire les paragraphes
-                    for para in root.findall('.//text:p', namespaces):
-                        para_text = ''.join(para.itertext())
-                        if para_text.strip():
-                            content_parts.append(para_text.strip())
-                    
-                    # Extraire les titres
-                    for heading in root.findall('.//text:h', namespaces):
-                        heading_text = ''.join(heading.itertext())
-                        if heading_text.strip():
-                            content_parts.append(f"# {heading_text.strip()}")
+                    with odt_zip.open('content.xml') as content_xml:
+                        if LXML_AVAILABLE:
+                            # lxml ne remonte que les paragraphes et titres
+                            events = lxml_etree.iterparse(content_xml, events=('end',),
+                                                          tag=(_TEXT_P, _TEXT_H))
+                        else:
+                            events = ET.iterparse(content_xml, events=('end',))
+                        
+                        for _, elem in events:
+                            tag = elem.tag
+                            if tag != _TEXT_P and tag != _TEXT_H:
+                                continue
+                            
+                            # Paragraphe sans balise enfant: texte direct, sans itertext()
+                            if len(elem):
+                                para_text = ''.join(elem.itertext()).strip()
+                            else:
+                                para_text = (elem.text or '').strip()
+                            if para_text:
+                                content_parts.append(
+                                    f"# {para_text}" if tag == _TEXT_H else para_text
+                                )
+                            # Libérer le paragraphe traité
+                            elem.clear()
                     
-                except Exception as e:
+                except _ODT_ERRORS as e:
                     print(f"Erreur parsing XML ODT: {e}")
-                    # Fallback: extraction basique
                     content_parts.append("Fichier ODT détecté mais contenu non extractible")
-                    content_parts.append("Veuillez installer odfpy pour un meilleur support:")
-                    content_parts.append("pip install odfpy")
             
             content = "\n".join(content_parts) if content_parts else "Contenu ODT non extractible"
             
@@ -295,6 +536,17 @@ class DocumentLoadWorker(QThread):
         self.document_loaded.emit(pages)
 
 
+# Au-delà de cette surface (pixels), une page PDF zoomée est rendue par tuiles
+TILED_RENDER_MIN_PIXELS = 8_000_000
+
+# Délai sans nouveau clic avant d'appliquer le zoom (ms)
+ZOOM_DEBOUNCE_MS = 50
+
+# Au-delà de cette taille (caractères), le texte est affiché par morceaux
+STREAMED_TEXT_MIN_CHARS = 256 * 1024
+TEXT_CHUNK_CHARS = 64 * 1024
+
+
 class DocumentViewer(QWidget):
     """Widget pour afficher les documents"""
     
@@ -306,6 +558,33 @@ class DocumentViewer(QWidget):
         self.zoom_level = 1.0
         self.worker = None
         
+        # Pages PDF déjà rendues (LRU) et pré-chargement des pages voisines
+        self._page_cache: OrderedDict = OrderedDict()  # (index, zoom) -> QPixmap
+        self._page_cache_size = 5
+        self._prefetching = set()
+        self._render_stop = threading.Event()
+        # Pool propre au viewer: vidé à chaque changement de document
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(2)
+        self._render_signals = PageRenderSignals()
+        self._render_signals.page_rendered.connect(self.on_page_rendered)
+        
+        # Pixmaps déjà mis à l'échelle, par (page, zoom)
+        self._pixmap_cache: OrderedDict = OrderedDict()
+        self._pixmap_cache_size = 16
+        
+        # Ajout progressif des longs textes, un morceau par tour de boucle
+        self._text_stream = None  # (widget, texte, position)
+        self._text_stream_timer = QTimer(self)
+        self._text_stream_timer.setInterval(0)
+        self._text_stream_timer.timeout.connect(self.append_text_chunk)
+        
+        # Regroupe les clics de zoom rapprochés en un seul rendu
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(ZOOM_DEBOUNCE_MS)
+        self._zoom_timer.timeout.connect(self.display_current_page)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -330,6 +609,9 @@ class DocumentViewer(QWidget):
         self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.scroll_area)
         
+        # Widgets d'affichage réutilisés d'une page à l'autre
+        self.create_content_widgets()
+        
         # Message par défaut
         self.show_welcome_message()
     
@@ -382,6 +664,24 @@ class DocumentViewer(QWidget):
         
         parent_layout.addWidget(toolbar_frame)
     
+    def create_content_widgets(self):
+        """Crée les widgets d'affichage (image, texte, HTML), cachés par défaut"""
+        self._image_label = QLabel()
+        self._image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        self._text_edit = QPlainTextEdit()
+        self._text_edit.setReadOnly(True)
+        
+        self._html_edit = QTextEdit()
+        self._html_edit.setReadOnly(True)
+        
+        self._content_widgets = (self._image_label, self._text_edit, self._html_edit)
+        self._base_point_size = self._text_edit.font().pointSize()
+        
+        for widget in self._content_widgets:
+            widget.hide()
+            self.content_layout.addWidget(widget)
+    
     def show_welcome_message(self):
         """Affiche un message de bienvenue"""
         self.clear_content()
@@ -400,10 +700,37 @@ class DocumentViewer(QWidget):
     
     def clear_content(self):
         """Vide le contenu actuel"""
+        self.show_content_widget(None)
+    
+    def show_content_widget(self, widget: Optional[QWidget]):
+        """
+        Affiche un des widgets réutilisables et masque le reste du contenu
+        
+        Args:
+            widget: Widget à afficher (None pour tout masquer)
+        """
+        self.stop_text_stream()
+        
         for i in reversed(range(self.content_layout.count())):
             child = self.content_layout.itemAt(i).widget()
-            if child:
+            if child is None or child is widget:
+                continue
+            if child in self._content_widgets:
+                if not child.isHidden():
+                    child.hide()
+                    child.clear()  # Libérer le texte ou l'image précédente
+            else:
+                # Widgets ponctuels (message, vue par tuiles)
                 child.setParent(None)
+        
+        if widget is not None:
+            widget.show()
+    
+    def apply_zoom_font(self, widget: QWidget):
+        """Adapte la police d'un widget texte au zoom"""
+        font = widget.font()
+        font.setPointSize(int(self._base_point_size * self.zoom_level))
+        widget.setFont(font)
     
     def load_document(self, file_path: Path):
         """
@@ -422,6 +749,7 @@ class DocumentViewer(QWidget):
             self.worker.wait()
         
         # Réinitialiser l'état
+        self.reset_page_cache()
         self.current_document = file_path
         self.pages = []
         self.current_page = 0
@@ -434,6 +762,8 @@ class DocumentViewer(QWidget):
         # Démarrer le chargement en arrière-plan
         self.worker = DocumentLoadWorker(file_path)
         self.worker.document_loaded.connect(self.on_document_loaded)
+        self.worker.pages_ready.connect(self.on_pages_ready)
+        self.worker.loading_finished.connect(self.on_loading_finished)
         self.worker.progress_updated.connect(self.progress_bar.setValue)
         self.worker.error_occurred.connect(self.show_error)
         self.worker.start()
@@ -450,6 +780,31 @@ class DocumentViewer(QWidget):
         else:
             self.show_error("Aucun contenu trouvé dans le document")
     
+    def on_pages_ready(self, pages: List[dict]):
+        """Appelé pour chaque lot de pages PDF: la première est affichée sans attendre les autres"""
+        if self.sender() is not self.worker:
+            return  # Pages d'un chargement précédent, arrivées après l'annulation
+        
+        first_batch = not self.pages
+        for page in pages:
+            image = page.pop('image', None)
+            if image is not None:
+                self.cache_pdf_page((len(self.pages), 1.0), QPixmap.fromImage(image))
+            self.pages.append(page)
+        
+        if first_batch and self.pages:
+            self.current_page = 0
+            self.display_current_page()
+        self.update_navigation()
+    
+    def on_loading_finished(self, total_pages: int):
+        """Appelé quand toutes les pages PDF ont été reçues"""
+        if self.sender() is not self.worker:
+            return
+        self.progress_bar.hide()
+        if total_pages == 0:
+            self.show_error("Aucun contenu trouvé dans le document")
+    
     def update_navigation(self):
         """Met à jour les contrôles de navigation"""
         total_pages = len(self.pages)
@@ -473,128 +828,241 @@ class DocumentViewer(QWidget):
         if not self.pages or self.current_page >= len(self.pages):
             return
         
-        self.clear_content()
+        # Le rendu couvre aussi un éventuel zoom en attente
+        self._zoom_timer.stop()
         
         page_data = self.pages[self.current_page]
         page_type = page_data['type']
-        content = page_data['content']
+        content = page_data.get('content')
         
-        if page_type == 'image':
+        if page_type == 'pdf_page':
+            if self.needs_tiles(self.current_page):
+                self.display_pdf_tiles(self.current_page)
+            else:
+                # Page déjà rendue au zoom courant: pas de mise à l'échelle
+                self.display_image(self.get_pdf_page(self.current_page), scaled=True)
+            QTimer.singleShot(0, self.prefetch_neighbour_pages)
+        elif page_type == 'image':
             self.display_image(content)
         elif page_type == 'text':
             self.display_text(content, page_data.get('images', []))
         elif page_type == 'html':
-            self.display_html(content)
+            self.display_html(content, page_data.get('images', []))
+    
+    def needs_tiles(self, page_index: int) -> bool:
+        """True si la page zoomée est trop grande pour être rendue d'un bloc"""
+        rect = _open_pdf(self.pages[page_index]['file_path']).load_page(page_index).rect
+        scale = PDF_RENDER_SCALE * self.zoom_level
+        return rect.width * scale * rect.height * scale > TILED_RENDER_MIN_PIXELS
     
-    def display_image(self, pixmap: QPixmap):
-        """Affiche une image"""
-        label = QLabel()
+    def display_pdf_tiles(self, page_index: int):
+        """Affiche une page PDF par tuiles, rendues au zoom courant"""
+        self.clear_content()
+        tile_view = PdfTileView(self.pages[page_index]['file_path'], page_index,
+                                 PDF_RENDER_SCALE * self.zoom_level)
+        self.content_layout.addWidget(tile_view, alignment=Qt.AlignmentFlag.AlignCenter)
         
-        # Appliquer le zoom
-        if self.zoom_level != 1.0:
-            size = pixmap.size()
-            new_size = size * self.zoom_level
-            pixmap = pixmap.scaled(new_size, Qt.AspectRatioMode.KeepAspectRatio, 
-                                 Qt.TransformationMode.SmoothTransformation)
+        # Mettre à jour l'affichage du zoom
+        self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
+    
+    def page_cache_key(self, page_index: int) -> Tuple[int, float]:
+        """Clé de cache d'une page au zoom courant"""
+        return page_index, round(self.zoom_level, 2)
+    
+    def get_pdf_page(self, page_index: int) -> QPixmap:
+        """Retourne la page PDF rendue au zoom courant, depuis le cache ou à la demande"""
+        key = self.page_cache_key(page_index)
+        pixmap = self._page_cache.get(key)
+        if pixmap is not None:
+            self._page_cache.move_to_end(key)
+            return pixmap
         
-        label.setPixmap(pixmap)
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.content_layout.addWidget(label)
+        # Rastériser directement à la taille affichée
+        _, image = _render_pdf_page(_open_pdf(self.pages[page_index]['file_path']), page_index,
+                                    PDF_RENDER_SCALE * key[1], self._render_stop)
+        pixmap = QPixmap.fromImage(image)
+        self.cache_pdf_page(key, pixmap)
+        return pixmap
+    
+    def cache_pdf_page(self, key: Tuple[int, float], pixmap: QPixmap):
+        """Ajoute une page rendue au cache en évinçant la plus ancienne"""
+        self._page_cache[key] = pixmap
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > self._page_cache_size:
+            self._page_cache.popitem(last=False)
+    
+    def prefetch_neighbour_pages(self):
+        """Rend en arrière-plan les pages précédente et suivante"""
+        for page_index in (self.current_page + 1, self.current_page - 1):
+            key = self.page_cache_key(page_index)
+            if (0 <= page_index < len(self.pages)
+                    and self.pages[page_index]['type'] == 'pdf_page'
+                    and key not in self._page_cache
+                    and key not in self._prefetching
+                    and not self.needs_tiles(page_index)):
+                self._prefetching.add(key)
+                file_path = self.pages[page_index]['file_path']
+                stop_event = self._render_stop
+                signals = self._render_signals
+                
+                def render(file_path=file_path, page_index=page_index, zoom=key[1]):
+                    if stop_event.is_set():
+                        return
+                    # Document ouvert le temps de la tâche: aucun fichier ne
+                    # reste verrouillé (Windows) ni périmé dans le pool
+                    with fitz.open(file_path) as doc:
+                        _, image = _render_pdf_page(doc, page_index,
+                                                    PDF_RENDER_SCALE * zoom, stop_event)
+                    if image is not None and not stop_event.is_set():
+                        signals.page_rendered.emit(file_path, page_index, zoom, image)
+                
+                self._render_pool.start(render)
+    
+    def on_page_rendered(self, file_path: str, page_index: int, zoom: float, image: QImage):
+        """Reçoit une page pré-chargée (thread principal)"""
+        self._prefetching.discard((page_index, zoom))
+        if self.current_document is None or str(self.current_document) != file_path:
+            return
+        self.cache_pdf_page((page_index, zoom), QPixmap.fromImage(image))
+    
+    def reset_page_cache(self):
+        """Vide le cache de pages et annule les pré-chargements en cours"""
+        self._render_stop.set()
+        self._render_stop = threading.Event()
+        self._render_pool.clear()  # Tâches pas encore démarrées
+        self._page_cache.clear()
+        self._pixmap_cache.clear()
+        self._prefetching.clear()
+        _close_pdf()
+    
+    def display_image(self, pixmap: QPixmap, scaled: bool = False):
+        """
+        Affiche une image
+        
+        Args:
+            pixmap: Image à afficher
+            scaled: True si l'image est déjà à la taille du zoom courant
+        """
+        # Appliquer le zoom (résultat mis en cache par page et niveau de zoom)
+        if not scaled and self.zoom_level != 1.0:
+            key = (self.current_page, round(self.zoom_level, 2))
+            scaled = self._pixmap_cache.get(key)
+            if scaled is None:
+                # Lissage inutile en réduction, coûteux sur de grandes images
+                if self.zoom_level < 1.0:
+                    mode = Qt.TransformationMode.FastTransformation
+                else:
+                    mode = Qt.TransformationMode.SmoothTransformation
+                scaled = pixmap.scaled(pixmap.size() * self.zoom_level,
+                                       Qt.AspectRatioMode.KeepAspectRatio, mode)
+                self._pixmap_cache[key] = scaled
+                while len(self._pixmap_cache) > self._pixmap_cache_size:
+                    self._pixmap_cache.popitem(last=False)
+            else:
+                self._pixmap_cache.move_to_end(key)
+            pixmap = scaled
+        
+        self._image_label.setPixmap(pixmap)
+        self.show_content_widget(self._image_label)
         
         # Mettre à jour l'affichage du zoom
         self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
     
     def display_text(self, text: str, images: List = None):
         """Affiche du texte avec support des images intégrées"""
-        text_edit = QTextEdit()
-        text_edit.setReadOnly(True)
-        
-        # Adapter la police au zoom
-        font = text_edit.font()
-        font.setPointSize(int(font.pointSize() * self.zoom_level))
-        text_edit.setFont(font)
-        
         # Si le texte contient des références d'images et qu'on a des images
         if images and "[Image" in text:
             # Créer un document HTML avec les images
-            html_content = self.create_html_with_images(text, images)
-            text_edit.setHtml(html_content)
+            self.display_html(self.create_html_with_images(text, images), images)
+            return
+        
+        # Le texte brut passe par QPlainTextEdit, bien plus léger sur les gros fichiers
+        text_edit = self._text_edit
+        self.show_content_widget(text_edit)
+        self.apply_zoom_font(text_edit)
+        
+        if len(text) > STREAMED_TEXT_MIN_CHARS:
+            # Premier morceau tout de suite, le reste au fil de la boucle d'événements
+            text_edit.setPlainText(text[:TEXT_CHUNK_CHARS])
+            self._text_stream = (text_edit, text, TEXT_CHUNK_CHARS)
+            self._text_stream_timer.start()
         else:
             text_edit.setPlainText(text)
         
-        self.content_layout.addWidget(text_edit)
-        
         # Mettre à jour l'affichage du zoom
         self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
     
-    def display_html(self, html_content: str):
-        """Affiche du contenu HTML (pour DOCX avec mammoth)"""
-        text_edit = QTextEdit()
-        text_edit.setReadOnly(True)
+    def append_text_chunk(self):
+        """Ajoute le morceau suivant du texte en cours d'affichage"""
+        if self._text_stream is None:
+            self._text_stream_timer.stop()
+            return
         
-        # Adapter la police au zoom
-        font = text_edit.font()
-        font.setPointSize(int(font.pointSize() * self.zoom_level))
-        text_edit.setFont(font)
+        text_edit, text, position = self._text_stream
+        end = position + TEXT_CHUNK_CHARS
         
-        # Afficher le HTML
-        text_edit.setHtml(html_content)
+        # Insérer en fin de document sans déplacer la vue de l'utilisateur
+        cursor = QTextCursor(text_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text[position:end])
+        
+        if end >= len(text):
+            self.stop_text_stream()
+        else:
+            self._text_stream = (text_edit, text, end)
+    
+    def stop_text_stream(self):
+        """Interrompt l'ajout progressif du texte"""
+        self._text_stream_timer.stop()
+        self._text_stream = None
+    
+    def display_html(self, html_content: str, images: List = None):
+        """
+        Affiche du contenu HTML (pour DOCX avec mammoth)
+        
+        Args:
+            html_content: HTML à afficher
+            images: Images référencées par le HTML (memimg://<index>)
+        """
+        self.show_content_widget(self._html_edit)
+        self.apply_zoom_font(self._html_edit)
         
-        self.content_layout.addWidget(text_edit)
+        # Images fournies telles quelles au document, décodées par Qt à l'affichage
+        document = self._html_edit.document()
+        document.clear()
+        for index, image_data in enumerate(images or ()):
+            document.addResource(QTextDocument.ResourceType.ImageResource,
+                                 QUrl(f'{_IMAGE_SCHEME}://{index}'), QByteArray(image_data))
+        
+        # Afficher le HTML
+        self._html_edit.setHtml(html_content)
         
         # Mettre à jour l'affichage du zoom
         self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
     
     def create_html_with_images(self, text: str, images: List) -> str:
         """Crée du HTML avec les images intégrées"""
-        html_parts = ['<html><body style="font-family: Arial, sans-serif;">']
-        
-        # Traiter le texte ligne par ligne
-        lines = text.split('\n')
-        for line in lines:
-            if line.strip().startswith('[Image ') and line.strip().endswith(']'):
-                # Extraire le numéro d'image
-                try:
-                    import re
-                    match = re.search(r'\[Image (\d+)\]', line)
-                    if match:
-                        image_num = int(match.group(1)) - 1  # Index 0-based
-                        if 0 <= image_num < len(images):
-                            # Convertir l'image en base64 pour l'intégrer
-                            image_data = images[image_num]
-                            import base64
-                            b64_image = base64.b64encode(image_data).decode()
-                            
-                            # Déterminer le type MIME (supposer JPEG par défaut)
-                            mime_type = "image/jpeg"
-                            if image_data.startswith(b'\x89PNG'):
-                                mime_type = "image/png"
-                            elif image_data.startswith(b'GIF'):
-                                mime_type = "image/gif"
-                            
-                            html_parts.append(f'<img src="data:{mime_type};base64,{b64_image}" style="max-width: 100%; height: auto;" />')
-                        else:
-                            html_parts.append(f'<p><em>{line}</em></p>')
-                    else:
-                        html_parts.append(f'<p>{line}</p>')
-                except:
-                    html_parts.append(f'<p>{line}</p>')
-            else:
-                if line.strip():
-                    # Traitement basique du markdown
-                    if line.startswith('# '):
-                        html_parts.append(f'<h1>{line[2:]}</h1>')
-                    elif line.startswith('## '):
-                        html_parts.append(f'<h2>{line[3:]}</h2>')
-                    elif line.startswith('### '):
-                        html_parts.append(f'<h3>{line[4:]}</h3>')
-                    else:
-                        html_parts.append(f'<p>{line}</p>')
-                else:
-                    html_parts.append('<br/>')
+        def render_line(match) -> str:
+            image_num, level, heading, blank, line = match.groups()
+            if image_num is not None:
+                index = int(image_num) - 1  # Index 0-based
+                if 0 <= index < len(images):
+                    return self.image_tag(index)
+                return f'<p><em>{match.group(0)}</em></p>'
+            if level is not None:
+                # Traitement basique du markdown
+                return f'<h{len(level)}>{heading}</h{len(level)}>'
+            if blank is not None:
+                return '<br/>'
+            return f'<p>{line}</p>'
         
-        html_parts.append('</body></html>')
-        return ''.join(html_parts)
+        body = ''.join(map(render_line, _LINE_RE.finditer(text)))
+        return f'<html><body style="font-family: Arial, sans-serif;">{body}</body></html>'
+    
+    @staticmethod
+    def image_tag(index: int) -> str:
+        """Construit la balise <img> d'une image intégrée (ressource du document)"""
+        return f'<img src="{_IMAGE_SCHEME}://{index}" style="max-width: 100%; height: auto;" />'
     
     def show_error(self, message: str):
         """Affiche un message d'erreur"""
@@ -637,21 +1105,28 @@ class DocumentViewer(QWidget):
     def zoom_in(self):
         """Zoom avant"""
         self.zoom_level = min(self.zoom_level * 1.25, 5.0)
-        self.display_current_page()
+        self.schedule_zoom()
     
     def zoom_out(self):
         """Zoom arrière"""
         self.zoom_level = max(self.zoom_level / 1.25, 0.25)
-        self.display_current_page()
+        self.schedule_zoom()
     
     def fit_to_window(self):
         """Ajuste à la fenêtre"""
         self.zoom_level = 1.0
-        self.display_current_page()
+        self.schedule_zoom()
+    
+    def schedule_zoom(self):
+        """Met à jour le libellé tout de suite et diffère le rendu au zoom courant"""
+        self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
+        self._zoom_timer.start()
     
     def closeEvent(self, event):
         """Nettoyage lors de la fermeture"""
         if self.worker and self.worker.isRunning():
             self.worker.stop()
             self.worker.wait()
+        self.reset_page_cache()
+        self._render_pool.waitForDone()
         super().closeEvent(event)
\ No newline at end of file
@@ -0,0 +1,358 @@
+"""
+Modèle Qt de la bibliothèque (artistes > chansons > médias)
+"""
+
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex
+from pathlib import Path
+from bisect import bisect_right
+from typing import Any, List, Optional
+
+from ..models.library import Library
+from ..models.song import Song
+
+# Rôles lus par le filtre de recherche (texte vide hors artistes et chansons)
+SEARCH_ROLE = Qt.ItemDataRole.UserRole + 1   # Titre, artiste et style
+TITLE_ROLE = Qt.ItemDataRole.UserRole + 2
+ARTIST_ROLE = Qt.ItemDataRole.UserRole + 3
+STYLE_ROLE = Qt.ItemDataRole.UserRole + 4
+_FILTER_ROLES = frozenset((SEARCH_ROLE, TITLE_ROLE, ARTIST_ROLE, STYLE_ROLE))
+
+
+class _Node:
+    """Nœud de l'arbre: une ligne du modèle"""
+    
+    __slots__ = ('label', 'data', 'key', 'parent', 'row', 'children', 'loaded', 'expandable')
+    
+    def __init__(self, label: str, data: Any = None, key: Any = None,
+                 parent: Optional['_Node'] = None):
+        self.label = label      # Texte affiché
+        self.data = data        # Chanson, (type de média, fichier) ou None
+        self.key = key          # Nom de l'artiste pour les nœuds artiste
+        self.parent = parent
+        self.row = 0            # Position dans le parent
+        self.children: List['_Node'] = []
+        self.loaded = True      # False tant que les enfants d'une chanson ne sont pas créés
+        self.expandable = False # Chanson non chargée qui aura des enfants
+    
+    def add_child(self, child: '_Node') -> '_Node':
+        """Ajoute un enfant en fin de liste"""
+        return self.insert_child(len(self.children), child)
+    
+    def insert_child(self, row: int, child: '_Node') -> '_Node':
+        """Insère un enfant à une position donnée"""
+        child.parent = self
+        self.children.insert(row, child)
+        for position in range(row, len(self.children)):
+            self.children[position].row = position
+        return child
+    
+    def insert_children(self, row: int, children: List['_Node']):
+        """Insère plusieurs enfants à la suite (une seule renumérotation)"""
+        for child in children:
+            child.parent = self
+        self.children[row:row] = children
+        for position in range(row, len(self.children)):
+            self.children[position].row = position
+    
+    def remove_child(self, row: int):
+        """Retire l'enfant d'une position donnée"""
+        del self.children[row]
+        for position in range(row, len(self.children)):
+            self.children[position].row = position
+
+
+class LibraryModel(QAbstractItemModel):
+    """Modèle arborescent de la bibliothèque pour un QTreeView"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _Node("")
+        
+        # Accès direct aux nœuds pour les mises à jour incrémentales
+        self._artist_nodes = {}  # Artiste -> nœud
+        self._artist_keys = []   # Clés de tri des artistes, dans l'ordre des lignes
+        self._song_nodes = {}    # Chanson -> nœud
+    
+    # --- Construction ---
+    
+    def _reset_root(self):
+        """Vide le modèle (entre beginResetModel et endResetModel)"""
+        self._root = _Node("")
+        self._artist_nodes = {}
+        self._artist_keys = []
+        self._song_nodes = {}
+    
+    def set_library(self, library: Library):
+        """Reconstruit le modèle depuis la bibliothèque, groupée par artiste"""
+        self.beginResetModel()
+        self._reset_root()
+        
+        for entry in library.iter_sorted_index('artist'):
+            artist = entry.artist or "Artiste inconnu"
+            
+            # Créer le nœud artiste si nécessaire
+            artist_node = self._artist_nodes.get(artist)
+            if artist_node is None:
+                artist_node = self._root.add_child(_Node(f"🎤 {artist}", key=artist))
+                self._artist_nodes[artist] = artist_node
+                self._artist_keys.append(entry.artist.casefold())
+            
+            self._add_song_node(artist_node, entry.song, entry.song.cached_labels.title,
+                                entry.has_docs or entry.has_audio or entry.has_video
+                                or entry.has_links or entry.has_meta)
+        
+        self.endResetModel()
+    
+    def _add_song_node(self, artist_node: _Node, song: Song, label: str,
+                       expandable: bool) -> _Node:
+        """Ajoute le nœud d'une chanson sous son artiste (enfants créés à l'ouverture)"""
+        song_node = artist_node.add_child(_Node(label, song))
+        song_node.loaded = False
+        song_node.expandable = expandable
+        self._song_nodes[song] = song_node
+        return song_node
+    
+    # --- Mises à jour incrémentales ---
+    
+    def add_song(self, song: Song):
+        """Insère une chanson (et son artiste si besoin) sans reconstruire le modèle"""
+        artist = song.artist or "Artiste inconnu"
+        artist_node = self._artist_nodes.get(artist)
+        
+        if artist_node is None:
+            # Nouvel artiste, inséré à sa place dans l'ordre alphabétique
+            key = song.artist.casefold()
+            row = bisect_right(self._artist_keys, key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            artist_node = self._root.insert_child(row, _Node(f"🎤 {artist}", key=artist))
+            self._artist_nodes[artist] = artist_node
+            self._artist_keys.insert(row, key)
+            self.endInsertRows()
+        
+        row = len(artist_node.children)
+        self.beginInsertRows(self._index_of(artist_node), row, row)
+        self._add_song_node(artist_node, song, song.cached_labels.title,
+                                self._song_has_children(song))
+        self.endInsertRows()
+    
+    def add_songs(self, songs: List[Song]):
+        """
+        Insère plusieurs chansons, avec une seule notification par plage de
+        lignes contiguës (artistes voisins, chansons d'un même artiste)
+        
+        Args:
+            songs: Chansons à insérer
+        """
+        by_artist = {}
+        for song in songs:
+            by_artist.setdefault(song.artist or "Artiste inconnu", []).append(song)
+        
+        # Nouveaux artistes, regroupés par position d'insertion dans l'ordre actuel
+        new_artists = sorted((artist_songs[0].artist.casefold(), artist)
+                             for artist, artist_songs in by_artist.items()
+                             if artist not in self._artist_nodes)
+        runs = {}
+        for key, artist in new_artists:
+            runs.setdefault(bisect_right(self._artist_keys, key), []).append((key, artist))
+        
+        inserted = 0
+        for position, run in runs.items():
+            row = position + inserted
+            nodes = [_Node(f"🎤 {artist}", key=artist) for _, artist in run]
+            self.beginInsertRows(QModelIndex(), row, row + len(run) - 1)
+            self._root.insert_children(row, nodes)
+            self._artist_keys[row:row] = [key for key, _ in run]
+            for node in nodes:
+                self._artist_nodes[node.key] = node
+            self.endInsertRows()
+            inserted += len(run)
+        
+        # Chansons ajoutées à la fin de chaque artiste
+        for artist, artist_songs in by_artist.items():
+            artist_node = self._artist_nodes[artist]
+            row = len(artist_node.children)
+            self.beginInsertRows(self._index_of(artist_node), row, row + len(artist_songs) - 1)
+            for song in artist_songs:
+                self._add_song_node(artist_node, song, song.cached_labels.title,
+                                self._song_has_children(song))
+            self.endInsertRows()
+    
+    def remove_song(self, song: Song):
+        """Retire une chanson (et son artiste s'il n'a plus de chanson)"""
+        song_node = self._song_nodes.pop(song, None)
+        if song_node is None:
+            return
+        
+        artist_node = song_node.parent
+        self.beginRemoveRows(self._index_of(artist_node), song_node.row, song_node.row)
+        artist_node.remove_child(song_node.row)
+        self.endRemoveRows()
+        
+        if not artist_node.children:
+            row = artist_node.row
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._root.remove_child(row)
+            del self._artist_keys[row]
+            del self._artist_nodes[artist_node.key]
+            self.endRemoveRows()
+    
+    def update_song(self, song: Song):
+        """Replace une chanson modifiée (l'artiste ou le titre ont pu changer)"""
+        self.remove_song(song)
+        self.add_song(song)
+    
+    def apply_library_event(self, event_type: str, song: Optional[Song]) -> bool:
+        """
+        Applique un changement de la bibliothèque sans reconstruction
+        
+        Args:
+            event_type: Type d'événement de la bibliothèque
+            song: Chanson concernée
+        
+        Returns:
+            bool: False si le modèle doit être reconstruit
+        """
+        if song is None:
+            return False
+        
+        if event_type == "song_added":
+            self.add_song(song)
+        elif event_type == "song_removed":
+            self.remove_song(song)
+        elif event_type == "song_updated":
+            self.update_song(song)
+        else:
+            return False
+        return True
+    
+    @staticmethod
+    def _song_has_children(song: Song) -> bool:
+        """True si la chanson aura des enfants (médias, liens ou métadonnées)"""
+        return bool(song.documents or song.audios or song.videos or song.links
+                    or song.tempo or song.style or song.metadata)
+    
+    @staticmethod
+    def _build_song_children(song_node: _Node, song: Song):
+        """Ajoute les groupes de médias et les métadonnées d'une chanson"""
+        for label, media_type, files in (("📄 Documents", "document", song.documents),
+                                         ("🎵 Audio", "audio", song.audios),
+                                         ("🎬 Vidéos", "video", song.videos)):
+            if files:
+                group_node = song_node.add_child(_Node(label))
+                for file in files:
+                    file_path = Path(file)
+                    group_node.add_child(_Node(file_path.name, (media_type, file_path)))
+        
+        if song.links:
+            link_node = song_node.add_child(_Node("🎬 Liens"))
+            for lien in song.links:
+                link_node.add_child(_Node(lien, ("link", lien)))
+        
+        # Métadonnées (libellés en cache dans la chanson)
+        if song.tempo or song.style or song.metadata:
+            meta_node = song_node.add_child(_Node("⚙️ Métadonnées"))
+            labels = song.cached_labels
+            
+            for line in (labels.tempo_line, labels.style_line):
+                if line:
+                    meta_node.add_child(_Node(line))
+            
+            for line in labels.metadata_lines:
+                meta_node.add_child(_Node(line))
+    
+    @staticmethod
+    def _filter_text(node: _Node, role: int) -> str:
+        """Texte d'un nœud pour un rôle de filtrage"""
+        song = node.data
+        if isinstance(song, Song):
+            if role == SEARCH_ROLE:
+                return song.search_blob
+            if role == TITLE_ROLE:
+                return song.title
+            if role == ARTIST_ROLE:
+                return song.artist
+            return song.style
+        
+        # Un artiste trouvé garde toutes ses chansons (acceptation des enfants)
+        if node.key is not None and role in (SEARCH_ROLE, ARTIST_ROLE):
+            return node.key
+        return ""
+    
+    # --- Interface QAbstractItemModel ---
+    
+    def _index_of(self, node: _Node) -> QModelIndex:
+        """Index d'un nœud (invalide pour la racine)"""
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+    
+    def _node(self, index: QModelIndex) -> _Node:
+        """Nœud correspondant à un index (racine si invalide)"""
+        return index.internalPointer() if index.isValid() else self._root
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        children = self._node(parent).children
+        if column != 0 or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+    
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+    
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        if not node.loaded:
+            # Garder la flèche d'ouverture sans construire les enfants
+            return node.expandable
+        return bool(node.children)
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return parent.isValid() and not self._node(parent).loaded
+    
+    def fetchMore(self, parent: QModelIndex):
+        """Crée les enfants d'une chanson à sa première ouverture"""
+        node = self._node(parent)
+        if node.loaded:
+            return
+        node.loaded = True
+        
+        pending = _Node("")
+        self._build_song_children(pending, node.data)
+        if not pending.children:
+            return
+        
+        self.beginInsertRows(parent, 0, len(pending.children) - 1)
+        node.insert_children(0, pending.children)
+        self.endInsertRows()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return index.internalPointer().label
+        if role == Qt.ItemDataRole.UserRole:
+            return index.internalPointer().data
+        if role in _FILTER_ROLES:
+            return self._filter_text(index.internalPointer(), role)
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return "Bibliothèque"
+        return None
+
+
@@ -3,98 +3,286 @@ Fenêtre principale de l'application MusicPartMate (PySide6)
 """
 
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QToolBar, QMenuBar, QStatusBar,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
+    QTreeView, QToolBar, QMenuBar, QStatusBar,
     QMessageBox, QFileDialog, QInputDialog, QProgressDialog,
     QLabel, QLineEdit, QPushButton, QComboBox, QFrame
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QObject, QThread, QRunnable, QThreadPool, QElapsedTimer, QModelIndex,
+    QSortFilterProxyModel, QRegularExpression
+)
 from PySide6.QtGui import QAction, QIcon, QKeySequence
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Final, Optional, List, Tuple
+from functools import lru_cache
 import json
-import time
+import logging
+import os
 
 from ..models.song import Song, create_song_from_folder
 from ..models.library import Library, LibraryConfig
 from ..utils.config import config_manager, get_supported_formats
-from ..utils.file_utils import scan_folder_for_media, get_folder_statistics
+from ..utils.file_utils import build_extension_map, find_song_folders, get_folder_statistics
 from .document_viewer import DocumentViewer
+from .library_model import LibraryModel, SEARCH_ROLE, TITLE_ROLE, ARTIST_ROLE, STYLE_ROLE
 from .media_player import MediaPlayer
 from .song_dialog import SongDialog
 
+logger = logging.getLogger(__name__)
+
+# Texte de la boîte "À propos" (statique)
+_ABOUT_HTML: Final[str] = """
+        <h2>🎵 MusicPartMate</h2>
+        <p><b>Version:</b> 1.0.0</p>
+        <p><b>Description:</b> Gestionnaire de partitions musicales</p>
+        
+        <h3>Fonctionnalités:</h3>
+        <ul>
+        <li>📄 Lecture de documents (PDF, TXT, DOC, images)</li>
+        <li>🎵 Lecture audio et vidéo</li>
+        <li>📚 Gestion de bibliothèque</li>
+        <li>🔍 Recherche avancée</li>
+        <li>📁 Import/Export</li>
+        </ul>
+        
+        <p><b>Formats supportés:</b></p>
+        <ul>
+        <li>Documents: PDF, TXT, DOC, DOCX, ODT, PNG, JPG</li>
+        <li>Audio: MP3, WAV, FLAC, OGG, M4A</li>
+        <li>Vidéo: MP4, AVI, MOV, MKV</li>
+        </ul>
+        """
+
 
-class ImportWorker(QThread):
-    """Worker thread pour l'import de chansons en arrière-plan"""
+@lru_cache(maxsize=1)
+def _format_stats(stats_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Message des statistiques, recalculé seulement si elles ont changé
     
-    progress_updated = Signal(int, str)  # Progression, message
-    song_imported = Signal(object)       # Chanson importée
-    import_finished = Signal(int, int)   # Succès, erreurs
+    Args:
+        stats_items: Éléments de Library.get_statistics() (hachables)
     
-    def __init__(self, folder_paths: List[Path]):
+    Returns:
+        str: Texte de la boîte de statistiques
+    """
+    stats = dict(stats_items)
+    
+    parts = [
+        "📊 Statistiques de la bibliothèque",
+        "",
+        f"Chansons: {stats['total_songs']}",
+        f"Artistes: {stats['total_artists']}",
+        f"Styles: {stats['total_styles']}",
+        "",
+        f"Avec documents: {stats['songs_with_documents']}",
+        f"Avec audio: {stats['songs_with_audio']}",
+        f"Avec vidéo: {stats['songs_with_video']}",
+    ]
+    
+    if stats['most_common_style']:
+        parts += ["", f"Style le plus fréquent: {stats['most_common_style']}"]
+    
+    if stats['most_prolific_artist']:
+        parts.append(f"Artiste le plus prolifique: {stats['most_prolific_artist']}")
+    
+    return "\n".join(parts)
+
+
+class ImportSignals(QObject):
+    """Signaux des tâches d'import exécutées dans le QThreadPool"""
+    
+    # Dernier dossier, chansons importées, dossiers traités, erreurs
+    chunk_done = Signal(object, list, int, int)
+
+
+class SongImportTask(QRunnable):
+    """Tâche d'import d'un lot de dossiers de chansons"""
+    
+    def __init__(self, folder_paths: List[Path], worker: 'ImportWorker'):
         super().__init__()
         self.folder_paths = folder_paths
-        self.should_stop = False
-    
-    def stop(self):
-        """Arrête l'import"""
-        self.should_stop = True
+        self.worker = worker
+        self.signals = worker.signals
     
     def run(self):
-        """Effectue l'import en arrière-plan"""
-        success_count = 0
+        """Crée les chansons du lot (thread du pool), résultat émis en une fois"""
+        songs = []
         error_count = 0
-        total_folders = len(self.folder_paths)
-        
-        for i, folder_path in enumerate(self.folder_paths):
-            if self.should_stop:
+        for folder_path in self.folder_paths:
+            if self.worker.should_stop:
                 break
-            
             try:
-                # Mettre à jour la progression
-                self.progress_updated.emit(
-                    int((i / total_folders) * 100),
-                    f"Import: {folder_path.name}"
-                )
-                
-                # Créer la chanson depuis le dossier
-                song = create_song_from_folder(folder_path)
-                
+                # Parallélisme porté par le pool d'import: lecture du dossier sur place
+                song = create_song_from_folder(folder_path, parallel=False)
                 if song.is_valid():
-                    self.song_imported.emit(song)
-                    success_count += 1
+                    songs.append(song)
                 else:
                     error_count += 1
-                
-                # Petite pause pour éviter de bloquer l'interface
-                time.sleep(0.1)
-                
-            except Exception as e:
-                print(f"Erreur lors de l'import de {folder_path}: {e}")
+            except Exception:
+                logger.exception("Erreur lors de l'import de %s", folder_path)
                 error_count += 1
         
-        self.import_finished.emit(success_count, error_count)
+        self.signals.chunk_done.emit(self.folder_paths[-1], songs,
+                                     len(self.folder_paths), error_count)
 
 
-class LibraryTreeWidget(QTreeWidget):
-    """Widget arbre personnalisé pour la bibliothèque"""
+class ImportWorker(QObject):
+    """Coordonne l'import de chansons en parallèle dans un QThreadPool"""
+    
+    progress_updated = Signal(int, str)  # Progression, message
+    songs_imported = Signal(list)        # Lot de chansons importées
+    import_finished = Signal(int, int)   # Succès, erreurs
+    
+    CHUNK_MAX = 25              # Dossiers par tâche au plus
+    PROGRESS_INTERVAL_MS = 50   # Délai minimum entre deux progressions
+    SONG_BATCH = 64             # Chansons transmises à l'interface par lot...
+    SONG_BATCH_MS = 100         # ... ou au moins toutes les 100 ms
+    
+    def __init__(self, folder_paths: List[Path]):
+        super().__init__()
+        self.folder_paths = folder_paths
+        self.should_stop = False
+        
+        self.success_count = 0
+        self.error_count = 0
+        self._remaining = 0
+        self._progress_timer = QElapsedTimer()
+        self._pending_songs: List[Song] = []
+        self._batch_timer = QElapsedTimer()
+        
+        # Pool dédié: les dossiers sont lus en parallèle (E/S, GIL relâché)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(min(16, (os.cpu_count() or 1) * 2))
+        
+        # Résultats reçus dans le thread de l'interface
+        self.signals = ImportSignals(self)
+        self.signals.chunk_done.connect(self.on_chunk_done)
+    
+    def start(self):
+        """Lance l'import de tous les dossiers, par lots"""
+        total_folders = len(self.folder_paths)
+        self._remaining = total_folders
+        if not total_folders:
+            self.import_finished.emit(0, 0)
+            return
+        
+        # Lots assez gros pour limiter les signaux, assez nombreux pour occuper le pool
+        tasks_wanted = self.pool.maxThreadCount() * 4
+        chunk_size = max(1, min(self.CHUNK_MAX, -(-total_folders // tasks_wanted)))
+        
+        self._progress_timer.start()
+        self._batch_timer.start()
+        for i in range(0, total_folders, chunk_size):
+            self.pool.start(SongImportTask(self.folder_paths[i:i + chunk_size], self))
+    
+    def stop(self):
+        """Arrête l'import (les dossiers pas encore traités sont ignorés)"""
+        self.should_stop = True
+    
+    def isRunning(self) -> bool:
+        """True tant que des dossiers restent à traiter"""
+        return self._remaining > 0
+    
+    def wait(self):
+        """Attend la fin des tâches en cours"""
+        self.pool.waitForDone()
+    
+    def on_chunk_done(self, folder_path: Path, songs: List[Song], folder_count: int, error_count: int):
+        """Reçoit le résultat d'un lot (thread de l'interface)"""
+        self._remaining -= folder_count
+        self.success_count += len(songs)
+        self.error_count += error_count
+        
+        # Chansons regroupées avant d'être transmises (par 64 ou toutes les 100 ms)
+        self._pending_songs.extend(songs)
+        if self._pending_songs and (self._remaining == 0
+                                    or len(self._pending_songs) >= self.SONG_BATCH
+                                    or self._batch_timer.elapsed() >= self.SONG_BATCH_MS):
+            self._batch_timer.restart()
+            batch, self._pending_songs = self._pending_songs, []
+            self.songs_imported.emit(batch)
+        
+        # Progression limitée à une mise à jour toutes les 50 ms (la dernière passe toujours)
+        if self._remaining == 0 or self._progress_timer.elapsed() >= self.PROGRESS_INTERVAL_MS:
+            self._progress_timer.restart()
+            total_folders = len(self.folder_paths)
+            self.progress_updated.emit(
+                int((total_folders - self._remaining) / total_folders * 100),
+                f"Import: {folder_path.name}"
+            )
+        
+        if self._remaining == 0:
+            self.import_finished.emit(self.success_count, self.error_count)
+
+
+class ExportWorker(QThread):
+    """Exporte la bibliothèque en arrière-plan"""
+    
+    progress_updated = Signal(int, str)      # Progression, message
+    export_finished = Signal(bool, bool)     # Succès, annulé
+    
+    PROGRESS_INTERVAL_MS = 50   # Délai minimum entre deux progressions
+    
+    def __init__(self, library: Library, export_path: Path, format_type: str):
+        super().__init__()
+        self.library = library
+        self.export_path = export_path
+        self.format_type = format_type
+        self.should_stop = False
+        self._progress_timer = QElapsedTimer()
+    
+    def run(self):
+        """Écrit l'export (thread du worker)"""
+        self._progress_timer.start()
+        success = self.library.export_library(self.export_path, self.format_type, self.on_progress)
+        self.export_finished.emit(success, self.should_stop)
+    
+    def on_progress(self, done: int, total: int) -> bool:
+        """Relaie la progression (limitée à une toutes les 50 ms); False pour annuler"""
+        if done == total or self._progress_timer.elapsed() >= self.PROGRESS_INTERVAL_MS:
+            self._progress_timer.restart()
+            self.progress_updated.emit(int(done / total * 100), f"Export: {done}/{total} chansons")
+        return not self.should_stop
+    
+    def stop(self):
+        """Demande l'arrêt de l'export (le fichier partiel est supprimé)"""
+        self.should_stop = True
+
+
+class LibraryTreeWidget(QTreeView):
+    """Vue arborescente de la bibliothèque (modèle LibraryModel)"""
     
     song_selected = Signal(object)          # Chanson sélectionnée
     media_selected = Signal(str, object)    # Type de média, fichier
     
+    # Rôle filtré selon le choix du SearchWidget
+    FILTER_ROLES = {"titre": TITLE_ROLE, "artiste": ARTIST_ROLE, "style": STYLE_ROLE}
+    
     def __init__(self):
         super().__init__()
-        self.setHeaderLabels(["Bibliothèque"])
+        self.library_model = LibraryModel(self)
+        
+        # Recherche par filtrage (côté Qt) au-dessus du modèle, sans reconstruction
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.library_model)
+        self.proxy.setRecursiveFilteringEnabled(True)
+        self.proxy.setAutoAcceptChildRows(True)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.proxy.setFilterRole(SEARCH_ROLE)
+        self.setModel(self.proxy)
+        self.proxy.rowsInserted.connect(self.on_rows_inserted)
         self.setAlternatingRowColors(True)
-        self.itemClicked.connect(self.on_item_clicked)
+        self.setUniformRowHeights(True)
+        self.clicked.connect(self.on_item_clicked)
         
         # Menu contextuel
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
     
-    def on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def on_item_clicked(self, index: QModelIndex):
         """Gère les clics sur les éléments"""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        data = index.data(Qt.ItemDataRole.UserRole)
         
         if isinstance(data, Song):
             # Chanson sélectionnée
@@ -106,8 +294,8 @@ class LibraryTreeWidget(QTreeWidget):
     
     def show_context_menu(self, position):
         """Affiche le menu contextuel"""
-        item = self.itemAt(position)
-        if not item:
+        index = self.indexAt(position)
+        if not index.isValid():
             return
         
         # TODO: Implémenter le menu contextuel
@@ -115,77 +303,42 @@ class LibraryTreeWidget(QTreeWidget):
     
     def load_library(self, library: Library):
         """Charge la bibliothèque dans l'arbre"""
-        self.clear()
+        # Un seul rafraîchissement de la vue pour tout le chargement
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self.library_model.set_library(library)
+            
+            # Artistes dépliés, en une seule passe
+            self.expandToDepth(0)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+    
+    def on_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        """Déplie les artistes ajoutés (ou réapparus avec le filtre)"""
+        if not parent.isValid():
+            for row in range(first, last + 1):
+                self.setExpanded(self.proxy.index(row, 0), True)
+    
+    def set_filter(self, query: str, filter_type: str = "tout") -> int:
+        """
+        Filtre l'arbre sur un texte (vide pour tout afficher)
         
-        # Grouper par artiste
-        artists_items = {}
+        Args:
+            query: Texte recherché
+            filter_type: Champ filtré ('tout', 'titre', 'artiste', 'style')
         
-        for song in library.get_songs_sorted('artist'):
-            artist = song.artist or "Artiste inconnu"
-            
-            # Créer l'élément artiste si nécessaire
-            if artist not in artists_items:
-                artist_item = QTreeWidgetItem([f"🎤 {artist}"])
-                artist_item.setExpanded(True)
-                self.addTopLevelItem(artist_item)
-                artists_items[artist] = artist_item
-            
-            # Ajouter la chanson
-            song_item = QTreeWidgetItem([f"🎵 {song.title}"])
-            song_item.setData(0, Qt.ItemDataRole.UserRole, song)
-            artists_items[artist].addChild(song_item)
-            
-            # Ajouter les médias
-            if song.documents:
-                docs_item = QTreeWidgetItem(["📄 Documents"])
-                for doc in song.documents:
-                    doc_item = QTreeWidgetItem([doc.name])
-                    doc_item.setData(0, Qt.ItemDataRole.UserRole, ("document", doc))
-                    docs_item.addChild(doc_item)
-                song_item.addChild(docs_item)
-            
-            if song.audios:
-                audio_item = QTreeWidgetItem(["🎵 Audio"])
-                for audio in song.audios:
-                    audio_child = QTreeWidgetItem([audio.name])
-                    audio_child.setData(0, Qt.ItemDataRole.UserRole, ("audio", audio))
-                    audio_item.addChild(audio_child)
-                song_item.addChild(audio_item)
-            
-            if song.videos:
-                video_item = QTreeWidgetItem(["🎬 Vidéos"])
-                for video in song.videos:
-                    video_child = QTreeWidgetItem([video.name])
-                    video_child.setData(0, Qt.ItemDataRole.UserRole, ("video", video))
-                    video_item.addChild(video_child)
-                song_item.addChild(video_item)
-
-            if song.links:
-                link_item = QTreeWidgetItem(["🎬 Liens"])
-                for lien in song.links:
-                    link_child = QTreeWidgetItem([lien])
-                    link_child.setData(0, Qt.ItemDataRole.UserRole, ("link", lien))
-                    link_item.addChild(link_child)
-                song_item.addChild(link_item)
-            
-            # Métadonnées
-            if song.tempo or song.style or song.metadata:
-                meta_item = QTreeWidgetItem(["⚙️ Métadonnées"])
-                
-                if song.tempo:
-                    meta_child = QTreeWidgetItem([f"Tempo: {song.tempo}"])
-                    meta_item.addChild(meta_child)
-                
-                if song.style:
-                    meta_child = QTreeWidgetItem([f"Style: {song.style}"])
-                    meta_item.addChild(meta_child)
-                
-                for key, value in song.metadata.items():
-                    if key != 'notes':  # Les notes ne s'affichent pas ici
-                        meta_child = QTreeWidgetItem([f"{key}: {value}"])
-                        meta_item.addChild(meta_child)
-                
-                song_item.addChild(meta_item)
+        Returns:
+            int: Nombre de chansons affichées
+        """
+        self.proxy.setFilterRole(self.FILTER_ROLES.get(filter_type, SEARCH_ROLE))
+        self.proxy.setFilterRegularExpression(QRegularExpression.escape(query))
+        self.expandToDepth(0)
+        
+        proxy = self.proxy
+        return sum(proxy.rowCount(proxy.index(row, 0)) for row in range(proxy.rowCount()))
+    
 
 
 class SearchWidget(QWidget):
@@ -196,6 +349,14 @@ class SearchWidget(QWidget):
     
     def __init__(self):
         super().__init__()
+        
+        # La recherche n'est lancée qu'après une pause dans la frappe
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(250)
+        self._debounce.timeout.connect(self._emit_search)
+        self._last_query = None  # (requête, filtre) de la dernière recherche émise
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -228,10 +389,19 @@ class SearchWidget(QWidget):
         self.setMinimumHeight(40)  # Hauteur minimum
     
     def on_search_changed(self):
-        """Appelé quand la recherche change"""
+        """Appelé quand la recherche change (relance le délai d'attente)"""
+        self._debounce.start()
+    
+    def _emit_search(self):
+        """Émet la recherche une fois la saisie terminée"""
         query = self.search_edit.text().strip()
         filter_type = self.filter_combo.currentText().lower()
         
+        # Rien à faire si la recherche n'a pas changé
+        if (query, filter_type) == self._last_query:
+            return
+        self._last_query = (query, filter_type)
+        
         if query:
             self.search_requested.emit(query, filter_type)
         else:
@@ -240,21 +410,48 @@ class SearchWidget(QWidget):
     def clear_search(self):
         """Efface la recherche"""
         self.search_edit.clear()
+        self._debounce.stop()
+        self._last_query = None
         self.search_cleared.emit()
 
 
 class MainWindow(QMainWindow):
     """Fenêtre principale de l'application"""
     
+    PROGRESS_INTERVAL_MS = 50  # Délai minimum entre deux rafraîchissements de la progression
+    
     def __init__(self):
         super().__init__()
         
+        # Configuration lue une fois (load_config la met à jour sur place)
+        self._config = config_manager.config
+        
         # Initialiser les composants
         self.library = Library(LibraryConfig(
             library_path=config_manager.get_library_path()
         ))
         self.current_song = None
         self.import_worker = None
+        self.export_worker = None
+        
+        # Formats supportés, lus une seule fois: table extension -> type et ensemble
+        self._formats = get_supported_formats()
+        self._ext_to_kind = build_extension_map(self._formats)
+        self._ext_set = frozenset(self._ext_to_kind)
+
+        self._tree_in_sync = False  # True si l'arbre reflète déjà le lot qui se termine
+        
+        # Raccourcis globaux: touche -> action (False si la touche n'est pas traitée)
+        self._key_handlers = {
+            Qt.Key.Key_F5: self.load_library,
+            Qt.Key.Key_Delete: self._delete_if_current,
+            Qt.Key.Key_F2: self._edit_if_current,
+        }
+        
+        # Rafraîchissements de la boîte de progression limités (un toutes les 50 ms)
+        self._progress_timer = QElapsedTimer()
+        self._progress_timer.start()
+        self._last_progress_ms = -self.PROGRESS_INTERVAL_MS
         
         # Configurer l'interface
         self.setup_ui()
@@ -268,7 +465,7 @@ class MainWindow(QMainWindow):
         
         # Configurer la fenêtre
         self.setWindowTitle("MusicPartMate")
-        config = config_manager.config
+        config = self._config
         #self.setGeometry(100, 100, config.window_width, config.window_height)
         self.showMaximized()
     
@@ -299,7 +496,7 @@ class MainWindow(QMainWindow):
         main_splitter.addWidget(right_panel)
         
         # PROPORTIONS MODIFIÉES : Panel gauche plus large pour la zone vidéo
-        config = config_manager.config
+        config = self._config
         left_width = 500  # AUGMENTÉ de 400 à 500 pour la zone vidéo
         right_width = config.window_width - left_width
         main_splitter.setSizes([left_width, right_width])
@@ -353,7 +550,7 @@ class MainWindow(QMainWindow):
         
         # left_splitter.setSizes([library_height, player_height])
 
-        self.adjust_layout_for_video()
+        self._apply_layout(True)
         
         return widget
     
@@ -493,7 +690,7 @@ class MainWindow(QMainWindow):
         
         # Recherche
         self.search_widget.search_requested.connect(self.on_search_requested)
-        self.search_widget.search_cleared.connect(self.load_library)
+        self.search_widget.search_cleared.connect(self.on_search_cleared)
         
         # Lecteur média
         self.media_player.media_loaded.connect(self.on_media_loaded)
@@ -507,31 +704,31 @@ class MainWindow(QMainWindow):
     def on_playback_started(self):
         """Appelé quand la lecture démarre - ajuste le layout si vidéo"""
         if hasattr(self.media_player, 'is_video') and self.media_player.is_video:
-            self.adjust_layout_for_video()
+            self._apply_layout(True)
     
     def on_playback_stopped(self):
         """Appelé quand la lecture s'arrête - remet le layout audio"""
-        self.adjust_layout_for_audio()
+        self._apply_layout(False)
     
-    def adjust_layout_for_video(self):
-        """Ajuste le layout pour l'affichage vidéo"""
-        if hasattr(self, 'left_splitter'):
+    def _apply_layout(self, is_video: bool):
+        """
+        Répartit la hauteur entre la bibliothèque et le lecteur
+        
+        Args:
+            is_video: True pour agrandir le lecteur (vidéo), False pour les proportions normales (audio)
+        """
+        if not hasattr(self, 'left_splitter'):
+            return
+        
+        config = self._config
+        if is_video:
             # Plus d'espace pour le lecteur vidéo
-            config = config_manager.config
-            video_library_height = max(150, config.library_height - 200)  # Réduire biblio
-            video_player_height = config.player_height + 200              # Agrandir lecteur
-            
-            self.left_splitter.setSizes([video_library_height, video_player_height])
-            print(f"📐 Layout vidéo: biblio={video_library_height}, lecteur={video_player_height}")
-    
-    def adjust_layout_for_audio(self):
-        self.adjust_layout_for_video()
-        """Ajuste le layout pour l'audio seulement"""
-        # if hasattr(self, 'left_splitter'):
-        #     # Revenir aux proportions normales
-        #     config = config_manager.config
-        #     self.left_splitter.setSizes([config.library_height, config.player_height])
-        #     print(f"📐 Layout audio: biblio={config.library_height}, lecteur={config.player_height}")
+            sizes = [max(150, config.library_height - 200), config.player_height + 200]
+        else:
+            sizes = [config.library_height, config.player_height]
+        self.left_splitter.setSizes(sizes)
+        logger.debug("📐 Layout %s: biblio=%d, lecteur=%d",
+                     "vidéo" if is_video else "audio", sizes[0], sizes[1])
     
     def load_library(self):
         """Charge la bibliothèque dans l'interface"""
@@ -550,7 +747,12 @@ class MainWindow(QMainWindow):
     
     def on_library_changed(self, event_type: str, song: Song = None):
         """Appelé quand la bibliothèque change"""
-        self.load_library()
+        # Mise à jour des seules lignes concernées; reconstruction complète
+        # pour un lot, sauf si l'arbre l'a déjà reçu (import)
+        if self._tree_in_sync or self.library_tree.library_model.apply_library_event(event_type, song):
+            self.update_status()
+        else:
+            self.load_library()
         
         if event_type == "song_added":
             self.status_label.setText(f"Chanson '{song.title}' ajoutée")
@@ -587,52 +789,31 @@ class MainWindow(QMainWindow):
             # Ajuster le layout en fonction du type de média
             if media_type == "video":
                 # Délai pour laisser le temps au lecteur de se configurer
-                QTimer.singleShot(500, self.adjust_layout_for_video)
+                QTimer.singleShot(500, lambda: self._apply_layout(True))
             else:
-                self.adjust_layout_for_audio()
+                self._apply_layout(False)
 
             self.status_label.setText(f"Média chargé: {file_path.name}")    
         elif media_type == "link":
-            print(f"Média chargé : ${media_type} : ${file_path}")
+            logger.debug("Média chargé: %s: %s", media_type, file_path)
             self.media_player.load_youtube_url(file_path, "Nirvana")
             self.status_label.setText(f"Média chargé: {file_path}")
     
     def on_search_requested(self, query: str, filter_type: str):
         """Appelé quand une recherche est demandée"""
-        if filter_type == "tout":
-            search_fields = ['title', 'artist', 'style']
-        elif filter_type == "titre":
-            search_fields = ['title']
-        elif filter_type == "artiste":
-            search_fields = ['artist']
-        elif filter_type == "style":
-            search_fields = ['style']
-        else:
-            search_fields = ['title', 'artist', 'style']
+        # Filtrage de l'arbre: les lignes non retenues sont masquées par le proxy
+        count = self.library_tree.set_filter(query, filter_type)
         
-        # Effectuer la recherche
-        results = self.library.search_songs(query, search_fields)
-        
-        # Afficher les résultats
-        self.library_tree.clear()
-        
-        if results:
-            # Créer un groupe "Résultats de recherche"
-            results_item = QTreeWidgetItem([f"🔍 Résultats ({len(results)})"])
-            results_item.setExpanded(True)
-            self.library_tree.addTopLevelItem(results_item)
-            
-            for song in results:
-                song_item = QTreeWidgetItem([f"🎵 {song.display_name}"])
-                song_item.setData(0, Qt.ItemDataRole.UserRole, song)
-                results_item.addChild(song_item)
-            
-            self.status_label.setText(f"{len(results)} résultat(s) trouvé(s) pour '{query}'")
+        if count:
+            self.status_label.setText(f"{count} résultat(s) trouvé(s) pour '{query}'")
         else:
-            no_results_item = QTreeWidgetItem([f"❌ Aucun résultat pour '{query}'"])
-            self.library_tree.addTopLevelItem(no_results_item)
             self.status_label.setText(f"Aucun résultat pour '{query}'")
     
+    def on_search_cleared(self):
+        """Retire le filtre: l'arbre complet réapparaît tel quel"""
+        self.library_tree.set_filter("")
+        self.update_status()
+    
     def on_media_loaded(self, filename: str):
         """Appelé quand un média est chargé dans le lecteur"""
         self.status_label.setText(f"Lecture: {filename}")
@@ -689,7 +870,7 @@ class MainWindow(QMainWindow):
             
             # Vider les viewers
             self.document_viewer.show_welcome_message()
-            self.media_player.clear_media()
+            self.media_player.clear_ui()
             
             self.status_label.setText(f"Chanson '{song_name}' supprimée")
     
@@ -705,24 +886,15 @@ class MainWindow(QMainWindow):
         
         base_folder = Path(folder)
         
-        # Chercher tous les sous-dossiers qui pourraient être des chansons
-        potential_song_folders = []
-        
-        # Option 1: Le dossier sélectionné contient directement des médias
-        formats = get_supported_formats()
-        media_files = scan_folder_for_media(base_folder, formats)
-        total_media = sum(len(files) for files in media_files.values())
-        
-        if total_media > 0:
-            potential_song_folders.append(base_folder)
-        
-        # Option 2: Les sous-dossiers contiennent des médias
-        for subfolder in base_folder.iterdir():
-            if subfolder.is_dir():
-                media_files = scan_folder_for_media(subfolder, formats)
-                total_media = sum(len(files) for files in media_files.values())
-                if total_media > 0:
-                    potential_song_folders.append(subfolder)
+        # Chercher le dossier et les sous-dossiers qui pourraient être des chansons,
+        # en un seul parcours de l'arborescence
+        self.status_label.setText("Recherche des dossiers de chansons...")
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            potential_song_folders = find_song_folders(base_folder, self._ext_set)
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.status_label.setText("Prêt")
         
         if not potential_song_folders:
             QMessageBox.information(
@@ -759,10 +931,13 @@ class MainWindow(QMainWindow):
         self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
         self.progress_dialog.show()
         
+        # Pas de notification par chanson: l'arbre reçoit les chansons par lots
+        self.library.begin_batch()
+        
         # Démarrer le worker
         self.import_worker = ImportWorker(folder_paths)
         self.import_worker.progress_updated.connect(self.on_import_progress)
-        self.import_worker.song_imported.connect(self.on_song_imported)
+        self.import_worker.songs_imported.connect(self.on_songs_imported)
         self.import_worker.import_finished.connect(self.on_import_finished)
         
         # Connecter l'annulation
@@ -771,22 +946,37 @@ class MainWindow(QMainWindow):
         self.import_worker.start()
     
     def on_import_progress(self, value: int, message: str):
-        """Met à jour la progression de l'import"""
-        self.progress_dialog.setValue(value)
+        """Met à jour la progression de l'import ou de l'export (au plus toutes les 50 ms, 100 % toujours)"""
+        now = self._progress_timer.elapsed()
+        if value < 100 and now - self._last_progress_ms < self.PROGRESS_INTERVAL_MS:
+            return
+        self._last_progress_ms = now
+        
+        # Texte d'abord: setValue repeint la boîte modale une seule fois pour les deux
         self.progress_dialog.setLabelText(message)
+        self.progress_dialog.setValue(value)
     
-    def on_song_imported(self, song: Song):
-        """Appelé quand une chanson est importée"""
-        self.library.add_song(song)
+    def on_songs_imported(self, songs: List[Song]):
+        """Appelé pour chaque lot de chansons importées"""
+        added = self.library.add_songs(songs)
+        if added:
+            self.library_tree.library_model.add_songs(added)
     
     def on_import_finished(self, success_count: int, error_count: int):
         """Appelé quand l'import est terminé"""
         self.progress_dialog.hide()
         
-        message = f"Import terminé:\n"
-        message += f"• {success_count} chanson(s) importée(s)\n"
+        # L'arbre est déjà à jour: pas de reconstruction en fin de lot
+        self._tree_in_sync = True
+        try:
+            self.library.end_batch()
+        finally:
+            self._tree_in_sync = False
+        
+        parts = ["Import terminé:", f"• {success_count} chanson(s) importée(s)"]
         if error_count > 0:
-            message += f"• {error_count} erreur(s)"
+            parts.append(f"• {error_count} erreur(s)")
+        message = "\n".join(parts)
         
         QMessageBox.information(self, "Import terminé", message)
         self.status_label.setText(f"Import: {success_count} chansons ajoutées")
@@ -834,9 +1024,27 @@ class MainWindow(QMainWindow):
         if not filename:
             return
         
-        # Effectuer l'export
+        # Effectuer l'export en arrière-plan
         export_path = Path(filename)
-        success = self.library.export_library(export_path, ext)
+        self.progress_dialog = QProgressDialog(
+            "Export en cours...",
+            "Annuler",
+            0, 100,
+            self
+        )
+        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.progress_dialog.show()
+        
+        self.export_worker = ExportWorker(self.library, export_path, ext)
+        self.export_worker.progress_updated.connect(self.on_import_progress)
+        self.export_worker.export_finished.connect(self.on_export_finished)
+        self.progress_dialog.canceled.connect(self.export_worker.stop)
+        self.export_worker.start()
+    
+    def on_export_finished(self, success: bool, cancelled: bool):
+        """Appelé quand l'export est terminé"""
+        self.progress_dialog.hide()
+        export_path = self.export_worker.export_path
         
         if success:
             QMessageBox.information(
@@ -845,6 +1053,8 @@ class MainWindow(QMainWindow):
                 f"Bibliothèque exportée vers:\n{export_path}"
             )
             self.status_label.setText(f"Bibliothèque exportée: {export_path.name}")
+        elif cancelled:
+            self.status_label.setText("Export annulé")
         else:
             QMessageBox.critical(
                 self,
@@ -855,48 +1065,11 @@ class MainWindow(QMainWindow):
     def show_statistics(self):
         """Affiche les statistiques de la bibliothèque"""
         stats = self.library.get_statistics()
-        
-        message = "📊 Statistiques de la bibliothèque\n\n"
-        message += f"Chansons: {stats['total_songs']}\n"
-        message += f"Artistes: {stats['total_artists']}\n"
-        message += f"Styles: {stats['total_styles']}\n\n"
-        message += f"Avec documents: {stats['songs_with_documents']}\n"
-        message += f"Avec audio: {stats['songs_with_audio']}\n"
-        message += f"Avec vidéo: {stats['songs_with_video']}\n"
-        
-        if stats['most_common_style']:
-            message += f"\nStyle le plus fréquent: {stats['most_common_style']}\n"
-        
-        if stats['most_prolific_artist']:
-            message += f"Artiste le plus prolifique: {stats['most_prolific_artist']}"
-        
-        QMessageBox.information(self, "Statistiques", message)
+        QMessageBox.information(self, "Statistiques", _format_stats(tuple(stats.items())))
     
     def show_about(self):
         """Affiche les informations sur l'application"""
-        message = """
-        <h2>🎵 MusicPartMate</h2>
-        <p><b>Version:</b> 1.0.0</p>
-        <p><b>Description:</b> Gestionnaire de partitions musicales</p>
-        
-        <h3>Fonctionnalités:</h3>
-        <ul>
-        <li>📄 Lecture de documents (PDF, TXT, DOC, images)</li>
-        <li>🎵 Lecture audio et vidéo</li>
-        <li>📚 Gestion de bibliothèque</li>
-        <li>🔍 Recherche avancée</li>
-        <li>📁 Import/Export</li>
-        </ul>
-        
-        <p><b>Formats supportés:</b></p>
-        <ul>
-        <li>Documents: PDF, TXT, DOC, DOCX, ODT, PNG, JPG</li>
-        <li>Audio: MP3, WAV, FLAC, OGG, M4A</li>
-        <li>Vidéo: MP4, AVI, MOV, MKV</li>
-        </ul>
-        """
-        
-        QMessageBox.about(self, "À propos de MusicPartMate", message)
+        QMessageBox.about(self, "À propos de MusicPartMate", _ABOUT_HTML)
     
     def closeEvent(self, event):
         """Gère la fermeture de l'application"""
@@ -904,19 +1077,35 @@ class MainWindow(QMainWindow):
         if self.import_worker and self.import_worker.isRunning():
             self.import_worker.stop()
             self.import_worker.wait()
+        if self.export_worker and self.export_worker.isRunning():
+            self.export_worker.stop()
+            self.export_worker.wait()
+        
+        # Libérer le pipeline multimédia
+        self.media_player.release_media()
         
-        # Sauvegarder la configuration
-        config_manager.save_config()
+        # Sauvegarder la configuration si elle a changé (sans fsync)
+        if config_manager.dirty:
+            config_manager.save_config()
         
         event.accept()
     
     def keyPressEvent(self, event):
         """Gère les raccourcis clavier globaux"""
-        if event.key() == Qt.Key.Key_F5:
-            self.load_library()
-        elif event.key() == Qt.Key.Key_Delete and self.current_song:
-            self.delete_current_song()
-        elif event.key() == Qt.Key.Key_F2 and self.current_song:
-            self.edit_current_song()
-        else:
-            super().keyPressEvent(event)
\ No newline at end of file
+        handler = self._key_handlers.get(event.key())
+        if handler is None or handler() is False:
+            super().keyPressEvent(event)
+    
+    def _delete_if_current(self) -> bool:
+        """Suppr: supprime la chanson courante (False s'il n'y en a pas)"""
+        if not self.current_song:
+            return False
+        self.delete_current_song()
+        return True
+    
+    def _edit_if_current(self) -> bool:
+        """F2: modifie la chanson courante (False s'il n'y en a pas)"""
+        if not self.current_song:
+            return False
+        self.edit_current_song()
+        return True
\ No newline at end of file
@@ -6,14 +6,21 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider, 
     QLabel, QFrame, QComboBox, QStyle, QMessageBox, QSplitter
 )
-from PySide6.QtCore import Qt, QUrl, QTimer, Signal
+from PySide6.QtCore import Qt, QUrl, QTimer, Signal, Slot
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+import heapq
+import itertools
+import time
 import webbrowser
+import shutil
 import subprocess
 import os
 import sys
 
+from ..utils.external_opener import ExternalOpener
+from ..utils.file_utils import VIDEO_EXTENSIONS
+
 # Import conditionnel du multimédia
 MULTIMEDIA_AVAILABLE = False
 try:
@@ -25,6 +32,29 @@ except ImportError as e:
     print(f"⚠️ Backend multimédia Qt non disponible: {e}")
     print("📽️ Le lecteur utilisera des applications externes")
 
+# Écart minimal (ms) entre deux mises à jour du slider de position
+SLIDER_UPDATE_MS = 250
+
+# Styles des labels selon leur propriété dynamique "kind", appliqués une fois:
+# changer d'état ne fait que re-polir le label, sans ré-analyser de CSS
+LABEL_STYLESHEET = """
+QLabel[kind="normal"] { color: #666; font-size: 12px; }
+QLabel[kind="error"] { color: red; font-size: 12px; }
+QLabel[kind="info"] { color: blue; font-size: 12px; }
+QLabel[kind="warning"] { color: orange; font-weight: bold; }
+QLabel[kind="help"] { color: #666; font-size: 11px; }
+QLabel[kind="placeholder"] { color: #999; font-size: 11px; }
+QLabel[kind="video_error"] { color: red; font-size: 10px; }
+"""
+
+# Types des slots branchés sur les énumérations de QMediaPlayer
+if MULTIMEDIA_AVAILABLE:
+    _PlaybackState = QMediaPlayer.PlaybackState
+    _MediaStatus = QMediaPlayer.MediaStatus
+    _MediaError = QMediaPlayer.Error
+else:
+    _PlaybackState = _MediaStatus = _MediaError = int
+
 
 class MediaPlayer(QWidget):
     """
@@ -40,35 +70,89 @@ class MediaPlayer(QWidget):
     position_changed = Signal(int)
     external_player_opened = Signal(str)
     
+    # Composants multimédia partagés par toutes les instances: un seul
+    # pipeline, une sortie audio et une surface vidéo pour l'application.
+    # L'instance qui charge un média en devient propriétaire.
+    _shared_player = None
+    _shared_audio = None
+    _shared_video = None
+    _active_owner = None
+    
     def __init__(self):
         super().__init__()
         self.current_media = None
+        self._current_media_str = None  # Chemin absolu, calculé au chargement
         self.is_video = False
         self.youtube_url = None
         
+        # Libellé du temps: durée formatée une fois, seconde affichée
+        self._duration_ms = 0
+        self._total_time_str = "00:00"
+        self._last_sec = -1
+        
+        # Slider de position: au plus 4 repeints par seconde
+        self._last_slider_update_ms = -SLIDER_UPDATE_MS
+        
+        # Processus d'ouverture externe (Windows: os.startfile suffit),
+        # démarré seulement à la première ouverture
+        self._opener = None
+        if not sys.platform.startswith('win'):
+            # Chemin absolu résolu une fois: pas de parcours du PATH à chaque ouverture
+            if sys.platform.startswith('darwin'):
+                self._opener_path = shutil.which('open') or '/usr/bin/open'
+            else:
+                self._opener_path = shutil.which('xdg-open') or '/usr/bin/xdg-open'
+            self._opener = ExternalOpener(self._opener_path)
+        
+        # Ajustement du splitter parent: ancêtre mémorisé, timer unique
+        self._parent_splitter = None
+        self._pending_layout_adjustment = None
+        self._layout_adjust_timer = QTimer(self)
+        self._layout_adjust_timer.setSingleShot(True)
+        self._layout_adjust_timer.setInterval(100)
+        self._layout_adjust_timer.timeout.connect(self._run_layout_adjustment)
+        
+        # Première image vidéo reçue depuis le chargement du média
+        self._first_frame_received = False
+        self._awaiting_first_frame = False
+        
+        # État du label d'info à restaurer après show_info
+        self._info_original_text = ""
+        self._info_original_kind = "normal"
+        self._info_restore_pending = False
+        
+        # Rappels différés: un seul timer, tas de (échéance ms, ordre, rappel)
+        self._due = []
+        self._due_order = itertools.count()
+        self._deferred_timer = QTimer(self)
+        self._deferred_timer.setSingleShot(True)
+        self._deferred_timer.timeout.connect(self._run_due_callbacks)
+        
+        self.setStyleSheet(LABEL_STYLESHEET)
+        
         if MULTIMEDIA_AVAILABLE:
             self.setup_full_player()
         else:
             self.setup_fallback_player()
+        
+        # Composants disponibles, figés une fois l'interface construite
+        self._has_player = MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player')
+        self._has_video_widget = self._has_player and hasattr(self, 'video_widget')
+        self._has_info_label = hasattr(self, 'info_label')
+        self._has_play_button = hasattr(self, 'play_button')
     
     def setup_full_player(self):
         """Configure le lecteur multimédia complet"""
         try:
-            # Initialiser les composants multimédia
-            self.media_player = QMediaPlayer()
-            self.audio_output = QAudioOutput()
-            self.media_player.setAudioOutput(self.audio_output)
-            
-            # Widget vidéo avec configuration spéciale
-            self.video_widget = QVideoWidget()
-            self.video_widget.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+            # Initialiser les composants multimédia (une fois pour toutes les instances)
+            if MediaPlayer._shared_player is None:
+                MediaPlayer._create_shared_components()
+            self.media_player = MediaPlayer._shared_player
+            self.audio_output = MediaPlayer._shared_audio
+            self.video_widget = MediaPlayer._shared_video
             
-            # Configuration pour améliorer la compatibilité vidéo
-            try:
-                self.video_widget.setAttribute(Qt.WidgetAttribute.WA_PaintOnScreen, False)
-                self.video_widget.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
-            except:
-                pass  # Certaines versions peuvent ne pas supporter ces attributs
+            # Sink du widget: signale chaque image effectivement reçue
+            self._video_sink = self.video_widget.videoSink()
             
             self.setup_full_ui()
             self.setup_connections()
@@ -80,6 +164,28 @@ class MediaPlayer(QWidget):
             MULTIMEDIA_AVAILABLE = False
             self.setup_fallback_player()
     
+    @staticmethod
+    def _create_shared_components():
+        """Crée le lecteur, la sortie audio et le widget vidéo partagés"""
+        player = QMediaPlayer()
+        audio_output = QAudioOutput()
+        player.setAudioOutput(audio_output)
+        
+        # Widget vidéo avec configuration spéciale
+        video_widget = QVideoWidget()
+        video_widget.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+        
+        # Configuration pour améliorer la compatibilité vidéo
+        try:
+            video_widget.setAttribute(Qt.WidgetAttribute.WA_PaintOnScreen, False)
+            video_widget.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        except:
+            pass  # Certaines versions peuvent ne pas supporter ces attributs
+        
+        MediaPlayer._shared_player = player
+        MediaPlayer._shared_audio = audio_output
+        MediaPlayer._shared_video = video_widget
+    
     def setup_fallback_player(self):
         """Configure le lecteur de fallback"""
         layout = QVBoxLayout(self)
@@ -90,11 +196,11 @@ class MediaPlayer(QWidget):
         info_layout = QVBoxLayout(info_frame)
         
         warning_label = QLabel("⚠️ Backend multimédia Qt non disponible")
-        warning_label.setStyleSheet("color: orange; font-weight: bold;")
+        warning_label.setProperty("kind", "warning")
         info_layout.addWidget(warning_label)
         
         help_label = QLabel("Les médias s'ouvriront dans des applications externes")
-        help_label.setStyleSheet("color: #666; font-size: 11px;")
+        help_label.setProperty("kind", "help")
         info_layout.addWidget(help_label)
         
         layout.addWidget(info_frame)
@@ -102,7 +208,8 @@ class MediaPlayer(QWidget):
         # Informations sur le média
         self.info_label = QLabel("🎵 Aucun média chargé")
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.info_label.setStyleSheet("color: #666; font-size: 12px; padding: 10px;")
+        self.info_label.setProperty("kind", "normal")
+        self.info_label.setContentsMargins(10, 10, 10, 10)
         layout.addWidget(self.info_label)
         
         # Contrôles
@@ -124,7 +231,7 @@ class MediaPlayer(QWidget):
         # Informations sur le média (toujours en haut)
         self.info_label = QLabel("🎵 Aucun média chargé")
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.info_label.setStyleSheet("color: #666; font-size: 12px;")
+        self.info_label.setProperty("kind", "normal")
         layout.addWidget(self.info_label)
         
         # Contrôles principaux (TOUJOURS VISIBLES)
@@ -146,15 +253,21 @@ class MediaPlayer(QWidget):
         # Contrôles secondaires (TOUJOURS VISIBLES)
         secondary_controls = QHBoxLayout()
         
+        # Icônes du style, récupérées une seule fois
+        style = self.style()
+        self._icon_play = style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay)
+        self._icon_pause = style.standardIcon(QStyle.StandardPixmap.SP_MediaPause)
+        self._icon_stop = style.standardIcon(QStyle.StandardPixmap.SP_MediaStop)
+        
         # Boutons de contrôle
         self.play_button = QPushButton()
-        self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.play_button.setIcon(self._icon_play)
         self.play_button.setEnabled(False)
         self.play_button.clicked.connect(self.play_pause)
         secondary_controls.addWidget(self.play_button)
         
         self.stop_button = QPushButton()
-        self.stop_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaStop))
+        self.stop_button.setIcon(self._icon_stop)
         self.stop_button.setEnabled(False)
         self.stop_button.clicked.connect(self.stop)
         secondary_controls.addWidget(self.stop_button)
@@ -197,16 +310,15 @@ class MediaPlayer(QWidget):
         self.video_frame.setMinimumHeight(250)  # Hauteur minimum
         video_layout = QVBoxLayout(self.video_frame)
         video_layout.setContentsMargins(2, 2, 2, 2)
+        self._video_layout = video_layout
         
         # Message pour la zone vidéo
         self.video_placeholder = QLabel("📺 Zone vidéo")
         self.video_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_placeholder.setStyleSheet("color: #999; font-size: 11px;")
+        self.video_placeholder.setProperty("kind", "placeholder")
         video_layout.addWidget(self.video_placeholder)
         
-        if hasattr(self, 'video_widget'):
-            video_layout.addWidget(self.video_widget)
-            self.video_widget.hide()  # Masqué au départ
+        # Le widget vidéo partagé est inséré par _take_shared_player
         
         #self.video_frame.hide()
         layout.addWidget(self.video_frame)
@@ -220,18 +332,43 @@ class MediaPlayer(QWidget):
         if not MULTIMEDIA_AVAILABLE or not hasattr(self, 'media_player'):
             return
         
+        # La première instance prend le lecteur partagé, les suivantes au chargement
+        if MediaPlayer._active_owner is None:
+            self._take_shared_player()
+    
+    def _player_signal_slots(self):
+        """Couples (signal du lecteur partagé, slot ou signal de cette instance)"""
+        player = self.media_player
+        return (
+            # Relais signal à signal: position_changed sans passer par Python
+            (player.positionChanged, self.position_changed),
+            (player.positionChanged, self.on_position_changed),
+            (player.durationChanged, self.on_duration_changed),
+            (player.playbackStateChanged, self.on_playback_state_changed),
+            (player.mediaStatusChanged, self.on_media_status_changed),
+            (player.errorOccurred, self.on_error_occurred),
+        )
+    
+    def _take_shared_player(self):
+        """Branche le lecteur partagé sur cette instance (signaux, vidéo, volume)"""
+        owner = MediaPlayer._active_owner
+        if owner is self:
+            return
+        
         try:
-            # Signaux du lecteur
-            self.media_player.positionChanged.connect(self.on_position_changed)
-            self.media_player.durationChanged.connect(self.on_duration_changed)
-            self.media_player.playbackStateChanged.connect(self.on_playback_state_changed)
-            self.media_player.mediaStatusChanged.connect(self.on_media_status_changed)
-            self.media_player.errorOccurred.connect(self.on_error_occurred)
+            # L'ancien propriétaire se vide et se débranche
+            if owner is not None:
+                owner.clear_ui()
+                for signal, slot in owner._player_signal_slots():
+                    signal.disconnect(slot)
+            MediaPlayer._active_owner = self
+            
+            for signal, slot in self._player_signal_slots():
+                signal.connect(slot)
             
-            # Timer pour la mise à jour de l'interface
-            self.update_timer = QTimer()
-            self.update_timer.timeout.connect(self.update_ui)
-            self.update_timer.start(100)
+            self._video_layout.addWidget(self.video_widget)
+            self.video_widget.hide()  # Masqué jusqu'au chargement d'une vidéo
+            self.audio_output.setVolume(self.volume_slider.value() / 100.0)
             
         except Exception as e:
             print(f"Erreur lors de la configuration des connexions: {e}")
@@ -247,24 +384,29 @@ class MediaPlayer(QWidget):
             return
         
         try:
-            # Déterminer le type de média
+            self._take_shared_player()
+            
+            # Type de média et chemin absolu, calculés une seule fois
             suffix = file_path.suffix.lower()
+            path_str = os.fspath(file_path if file_path.is_absolute() else file_path.absolute())
             
             self.current_media = file_path
+            self._current_media_str = path_str
             self.youtube_url = None
             self.youtube_button.hide()
             
-            # Configurer pour vidéo ou audio
-            if suffix in ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']:
-                self.is_video = True
+            # Configurer pour vidéo (l'audio garde la zone vidéo telle quelle)
+            self.is_video = suffix in VIDEO_EXTENSIONS
+            if self.is_video:
                 self.setup_video_display()
-            else:
-                self.is_video = False
-                #self.hide_video_display()
             
             # Charger le média
-            media_url = QUrl.fromLocalFile(str(file_path.absolute()))
+            media_url = QUrl.fromLocalFile(path_str)
             self.media_player.setSource(media_url)
+            self._first_frame_received = False
+            
+            # Même source qu'avant clear_ui: Qt n'émet pas durationChanged
+            self.on_duration_changed(self.media_player.duration())
             
             # Mettre à jour l'interface
             self.info_label.setText(f"📁 {file_path.name}")
@@ -284,6 +426,7 @@ class MediaPlayer(QWidget):
     def load_media_fallback(self, file_path: Path):
         """Charge un média en mode fallback"""
         self.current_media = file_path
+        self._current_media_str = os.fspath(file_path if file_path.is_absolute() else file_path.absolute())
         self.info_label.setText(f"📁 {file_path.name}")
         self.play_button.setEnabled(True)
         self.play_button.setText(f"🎵 Ouvrir {file_path.name}")
@@ -291,7 +434,7 @@ class MediaPlayer(QWidget):
     
     def setup_video_display(self):
         """Configure l'affichage vidéo"""
-        if not hasattr(self, 'video_widget'):
+        if not self._has_video_widget:
             return
         
         try:
@@ -320,7 +463,7 @@ class MediaPlayer(QWidget):
         if hasattr(self, 'video_frame'):
             self.video_frame.hide()
         
-        if hasattr(self, 'media_player'):
+        if self._has_player:
             self.media_player.setVideoOutput(None)
         
         # Revenir à la taille compacte
@@ -332,15 +475,63 @@ class MediaPlayer(QWidget):
     def request_video_layout_adjustment(self):
         """Demande au parent de réajuster pour la vidéo"""
         # Délai pour laisser le temps au widget de se redimensionner
-        # QTimer.singleShot(100, self._do_video_layout_adjustment)
+        # self._schedule_layout_adjustment(self._do_video_layout_adjustment)
+    
+    def _schedule_layout_adjustment(self, adjustment):
+        """
+        Programme un ajustement de layout (le dernier demandé l'emporte)
+        
+        Args:
+            adjustment: Méthode d'ajustement à appeler après le délai
+        """
+        self._pending_layout_adjustment = adjustment
+        self._layout_adjust_timer.start()
+    
+    def _run_layout_adjustment(self):
+        """Exécute l'ajustement de layout en attente"""
+        adjustment = self._pending_layout_adjustment
+        self._pending_layout_adjustment = None
+        if adjustment is not None:
+            adjustment()
+    
+    def _schedule(self, delay_ms: int, callback: Callable[[], None]):
+        """
+        Programme un rappel différé sur le timer partagé
+        
+        Args:
+            delay_ms: Délai en millisecondes
+            callback: Fonction à appeler
+        """
+        due = time.monotonic_ns() // 1_000_000 + delay_ms
+        order = next(self._due_order)
+        heapq.heappush(self._due, (due, order, callback))
+        if self._due[0][1] == order:  # Nouvelle échéance la plus proche
+            self._deferred_timer.start(delay_ms)
+    
+    def _run_due_callbacks(self):
+        """Exécute les rappels arrivés à échéance puis réarme le timer"""
+        now = time.monotonic_ns() // 1_000_000
+        try:
+            while self._due and self._due[0][0] <= now:
+                heapq.heappop(self._due)[2]()
+        finally:
+            if self._due:
+                self._deferred_timer.start(max(0, self._due[0][0] - now))
+    
+    def _find_parent_splitter(self) -> Optional[QSplitter]:
+        """Retourne le QSplitter ancêtre, mémorisé après la première recherche"""
+        if self._parent_splitter is None:
+            parent = self.parent()
+            while parent and not isinstance(parent, QSplitter):
+                parent = parent.parent()
+            self._parent_splitter = parent
+        return self._parent_splitter
     
     def _do_video_layout_adjustment(self):
         """Effectue l'ajustement de layout pour la vidéo"""
-        parent = self.parent()
-        while parent and not isinstance(parent, QSplitter):
-            parent = parent.parent()
+        parent = self._find_parent_splitter()
         
-        if parent and isinstance(parent, QSplitter):
+        if parent is not None:
             current_sizes = parent.sizes()
             if len(current_sizes) == 2:
                 total = sum(current_sizes)
@@ -352,15 +543,13 @@ class MediaPlayer(QWidget):
     
     def request_audio_layout_adjustment(self):
         """Demande au parent de réajuster pour l'audio"""
-        QTimer.singleShot(100, self._do_audio_layout_adjustment)
+        self._schedule_layout_adjustment(self._do_audio_layout_adjustment)
     
     def _do_audio_layout_adjustment(self):
         """Effectue l'ajustement de layout pour l'audio"""
-        parent = self.parent()
-        while parent and not isinstance(parent, QSplitter):
-            parent = parent.parent()
+        parent = self._find_parent_splitter()
         
-        if parent and isinstance(parent, QSplitter):
+        if parent is not None:
             current_sizes = parent.sizes()
             if len(current_sizes) == 2:
                 total = sum(current_sizes)
@@ -370,15 +559,16 @@ class MediaPlayer(QWidget):
                 parent.setSizes([new_library_size, new_player_size])
                 print("📐 Proportions ajustées pour l'audio")
     
+    @Slot()
     def force_video_display(self):
         """Force la réinitialisation de l'affichage vidéo"""
-        if not hasattr(self, 'video_widget') or not self.is_video:
+        if not self._has_video_widget or not self.is_video:
             return
         
         try:
             # Réinitialiser la sortie vidéo
             self.media_player.setVideoOutput(None)
-            QTimer.singleShot(100, lambda: self.media_player.setVideoOutput(self.video_widget))
+            self._schedule(100, self._restore_video_output)
             
             # Forcer le repaint
             self.video_widget.update()
@@ -389,6 +579,10 @@ class MediaPlayer(QWidget):
         except Exception as e:
             self.show_error(f"Erreur lors de la réinitialisation: {e}")
     
+    def _restore_video_output(self):
+        """Rebranche le widget vidéo sur le lecteur"""
+        self.media_player.setVideoOutput(self.video_widget)
+    
     def show_video_error(self):
         """Affiche une erreur spécifique à la vidéo"""
         self.video_placeholder.setText(
@@ -398,30 +592,42 @@ class MediaPlayer(QWidget):
             "• Bouton 'Ouvrir externe'\n"
             "• Installer K-Lite Codec Pack"
         )
-        self.video_placeholder.setStyleSheet("color: red; font-size: 10px;")
+        self._set_label_kind(self.video_placeholder, "video_error")
         self.video_placeholder.show()
     
+    @Slot()
     def open_external(self):
         """Ouvre le média avec l'application externe"""
         if not self.current_media:
             return
         
         try:
+            path = self._current_media_str
             if sys.platform.startswith('win'):
-                os.startfile(str(self.current_media))
-            elif sys.platform.startswith('darwin'):
-                subprocess.run(['open', str(self.current_media)])
-            else:
-                subprocess.run(['xdg-open', str(self.current_media)])
+                os.startfile(path)
+            elif self._opener is None or not self._opener.open(path):
+                self._spawn_detached([self._opener_path, path])
             
-            self.external_player_opened.emit(str(self.current_media))
+            self.external_player_opened.emit(path)
             
         except Exception as e:
             QMessageBox.warning(self, "Erreur", f"Impossible d'ouvrir le fichier:\n{e}")
     
+    @staticmethod
+    def _spawn_detached(args: list):
+        """
+        Lance un programme sans attendre sa fin
+        
+        Args:
+            args: Commande et arguments
+        """
+        subprocess.Popen(args, start_new_session=True, stdin=subprocess.DEVNULL,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    
+    @Slot()
     def play_pause(self):
         """Bascule entre lecture et pause"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player'):
+        if self._has_player:
             if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
                 self.media_player.pause()
             else:
@@ -429,31 +635,46 @@ class MediaPlayer(QWidget):
         else:
             self.open_external()
     
+    @Slot()
     def stop(self):
         """Arrête la lecture"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player'):
+        if self._has_player:
             self.media_player.stop()
     
+    @Slot(int)
     def set_position(self, position: int):
         """Change la position de lecture"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player'):
+        if self._has_player:
             self.media_player.setPosition(position)
     
+    @Slot(int)
     def set_volume(self, volume: int):
         """Change le volume"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'audio_output'):
+        if self._has_player and MediaPlayer._active_owner is self:
             self.audio_output.setVolume(volume / 100.0)
     
-    def clear_media(self):
-        """Vide le lecteur"""
-        if hasattr(self, 'media_player'):
+    def clear_ui(self):
+        """
+        Vide le lecteur côté interface
+        
+        La lecture est arrêtée mais la source reste chargée: le pipeline de
+        décodage est conservé pour le prochain load_media (voir release_media).
+        """
+        if self._has_player and MediaPlayer._active_owner is self:
             self.media_player.stop()
-            self.media_player.setSource(QUrl())
         
         self.current_media = None
+        self._current_media_str = None
         self.youtube_url = None
         self.is_video = False
         
+        # Plus aucun réveil en attente pour un lecteur vide
+        self._deferred_timer.stop()
+        self._due.clear()
+        self._layout_adjust_timer.stop()
+        self._pending_layout_adjustment = None
+        self._info_restore_pending = False
+        
         if hasattr(self, 'video_frame'):
             self.video_frame.hide()
         if hasattr(self, 'youtube_button'):
@@ -465,15 +686,28 @@ class MediaPlayer(QWidget):
         
         self.enable_controls(False)
         
-        if hasattr(self, 'info_label'):
+        self._duration_ms = 0
+        self._total_time_str = "00:00"
+        self._last_sec = -1
+        self._last_slider_update_ms = -SLIDER_UPDATE_MS
+        if hasattr(self, 'time_label'):
+            self.time_label.setText("00:00 / 00:00")
+        
+        if self._has_info_label:
             self.info_label.setText("🎵 Aucun média chargé")
-            self.info_label.setStyleSheet("color: #666; font-size: 12px;")
+            self._set_label_kind(self.info_label, "normal")
         
         self.setMaximumHeight(150)
     
+    def release_media(self):
+        """Décharge la source et libère le pipeline (à la fermeture)"""
+        if self._has_player and MediaPlayer._active_owner is self:
+            self.media_player.stop()
+            self.media_player.setSource(QUrl())
+    
     def enable_controls(self, enabled: bool):
         """Active ou désactive les contrôles"""
-        if hasattr(self, 'play_button'):
+        if self._has_play_button:
             self.play_button.setEnabled(enabled)
         if hasattr(self, 'stop_button'):
             self.stop_button.setEnabled(enabled)
@@ -484,31 +718,39 @@ class MediaPlayer(QWidget):
     
     def show_error(self, message: str):
         """Affiche un message d'erreur"""
-        if hasattr(self, 'info_label'):
+        if self._has_info_label:
             self.info_label.setText(f"❌ {message}")
-            self.info_label.setStyleSheet("color: red; font-size: 12px;")
-            QTimer.singleShot(3000, self.reset_info_label)
+            self._set_label_kind(self.info_label, "error")
+            self._schedule(3000, self.reset_info_label)
     
     def show_info(self, message: str):
         """Affiche un message d'information temporaire"""
-        if not hasattr(self, 'info_label'):
+        if not self._has_info_label:
             return
             
-        original_text = self.info_label.text()
-        original_style = self.info_label.styleSheet()
+        # Un message déjà affiché n'est pas l'état à restaurer
+        if not self._info_restore_pending:
+            self._info_original_text = self.info_label.text()
+            self._info_original_kind = self.info_label.property("kind")
+            self._info_restore_pending = True
         
         self.info_label.setText(f"ℹ️ {message}")
-        self.info_label.setStyleSheet("color: blue; font-size: 12px;")
+        self._set_label_kind(self.info_label, "info")
         
         # Restaurer après 2 secondes
-        QTimer.singleShot(2000, lambda: [
-            self.info_label.setText(original_text),
-            self.info_label.setStyleSheet(original_style)
-        ])
+        self._schedule(2000, self._restore_info)
+    
+    def _restore_info(self):
+        """Restaure le label d'info après un message temporaire"""
+        if not self._info_restore_pending:
+            return
+        self._info_restore_pending = False
+        self.info_label.setText(self._info_original_text)
+        self._set_label_kind(self.info_label, self._info_original_kind)
     
     def reset_info_label(self):
         """Remet le label d'info à l'état normal"""
-        if not hasattr(self, 'info_label'):
+        if not self._has_info_label:
             return
         
         if self.current_media:
@@ -516,99 +758,137 @@ class MediaPlayer(QWidget):
         else:
             self.info_label.setText("🎵 Aucun média chargé")
         
-        self.info_label.setStyleSheet("color: #666; font-size: 12px;")
+        self._set_label_kind(self.info_label, "normal")
+    
+    @staticmethod
+    def _set_label_kind(label: QLabel, kind: str):
+        """
+        Change l'état visuel d'un label (voir LABEL_STYLESHEET)
+        
+        Args:
+            label: Label à mettre à jour
+            kind: Valeur de la propriété "kind"
+        """
+        if label.property("kind") == kind:
+            return
+        label.setProperty("kind", kind)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
     
     # Gestion des événements du lecteur Qt
+    @Slot(int)
     def on_position_changed(self, position: int):
         """Appelé quand la position change"""
-        if hasattr(self, 'position_slider') and not self.position_slider.isSliderDown():
+        # abs(): un retour en arrière (seek) doit aussi passer le filtre
+        if (abs(position - self._last_slider_update_ms) >= SLIDER_UPDATE_MS
+                and not self.position_slider.isSliderDown()):
             self.position_slider.setValue(position)
-        self.position_changed.emit(position)
+            self._last_slider_update_ms = position
+        self.update_time_label(position)
     
+    @Slot(int)
     def on_duration_changed(self, duration: int):
         """Appelé quand la durée change"""
-        if hasattr(self, 'position_slider'):
-            self.position_slider.setRange(0, duration)
+        self.position_slider.setRange(0, duration)
+        
+        self._duration_ms = duration
+        self._total_time_str = self.format_time(duration)
+        self._last_sec = -1
+        self._last_slider_update_ms = -SLIDER_UPDATE_MS
+        self.update_time_label(self.media_player.position())
     
+    @Slot(_PlaybackState)
     def on_playback_state_changed(self, state):
         """Appelé quand l'état de lecture change"""
-        if not hasattr(self, 'play_button'):
+        if not self._has_play_button:
             return
         
         if state == QMediaPlayer.PlaybackState.PlayingState:
-            self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
+            self.play_button.setIcon(self._icon_pause)
+            if self.is_video and not self._first_frame_received:
+                self._watch_first_frame()
             self.playback_started.emit()
         else:
-            self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+            self.play_button.setIcon(self._icon_play)
             if state == QMediaPlayer.PlaybackState.PausedState:
                 self.playback_paused.emit()
             else:
                 self.playback_stopped.emit()
     
+    @Slot(_MediaStatus)
     def on_media_status_changed(self, status):
         """Appelé quand le statut du média change"""
         if status == QMediaPlayer.MediaStatus.InvalidMedia:
             self.show_error("Format de média non supporté")
             if hasattr(self, 'external_button'):
                 self.external_button.show()
-        elif status == QMediaPlayer.MediaStatus.LoadedMedia:
-            if self.is_video:
-                # S'assurer que la vidéo est configurée
-                QTimer.singleShot(500, self.check_video_display)
     
-    def check_video_display(self):
-        """Vérifie si la vidéo s'affiche correctement"""
-        if self.is_video and hasattr(self, 'video_widget'):
-            # Si pas d'image après 2 secondes de lecture, proposer des solutions
-            QTimer.singleShot(2000, self.check_video_rendering)
+    def _watch_first_frame(self):
+        """Attend la première image vidéo et programme la vérification du rendu"""
+        if not self._has_video_widget:
+            return
+        
+        # Connexion à usage unique: pas d'appel Python pour chaque image
+        if not self._awaiting_first_frame:
+            self._awaiting_first_frame = True
+            self._video_sink.videoFrameChanged.connect(
+                self._on_first_video_frame, Qt.ConnectionType.SingleShotConnection)
+        self._schedule(2000, self.check_video_rendering)
+    
+    @Slot()
+    def _on_first_video_frame(self):
+        """Appelé à la première image reçue par le widget vidéo"""
+        self._awaiting_first_frame = False
+        self._first_frame_received = True
     
     def check_video_rendering(self):
-        """Vérifie le rendu vidéo et propose des solutions si problème"""
-        if (self.is_video and 
-            hasattr(self, 'media_player') and 
-            self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState):
-            
-            # Proposer des solutions si la vidéo ne s'affiche pas
+        """Propose des solutions si aucune image n'est arrivée après 2 secondes de lecture"""
+        if self.is_video and not self._first_frame_received and self.is_playing():
             self.show_info("Si pas d'image: utilisez 'Forcer vidéo' ou 'Ouvrir externe'")
     
+    @Slot(_MediaError)
     def on_error_occurred(self, error):
         """Appelé en cas d'erreur"""
         self.show_error("Erreur de lecture - essayez le lecteur externe")
         if hasattr(self, 'external_button'):
             self.external_button.show()
     
+    def update_time_label(self, position: int):
+        """
+        Met à jour le libellé du temps
+        
+        Le texte ne change qu'une fois par seconde alors que positionChanged
+        est émis bien plus souvent: on ne reformate qu'au changement de seconde.
+        
+        Args:
+            position: Position de lecture en millisecondes
+        """
+        sec = position // 1000
+        if sec == self._last_sec:
+            return
+        self._last_sec = sec
+        self.time_label.setText(f"{self.format_time(position)} / {self._total_time_str}")
+    
+    @Slot()
     def update_ui(self):
         """Met à jour l'interface utilisateur"""
-        if not MULTIMEDIA_AVAILABLE or not hasattr(self, 'media_player'):
+        if not self._has_player:
             return
         
-        try:
-            position = self.media_player.position()
-            duration = self.media_player.duration()
-            
-            current_time = self.format_time(position)
-            total_time = self.format_time(duration)
-            
-            if hasattr(self, 'time_label'):
-                self.time_label.setText(f"{current_time} / {total_time}")
-        except:
-            pass
+        self._last_sec = -1
+        self.update_time_label(self.media_player.position())
     
     def format_time(self, ms: int) -> str:
         """Formate le temps en mm:ss"""
-        if ms < 0:
-            return "00:00"
-        
-        seconds = ms // 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
-        
+        minutes, seconds = divmod(max(ms, 0) // 1000, 60)
         return f"{minutes:02d}:{seconds:02d}"
     
     # Fonctions YouTube
     def load_youtube_url(self, url: str, title: str = ""):
         """Charge une URL YouTube"""
         self.current_media = None
+        self._current_media_str = None
         self.youtube_url = url
         self.is_video = False
         
@@ -618,12 +898,13 @@ class MediaPlayer(QWidget):
             self.youtube_button.show()
         
         display_title = title or "Vidéo YouTube"
-        if hasattr(self, 'info_label'):
+        if self._has_info_label:
             self.info_label.setText(f"🌐 {display_title}")
         
         self.enable_controls(False)
         self.media_loaded.emit(display_title)
     
+    @Slot()
     def open_youtube_url(self):
         """Ouvre l'URL YouTube dans le navigateur"""
         if self.youtube_url:
@@ -633,24 +914,24 @@ class MediaPlayer(QWidget):
     # Méthodes pour la compatibilité
     def get_current_position(self) -> int:
         """Retourne la position actuelle en millisecondes"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player'):
+        if self._has_player:
             return self.media_player.position()
         return 0
     
     def get_duration(self) -> int:
         """Retourne la durée totale en millisecondes"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player'):
+        if self._has_player:
             return self.media_player.duration()
         return 0
     
     def is_playing(self) -> bool:
         """Retourne True si en cours de lecture"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player'):
+        if self._has_player:
             return self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
         return False
     
     def is_paused(self) -> bool:
         """Retourne True si en pause"""
-        if MULTIMEDIA_AVAILABLE and hasattr(self, 'media_player'):
+        if self._has_player:
             return self.media_player.playbackState() == QMediaPlayer.PlaybackState.PausedState
         return False
\ No newline at end of file
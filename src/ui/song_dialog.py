@@ -4,19 +4,36 @@ Dialog pour créer et éditer les chansons (PySide6)
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, 
-    QPushButton, QTextEdit, QListWidget, QListWidgetItem, QSplitter,
+    QPushButton, QTextEdit, QListView, QSplitter,
     QGroupBox, QFileDialog, QMessageBox, QLabel, QFrame, QTabWidget,
-    QWidget, QScrollArea, QGridLayout, QDialogButtonBox
+    QWidget, QScrollArea, QDialogButtonBox, QStyle
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import Qt, QTimer, Signal, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QPixmap, QIcon, QPainter, QPalette
 from pathlib import Path
 from typing import Optional, List
+from dataclasses import dataclass, field
 import json
+from functools import partial
 
 from ..models.song import Song
 from ..utils.config import config_manager, get_supported_formats
-from ..utils.file_utils import scan_folder_for_media, get_file_size_human
+from ..utils.file_utils import build_extension_map, iter_media_files, get_file_size_human
+from ..utils.fast_stat import is_file_fast
+
+
+@dataclass
+class ValidationResult:
+    """Résultat de la validation du formulaire"""
+    is_valid: bool
+    title: str = ""
+    artist: str = ""
+    # Médias, remplis seulement si demandés (sauvegarde)
+    documents: List[Path] = field(default_factory=list)
+    audios: List[Path] = field(default_factory=list)
+    videos: List[Path] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+
 
 class LinkDialog(QDialog):
     def __init__(self, parent=None):
@@ -64,142 +81,204 @@ class LinkDialog(QDialog):
             'url': self.url_input.text().strip()
         }
 
-class MediaListWidget(QListWidget):
+class MediaListModel(QAbstractListModel):
+    """Modèle léger d'une liste de médias (fichiers ou liens)"""
+    
+    def __init__(self, icon: QIcon, parent=None):
+        super().__init__(parent)
+        self._items: List = []   # Path pour les fichiers, str pour les liens
+        self._labels: List[str] = []  # Texte affiché, calculé à l'insertion
+        self._icon = icon
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[row]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon
+        if role == Qt.ItemDataRole.UserRole:
+            return self._items[row]
+        return None
+    
+    @staticmethod
+    def _label(item) -> str:
+        """Texte affiché pour un fichier (nom et taille) ou un lien"""
+        if isinstance(item, Path):
+            return f"{item.name}\n{get_file_size_human(item)}"
+        return str(item)
+    
+    def append_items(self, items: List):
+        """
+        Ajoute des éléments en fin de liste (un seul signal pour le lot)
+        
+        Args:
+            items: Fichiers ou liens à ajouter
+        """
+        if not items:
+            return
+        
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._items.extend(items)
+        self._labels.extend(self._label(item) for item in items)
+        self.endInsertRows()
+    
+    def remove_rows(self, rows: List[int]):
+        """
+        Retire des lignes, par plages contiguës en partant de la fin
+        
+        Args:
+            rows: Indices des lignes à retirer
+        """
+        rows = sorted(set(rows), reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._items[first:last + 1]
+            del self._labels[first:last + 1]
+            self.endRemoveRows()
+    
+    def clear(self):
+        """Vide le modèle"""
+        self.beginResetModel()
+        self._items.clear()
+        self._labels.clear()
+        self.endResetModel()
+    
+    def items(self) -> List:
+        """Copie de la liste des éléments"""
+        return list(self._items)
+
+
+# Message affiché dans une liste vide, par type de média
+PLACEHOLDER_TEXTS = {
+    'documents': "📄 Glissez des documents ici\n(PDF, DOC, TXT, images...)",
+    'audio': "🎵 Glissez des fichiers audio ici\n(MP3, WAV, FLAC...)",
+    'video': "🎬 Glissez des vidéos ici\n(MP4, AVI, MOV...)",
+    'link': "Glissez des liens ici\n(Youtube...)"
+}
+
+
+class MediaListWidget(QListView):
     """Widget personnalisé pour afficher la liste des médias"""
     
     files_dropped = Signal(list)  # Signal émis quand des fichiers sont déposés
     
+    # Icône standard de chaque type de média (vidéo et liens par défaut)
+    _ICON_PIXMAPS = {
+        'documents': QStyle.StandardPixmap.SP_FileIcon,
+        'audio': QStyle.StandardPixmap.SP_MediaVolume,
+    }
+    _icons = {}  # Type de média -> QIcon, partagé par toutes les listes
+    
     def __init__(self, media_type: str):
         super().__init__()
         self.media_type = media_type
+        self._placeholder_text = PLACEHOLDER_TEXTS.get(media_type, "Glissez des fichiers ici")
         self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.DragDropMode.DropOnly)
+        self.setDragDropMode(QListView.DragDropMode.DropOnly)
+        
+        self._model = MediaListModel(self._icon_for(media_type), self)
+        self.setModel(self._model)
         
         # Style
         self.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 2px dashed #ccc;
                 border-radius: 5px;
                 background-color: #fafafa;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 5px;
                 border-bottom: 1px solid #eee;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e3f2fd;
             }
         """)
-        
-        # Message par défaut
-        self.update_placeholder()
-    
-    def update_placeholder(self):
-        """Met à jour le message de placeholder"""
-        if self.count() == 0:
-            placeholder_text = {
-                'documents': "📄 Glissez des documents ici\n(PDF, DOC, TXT, images...)",
-                'audio': "🎵 Glissez des fichiers audio ici\n(MP3, WAV, FLAC...)",
-                'video': "🎬 Glissez des vidéos ici\n(MP4, AVI, MOV...)",
-                'link': "Glissez des liens ici\n(Youtube...)"
-            }
-            
-            placeholder = QListWidgetItem(placeholder_text.get(self.media_type, "Glissez des fichiers ici"))
-            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)  # Non sélectionnable
-            placeholder.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.addItem(placeholder)
+    
+    def _icon_for(self, media_type: str) -> QIcon:
+        """Icône des éléments d'un type de média, créée une seule fois"""
+        icon = self._icons.get(media_type)
+        if icon is None:
+            pixmap = self._ICON_PIXMAPS.get(media_type, QStyle.StandardPixmap.SP_MediaPlay)
+            icon = self._icons[media_type] = self.style().standardIcon(pixmap)
+        return icon
+    
+    def paintEvent(self, event):
+        """Dessine la liste, ou le message par défaut si elle est vide"""
+        super().paintEvent(event)
+        if self._model.rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setPen(self.palette().color(QPalette.ColorRole.PlaceholderText))
+            painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter,
+                             self._placeholder_text)
+            painter.end()
     
     def add_file(self, file_path: Path):
         """Ajoute un fichier à la liste"""
-        # Supprimer le placeholder s'il existe
-        if self.count() == 1:
-            item = self.item(0)
-            if not item.flags() & Qt.ItemFlag.ItemIsSelectable:
-                self.clear()
-        
-        # Créer l'élément
-        file_size = get_file_size_human(file_path)
-        item_text = f"{file_path.name}\n{file_size}"
-        
-        item = QListWidgetItem(item_text)
-        item.setData(Qt.ItemDataRole.UserRole, file_path)
-        
-        # Icône selon le type
-        if self.media_type == 'documents':
-            item.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_FileIcon))
-        elif self.media_type == 'audio':
-            item.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_MediaVolume))
-        else:  # video
-            item.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_MediaPlay))
-        
-        self.addItem(item)
+        self._model.append_items([file_path])
+    
+    def add_files_bulk(self, file_paths: List[Path]):
+        """
+        Ajoute plusieurs fichiers avec une seule mise à jour de l'affichage
+        
+        Args:
+            file_paths: Fichiers à ajouter
+        """
+        self._model.append_items(file_paths)
 
     def add_link(self, file_path: str):
-        """Ajoute un fichier à la liste"""
-        # Supprimer le placeholder s'il existe
-        if self.count() == 1:
-            item = self.item(0)
-            if not item.flags() & Qt.ItemFlag.ItemIsSelectable:
-                self.clear()
-        
-        # Créer l'élément
-        item_text = f"{file_path}"
-        
-        item = QListWidgetItem(item_text)
-        item.setData(Qt.ItemDataRole.UserRole, file_path)
-        
-        # Icône selon le type
-        item.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_MediaPlay))
-        
-        self.addItem(item)
-
+        """Ajoute un lien à la liste"""
+        self._model.append_items([file_path])
+    
+    def has_selection(self) -> bool:
+        """Indique si des éléments sont sélectionnés"""
+        return self.selectionModel().hasSelection()
+    
     def remove_selected(self):
         """Supprime les éléments sélectionnés"""
-        for item in self.selectedItems():
-            row = self.row(item)
-            self.takeItem(row)
-        
-        self.update_placeholder()
+        rows = [index.row() for index in self.selectionModel().selectedRows()]
+        self._model.remove_rows(rows)
+    
+    @property
+    def file_count(self) -> int:
+        """Nombre de fichiers ou liens dans la liste"""
+        return self._model.rowCount()
     
     def get_links(self) -> List[str]:
-        links = []
-        for i in range(self.count()):
-            item = self.item(i)
-            file_path = item.data(Qt.ItemDataRole.UserRole)
-            if file_path:  # Ignorer le placeholder
-                links.append(file_path)
-        return links
+        """Retourne la liste des liens"""
+        return self._model.items()
 
     def get_files(self) -> List[Path]:
         """Retourne la liste des fichiers"""
-        files = []
-        for i in range(self.count()):
-            item = self.item(i)
-            file_path = item.data(Qt.ItemDataRole.UserRole)
-            if file_path:  # Ignorer le placeholder
-                files.append(file_path)
-        return files
+        return self._model.items()
     
     def clear_files(self):
         """Vide la liste"""
-        self.clear()
-        self.update_placeholder()
+        self._model.clear()
     
     def dragEnterEvent(self, event):
         """Gère l'entrée du drag"""
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
     
+    def dragMoveEvent(self, event):
+        """Accepte le drag sur toute la liste (le modèle n'a pas de cible de dépôt)"""
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+    
     def dropEvent(self, event):
-        """Gère le drop des fichiers"""
-        urls = event.mimeData().urls()
-        files = []
-        
-        for url in urls:
-            if url.isLocalFile():
-                file_path = Path(url.toLocalFile())
-                if file_path.is_file():
-                    files.append(file_path)
+        """Gère le drop des fichiers (l'existence est vérifiée par le récepteur)"""
+        files = [Path(url.toLocalFile()) for url in event.mimeData().urls() if url.isLocalFile()]
         
         if files:
             self.files_dropped.emit(files)
@@ -210,6 +289,9 @@ class MediaListWidget(QListWidget):
 class SongDialog(QDialog):
     """Dialog pour créer/éditer une chanson"""
     
+    # Filtre du sélecteur de fichiers, construit au premier usage
+    _FILTER_STR: Optional[str] = None
+    
     def __init__(self, song: Optional[Song] = None, parent=None):
         super().__init__(parent)
         self.song = song or Song()
@@ -363,7 +445,9 @@ class SongDialog(QDialog):
         # Zone de scroll pour les métadonnées
         scroll = QScrollArea()
         scroll_widget = QWidget()
-        self.metadata_layout = QGridLayout(scroll_widget)
+        # Une ligne = un petit widget (clé, valeur, suppression) empilé verticalement
+        self.metadata_layout = QVBoxLayout(scroll_widget)
+        self.metadata_layout.addStretch()  # Garde les lignes en haut
         
         scroll.setWidget(scroll_widget)
         scroll.setWidgetResizable(True)
@@ -382,6 +466,7 @@ class SongDialog(QDialog):
         
         # Charger les métadonnées existantes
         self.metadata_fields = {}
+        self._next_meta_row = 0  # Identifiant de ligne, jamais réutilisé
         
         self.tab_widget.addTab(tab, "⚙️ Métadonnées")
     
@@ -393,6 +478,10 @@ class SongDialog(QDialog):
         
         # Validation (sera mis à jour après)
         self.validation_label = QLabel()
+        self.validation_label.setStyleSheet(
+            'QLabel[state="valid"] { color: green; }'
+            'QLabel[state="invalid"] { color: orange; }'
+        )
         buttons_layout.addWidget(self.validation_label)
         
         buttons_layout.addStretch()
@@ -413,13 +502,19 @@ class SongDialog(QDialog):
     
     def setup_connections(self):
         """Configure les connexions de signaux"""
-        # Validation en temps réel
-        self.title_edit.textChanged.connect(self.update_validation_status)
-        self.artist_edit.textChanged.connect(self.update_validation_status)
+        # Validation en temps réel, regroupée: une seule après 120 ms sans frappe
+        self._validation_timer = QTimer(self)
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.setInterval(120)
+        self._validation_timer.timeout.connect(self.update_validation_status)
+        
+        self.title_edit.textChanged.connect(self._validation_timer.start)
+        self.artist_edit.textChanged.connect(self._validation_timer.start)
     
     def load_song_data(self):
         """Charge les données de la chanson dans le formulaire"""
-        if not self.song:
+        # Nouvelle chanson: formulaire déjà vide et validé à sa création
+        if not self.is_editing:
             return
         
         # Informations de base
@@ -433,14 +528,9 @@ class SongDialog(QDialog):
         self.notes_edit.setPlainText(notes)
         
         # Médias
-        for doc in self.song.documents:
-            self.documents_list.add_file(doc)
-        
-        for audio in self.song.audios:
-            self.audio_list.add_file(audio)
-        
-        for video in self.song.videos:
-            self.video_list.add_file(video)
+        self.documents_list.add_files_bulk([Path(doc) for doc in self.song.documents])
+        self.audio_list.add_files_bulk([Path(audio) for audio in self.song.audios])
+        self.video_list.add_files_bulk([Path(video) for video in self.song.videos])
 
         for link in self.song.links:
             self.link_list.add_link(link)
@@ -452,40 +542,56 @@ class SongDialog(QDialog):
                 key_str = str(key) if key is not None else ""
                 value_str = str(value) if value is not None else ""
                 self.add_metadata_field(key_str, value_str)
-    
-    def validate_form(self):
-        """Valide le formulaire et met à jour l'interface"""
-        is_valid = True
-        
-        # Vérifier les champs obligatoires
-        if not self.title_edit.text().strip() and not self.artist_edit.text().strip():
-            is_valid = False
-        
-        # Vérifier qu'il y a au moins un média
-        has_media = (len(self.documents_list.get_files()) > 0 or
-                    len(self.audio_list.get_files()) > 0 or
-                    len(self.video_list.get_files()) > 0 or
-                    len(self.link_list.get_links()) > 0)
         
-        if not has_media:
-            is_valid = False
+        # Une seule validation, une fois tout le formulaire rempli
+        self.update_validation_status()
+    
+    def validate_form(self, with_media: bool = False) -> ValidationResult:
+        """
+        Valide le formulaire et met à jour l'interface
+        
+        Args:
+            with_media: Joindre au résultat les listes de médias (pour la sauvegarde)
+        
+        Returns:
+            ValidationResult: Validité, titre et artiste nettoyés, médias si demandés
+        """
+        result = ValidationResult(False, self.title_edit.text().strip(),
+                                  self.artist_edit.text().strip())
+        if with_media:
+            result.documents = self.documents_list.get_files()
+            result.audios = self.audio_list.get_files()
+            result.videos = self.video_list.get_files()
+            result.links = self.link_list.get_links()
+        
+        # Vérifier les champs obligatoires et qu'il y a au moins un média
+        has_media = any(media_list.file_count for media_list in
+                        (self.documents_list, self.audio_list, self.video_list, self.link_list))
+        result.is_valid = bool((result.title or result.artist) and has_media)
         
         # Activer/désactiver le bouton de sauvegarde
-        self.save_button.setEnabled(is_valid)
+        self.save_button.setEnabled(result.is_valid)
         
-        return is_valid
+        return result
     
     def update_validation_status(self):
         """Met à jour le statut de validation"""
         if not hasattr(self, 'validation_label'):
             return
             
-        if self.validate_form():
+        # Le label ne change qu'avec l'état: simple re-polissage, sans ré-analyser de CSS
+        state = "valid" if self.validate_form().is_valid else "invalid"
+        if self.validation_label.property("state") == state:
+            return
+        
+        if state == "valid":
             self.validation_label.setText("✅ Prêt à sauvegarder")
-            self.validation_label.setStyleSheet("color: green;")
         else:
             self.validation_label.setText("⚠️ Titre/Artiste et au moins un média requis")
-            self.validation_label.setStyleSheet("color: orange;")
+        self.validation_label.setProperty("state", state)
+        style = self.validation_label.style()
+        style.unpolish(self.validation_label)
+        style.polish(self.validation_label)
     
     def open_link_dialog(self):
         """Ouvre la fenêtre contextuelle pour ajouter un lien"""
@@ -498,7 +604,6 @@ class SongDialog(QDialog):
             if link_data['title'] and link_data['url']:
                 # Ajouter le lien à la liste
                 self.link_list.add_link(link_data['url'])
-                self.validate_form()
                 self.update_validation_status()
                 print(f"Lien ajouté: {link_data['title']} -> {link_data['url']}")
             else:
@@ -506,27 +611,34 @@ class SongDialog(QDialog):
 
     def add_files(self):
         """Ouvre un dialog pour ajouter des fichiers"""
-        formats = get_supported_formats()
-        all_formats = []
-        for format_list in formats.values():
-            all_formats.extend(format_list)
-        
-        filter_str = "Tous les médias supportés (" + " ".join([f"*{ext}" for ext in all_formats]) + ")"
-        filter_str += ";;Documents (" + " ".join([f"*{ext}" for ext in formats['documents']]) + ")"
-        filter_str += ";;Audio (" + " ".join([f"*{ext}" for ext in formats['audio']]) + ")"
-        filter_str += ";;Vidéo (" + " ".join([f"*{ext}" for ext in formats['video']]) + ")"
-        filter_str += ";;Tous les fichiers (*)"
-        
         files, _ = QFileDialog.getOpenFileNames(
             self, 
             "Ajouter des fichiers",
             "",
-            filter_str
+            self._file_filter()
         )
         
         if files:
-            self.process_files([Path(f) for f in files])
-            self.update_validation_status()  # Mettre à jour après ajout
+            self.process_files([Path(f) for f in files])  # Met aussi à jour la validation
+    
+    @classmethod
+    def _file_filter(cls) -> str:
+        """Filtre QFileDialog des médias supportés (les formats ne changent pas en cours d'exécution)"""
+        if cls._FILTER_STR is None:
+            formats = get_supported_formats()
+            
+            def patterns(extensions):
+                return " ".join(f"*{ext}" for ext in extensions)
+            
+            all_formats = [ext for format_list in formats.values() for ext in format_list]
+            cls._FILTER_STR = ";;".join((
+                f"Tous les médias supportés ({patterns(all_formats)})",
+                f"Documents ({patterns(formats['documents'])})",
+                f"Audio ({patterns(formats['audio'])})",
+                f"Vidéo ({patterns(formats['video'])})",
+                "Tous les fichiers (*)",
+            ))
+        return cls._FILTER_STR
     
     def import_folder(self):
         """Importe tous les médias d'un dossier"""
@@ -537,18 +649,19 @@ class SongDialog(QDialog):
         
         if folder:
             folder_path = Path(folder)
-            formats = get_supported_formats()
-            media_files = scan_folder_for_media(folder_path, formats)
+            extension_map = build_extension_map(get_supported_formats())
             
-            # Ajouter les fichiers trouvés
-            for doc in media_files['documents']:
-                self.documents_list.add_file(doc)
+            # Parcours incrémental, Path créés seulement pour les médias retenus
+            media_files = {'documents': [], 'audio': [], 'video': []}
+            for media_type, path in iter_media_files(folder_path, extension_map):
+                bucket = media_files.get(media_type)
+                if bucket is not None:
+                    bucket.append(Path(path))
             
-            for audio in media_files['audio']:
-                self.audio_list.add_file(audio)
-            
-            for video in media_files['video']:
-                self.video_list.add_file(video)
+            # Ajouter les fichiers trouvés
+            self.documents_list.add_files_bulk(media_files['documents'])
+            self.audio_list.add_files_bulk(media_files['audio'])
+            self.video_list.add_files_bulk(media_files['video'])
             
             # Afficher un résumé
             total_files = len(media_files['documents']) + len(media_files['audio']) + len(media_files['video'])
@@ -568,64 +681,65 @@ class SongDialog(QDialog):
                     "Aucun fichier média supporté trouvé dans ce dossier."
                 )
             
-            self.validate_form()
             self.update_validation_status()  # Mettre à jour l'affichage
     
+    def _add_classified_files(self, files: List[Path], kinds=('document', 'audio', 'video')):
+        """
+        Répartit des fichiers dans les listes de médias en un seul passage
+        
+        Le type est lu dans l'extension; seuls les fichiers d'un type accepté
+        sont ensuite vérifiés sur le disque (dossiers et chemins disparus ignorés).
+        
+        Args:
+            files: Fichiers à ajouter
+            kinds: Types acceptés ('document', 'audio', 'video'), les autres sont ignorés
+        """
+        buckets = {kind: [] for kind in kinds}
+        for file_path in files:
+            bucket = buckets.get(config_manager.classify(file_path))
+            if bucket is not None and is_file_fast(file_path):
+                bucket.append(file_path)
+        
+        lists = {'document': self.documents_list, 'audio': self.audio_list, 'video': self.video_list}
+        for kind, bucket in buckets.items():
+            lists[kind].add_files_bulk(bucket)
+    
     def process_files(self, files: List[Path]):
         """Traite une liste de fichiers et les ajoute aux bonnes listes"""
-        for file_path in files:
-            media_type = config_manager.is_supported_media(file_path)
-            
-            if media_type == 'document':
-                self.documents_list.add_file(file_path)
-            elif media_type == 'audio':
-                self.audio_list.add_file(file_path)
-            elif media_type == 'video':
-                self.video_list.add_file(file_path)
-        
-        self.validate_form()
+        self._add_classified_files(files)
         self.update_validation_status()  # Mettre à jour l'affichage
     
     def on_documents_dropped(self, files: List[Path]):
         """Gère les fichiers déposés sur la liste des documents"""
-        for file_path in files:
-            if config_manager.is_supported_document(file_path):
-                self.documents_list.add_file(file_path)
-        self.validate_form()
+        self._add_classified_files(files, ('document',))
         self.update_validation_status()  # Mettre à jour l'affichage
     
     def on_audio_dropped(self, files: List[Path]):
         """Gère les fichiers déposés sur la liste audio"""
-        for file_path in files:
-            if config_manager.is_supported_audio(file_path):
-                self.audio_list.add_file(file_path)
-        self.validate_form()
+        self._add_classified_files(files, ('audio',))
         self.update_validation_status()  # Mettre à jour l'affichage
     
     def on_video_dropped(self, files: List[Path]):
         """Gère les fichiers déposés sur la liste vidéo"""
-        for file_path in files:
-            if config_manager.is_supported_video(file_path):
-                self.video_list.add_file(file_path)
-        self.validate_form()
+        self._add_classified_files(files, ('video',))
         self.update_validation_status()  # Mettre à jour l'affichage
     
     def remove_selected_media(self):
         """Supprime les médias sélectionnés"""
         # Trouver quelle liste a des éléments sélectionnés
-        if self.documents_list.selectedItems():
+        if self.documents_list.has_selection():
             self.documents_list.remove_selected()
-        elif self.audio_list.selectedItems():
+        elif self.audio_list.has_selection():
             self.audio_list.remove_selected()
-        elif self.video_list.selectedItems():
+        elif self.video_list.has_selection():
             self.video_list.remove_selected()
         
-        self.validate_form()
         self.update_validation_status()  # Mettre à jour l'affichage
     
     def add_metadata_field(self, key: str = "", value: str = ""):
         """Ajoute un champ de métadonnées"""
-        row = self.metadata_layout.rowCount()
+        row = self._next_meta_row
+        self._next_meta_row += 1
         
         # S'assurer que key et value sont des chaînes
         key = str(key) if key is not None else ""
@@ -644,28 +758,31 @@ class SongDialog(QDialog):
         # Bouton de suppression
         remove_button = QPushButton("🗑️")
         remove_button.setMaximumWidth(30)
-        remove_button.clicked.connect(lambda: self.remove_metadata_field(row))
-        
-        # Ajouter à la grille
-        self.metadata_layout.addWidget(key_edit, row, 0)
-        self.metadata_layout.addWidget(value_edit, row, 1)
-        self.metadata_layout.addWidget(remove_button, row, 2)
+        # partial fige la ligne à la création (checked de clicked est ignoré)
+        remove_button.clicked.connect(partial(self.remove_metadata_field, row))
+        
+        # Regrouper la ligne et l'insérer avant l'espace final
+        row_widget = QWidget()
+        row_layout = QHBoxLayout(row_widget)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.addWidget(key_edit)
+        row_layout.addWidget(value_edit)
+        row_layout.addWidget(remove_button)
+        self.metadata_layout.insertWidget(self.metadata_layout.count() - 1, row_widget)
         
         # Stocker les références
         self.metadata_fields[row] = (key_edit, value_edit, remove_button)
     
-    def remove_metadata_field(self, row: int):
+    def remove_metadata_field(self, row: int, *_):
         """Supprime un champ de métadonnées"""
-        if row in self.metadata_fields:
-            key_edit, value_edit, remove_button = self.metadata_fields[row]
-            
-            # Supprimer les widgets
-            key_edit.setParent(None)
-            value_edit.setParent(None)
-            remove_button.setParent(None)
-            
-            # Supprimer de la liste
-            del self.metadata_fields[row]
+        widgets = self.metadata_fields.pop(row, None)
+        if widgets is None:
+            return
+        
+        # Retirer la ligne entière puis la détruire (avec ses champs)
+        row_widget = widgets[0].parentWidget()
+        self.metadata_layout.removeWidget(row_widget)
+        row_widget.deleteLater()
     
     def collect_metadata(self) -> dict:
         """Collecte toutes les métadonnées du formulaire"""
@@ -688,7 +805,8 @@ class SongDialog(QDialog):
     
     def save_song(self):
         """Sauvegarde les données de la chanson"""
-        if not self.validate_form():
+        result = self.validate_form(with_media=True)
+        if not result.is_valid:
             QMessageBox.warning(
                 self,
                 "Formulaire invalide",
@@ -697,16 +815,16 @@ class SongDialog(QDialog):
             return
         
         # Mettre à jour les données de base
-        self.song.title = self.title_edit.text().strip()
-        self.song.artist = self.artist_edit.text().strip()
+        self.song.title = result.title
+        self.song.artist = result.artist
         self.song.tempo = self.tempo_edit.text().strip()
         self.song.style = self.style_edit.text().strip()
         
         # Mettre à jour les listes de médias
-        self.song.documents = self.documents_list.get_files()
-        self.song.audios = self.audio_list.get_files()
-        self.song.videos = self.video_list.get_files()
-        self.song.links = self.link_list.get_links()
+        self.song.documents = result.documents
+        self.song.audios = result.audios
+        self.song.videos = result.videos
+        self.song.links = result.links
         
         # Mettre à jour les métadonnées
         self.song.metadata = self.collect_metadata()
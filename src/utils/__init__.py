@@ -6,11 +6,12 @@ Utilitaires pour MusicPartMate
 from .config import config_manager, get_config, save_config
 from .file_utils import (
     get_file_size_human, safe_filename, scan_folder_for_media,
-    create_song_folder_structure
+    iter_media_files, create_song_folder_structure
 )
+from .fast_stat import is_dir_fast, is_file_fast
 
 __all__ = [
     'config_manager', 'get_config', 'save_config',
     'get_file_size_human', 'safe_filename', 'scan_folder_for_media',
-    'create_song_folder_structure'
+    'iter_media_files', 'create_song_folder_structure', 'is_dir_fast', 'is_file_fast'
 ]
\ No newline at end of file
@@ -3,10 +3,19 @@ Configuration globale de l'application
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
+# Décodage typé de la configuration si msgspec est installé
+MSGSPEC_AVAILABLE = False
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    pass
+
 
 @dataclass
 class AppConfig:
@@ -59,14 +68,31 @@ class AppConfig:
                                 '.flv', '.webm']
 
 
+if MSGSPEC_AVAILABLE:
+    # Décodeur spécialisé au schéma: seuls les champs d'AppConfig sont construits
+    _CONFIG_DECODER = msgspec.json.Decoder(AppConfig)
+
+
 class ConfigManager:
     """Gestionnaire de configuration"""
     
     def __init__(self, config_path: str = "config.json"):
         self.config_path = Path(config_path)
         self.config = AppConfig()
+        self._saved: Optional[Dict[str, Any]] = None  # Contenu du fichier à la dernière lecture/écriture
+        self._formats: Optional[Dict[str, list]] = None  # Formats par type, calculés à la demande
+        self._format_sets: Optional[Dict[str, frozenset]] = None
+        self._ext_to_kind: Optional[Dict[str, str]] = None
+        self._all_extensions: Optional[list] = None
+        self._data_dir: Optional[Path] = None   # Dossiers créés au premier accès
+        self._cache_dir: Optional[Path] = None
         self.load_config()
     
+    @property
+    def dirty(self) -> bool:
+        """True si la configuration diffère de celle du fichier"""
+        return self._saved != asdict(self.config)
+    
     def load_config(self) -> bool:
         """Charge la configuration depuis le fichier"""
         if not self.config_path.exists():
@@ -75,6 +101,19 @@ class ConfigManager:
             return True
         
         try:
+            if MSGSPEC_AVAILABLE:
+                raw = self.config_path.read_bytes()
+                try:
+                    self.config = _CONFIG_DECODER.decode(raw)
+                except msgspec.ValidationError:
+                    pass  # Valeur d'un type inattendu: lecture tolérante ci-dessous
+                else:
+                    self._formats = self._format_sets = self._ext_to_kind = self._all_extensions = None
+                    self._data_dir = self._cache_dir = None
+                    # Clés inconnues ignorées: le fichier n'est réécrit que si un réglage change
+                    self._saved = asdict(self.config)
+                    return True
+            
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
@@ -82,22 +121,39 @@ class ConfigManager:
             for key, value in data.items():
                 if hasattr(self.config, key):
                     setattr(self.config, key, value)
+            self._formats = self._format_sets = self._ext_to_kind = self._all_extensions = None
+            self._data_dir = self._cache_dir = None
             
+            # Un fichier incomplet ou obsolète sera réécrit à la prochaine sauvegarde
+            self._saved = data
             return True
             
         except Exception as e:
             print(f"Erreur lors du chargement de la configuration: {e}")
             return False
     
-    def save_config(self) -> bool:
-        """Sauvegarde la configuration"""
+    def save_config(self, fsync: bool = False) -> bool:
+        """
+        Sauvegarde la configuration
+        
+        Args:
+            fsync: Forcer l'écriture sur disque (sauvegarde explicite des réglages)
+        
+        Returns:
+            bool: True si sauvegarde réussie
+        """
         try:
             # Créer le dossier parent si nécessaire
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
+            data = asdict(self.config)
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.config), f, ensure_ascii=False, indent=2)
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
             
+            self._saved = data
             return True
             
         except Exception as e:
@@ -105,41 +161,93 @@ class ConfigManager:
             return False
     
     def get_data_dir(self) -> Path:
-        """Retourne le dossier de données"""
-        data_dir = Path(self.config.data_dir)
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir
+        """Retourne le dossier de données (créé une seule fois par chargement)"""
+        if self._data_dir is None:
+            data_dir = Path(self.config.data_dir)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self._data_dir = data_dir
+        return self._data_dir
     
     def get_library_path(self) -> Path:
         """Retourne le chemin complet vers la bibliothèque"""
         return self.get_data_dir() / self.config.library_file
     
     def get_supported_formats(self) -> Dict[str, list]:
-        """Retourne tous les formats supportés par type"""
-        return {
-            'documents': self.config.document_formats,
-            'audio': self.config.audio_formats,
-            'video': self.config.video_formats
-        }
-        """Retourne le dossier de cache"""
-        cache_dir = Path(self.config.cache_dir)
+        """Retourne tous les formats supportés par type (calculés une fois par chargement)"""
+        if self._formats is None:
+            self._formats = {
+                'documents': self.config.document_formats,
+                'audio': self.config.audio_formats,
+                'video': self.config.video_formats
+            }
+        return self._formats
+    
+    def get_all_supported_extensions(self) -> list:
+        """Toutes les extensions supportées, triées et sans doublon (liste partagée, ne pas modifier)"""
+        if self._all_extensions is None:
+            self._all_extensions = sorted(set().union(*self.get_supported_formats().values()))
+        return self._all_extensions
+    
+    @property
+    def format_sets(self) -> Dict[str, frozenset]:
+        """Extensions supportées par type, en minuscules, pour des tests d'appartenance O(1)"""
+        if self._format_sets is None:
+            self._format_sets = {
+                media_type: frozenset(ext.lower() for ext in extensions)
+                for media_type, extensions in self.get_supported_formats().items()
+            }
+        return self._format_sets
+    
+    def classify(self, file_path: Path) -> Optional[str]:
+        """
+        Type de média d'un fichier, en une seule recherche dans une table
+        
+        Args:
+            file_path: Fichier à classer
+        
+        Returns:
+            Optional[str]: 'document', 'audio', 'video' ou None si non supporté
+        """
+        return self.classify_extension(file_path.suffix.lower())
+    
+    def classify_extension(self, extension: str) -> Optional[str]:
+        """
+        Type de média d'une extension déjà extraite (ex: pendant un parcours os.scandir)
+        
+        Args:
+            extension: Extension en minuscules, point compris ('.mp3')
+        
+        Returns:
+            Optional[str]: 'document', 'audio', 'video' ou None si non supporté
+        """
+        if self._ext_to_kind is None:
+            # Ordre inverse de priorité: une extension listée deux fois reste un document
+            ext_to_kind = {}
+            for media_type, kind in (('video', 'video'), ('audio', 'audio'), ('documents', 'document')):
+                for ext in self.format_sets[media_type]:
+                    ext_to_kind[ext] = kind
+            self._ext_to_kind = ext_to_kind
+        return self._ext_to_kind.get(extension)
+    
     def get_cache_dir(self) -> Path:
-        """Retourne le dossier de cache"""
-        cache_dir = Path(self.config.cache_dir)
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        """Retourne le dossier de cache (créé une seule fois par chargement)"""
+        if self._cache_dir is None:
+            cache_dir = Path(self.config.cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_dir = cache_dir
+        return self._cache_dir
     
     def is_supported_document(self, file_path: Path) -> bool:
         """Vérifie si le format de document est supporté"""
-        return file_path.suffix.lower() in self.config.document_formats
+        return file_path.suffix.lower() in self.format_sets['documents']
     
     def is_supported_audio(self, file_path: Path) -> bool:
         """Vérifie si le format audio est supporté"""
-        return file_path.suffix.lower() in self.config.audio_formats
+        return file_path.suffix.lower() in self.format_sets['audio']
     
     def is_supported_video(self, file_path: Path) -> bool:
         """Vérifie si le format vidéo est supporté"""
-        return file_path.suffix.lower() in self.config.video_formats
+        return file_path.suffix.lower() in self.format_sets['video']
     
     def is_supported_media(self, file_path: Path) -> str:
         """
@@ -148,14 +256,7 @@ class ConfigManager:
         Returns:
             str: 'document', 'audio', 'video' ou 'unsupported'
         """
-        if self.is_supported_document(file_path):
-            return 'document'
-        elif self.is_supported_audio(file_path):
-            return 'audio'
-        elif self.is_supported_video(file_path):
-            return 'video'
-        else:
-            return 'unsupported'
+        return self.classify(file_path) or 'unsupported'
 
 
 # Instance globale du gestionnaire de configuration
@@ -174,18 +275,9 @@ def save_config() -> bool:
 
 def get_supported_formats() -> Dict[str, list]:
     """Retourne tous les formats supportés"""
-    config = get_config()
-    return {
-        'documents': config.document_formats,
-        'audio': config.audio_formats,
-        'video': config.video_formats
-    }
+    return config_manager.get_supported_formats()
 
 
 def get_all_supported_extensions() -> list:
     """Retourne toutes les extensions supportées"""
-    formats = get_supported_formats()
-    all_formats = []
-    for format_list in formats.values():
-        all_formats.extend(format_list)
-    return sorted(list(set(all_formats)))
\ No newline at end of file
+    return config_manager.get_all_supported_extensions()
\ No newline at end of file
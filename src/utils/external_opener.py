@@ -0,0 +1,87 @@
+"""
+Ouverture des médias dans l'application externe du système
+
+Un petit interpréteur auxiliaire, démarré à la première ouverture, lit les
+chemins ligne par ligne sur son entrée standard et lance le programme
+d'ouverture (xdg-open, open). Les clics suivants ne coûtent plus qu'une
+écriture dans le tube au lieu d'un fork du processus Qt.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Optional
+
+
+# Boucle exécutée par l'auxiliaire (python -c): autonome, elle n'importe
+# ni l'application ni Qt
+_OPENER_LOOP = """
+import subprocess, sys
+opener = sys.argv[1]
+for line in sys.stdin.buffer:
+    path = line.rstrip(b'\\n')
+    if not path:
+        continue
+    try:
+        subprocess.Popen([opener, path], start_new_session=True,
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL)
+    except OSError as e:
+        print(f"❌ Impossible de lancer {opener}: {e}", file=sys.stderr)
+"""
+
+
+class ExternalOpener:
+    """Processus auxiliaire d'ouverture des fichiers"""
+    
+    def __init__(self, opener: str):
+        """
+        Args:
+            opener: Programme d'ouverture (xdg-open, open)
+        """
+        self._opener = opener
+        self._process: Optional[subprocess.Popen] = None
+        self._failed = False
+    
+    def _ensure_started(self) -> bool:
+        """
+        Démarre l'auxiliaire au premier appel
+        
+        Returns:
+            bool: True si l'auxiliaire est en cours d'exécution
+        """
+        if self._process is not None:
+            return self._process.poll() is None
+        if self._failed:
+            return False
+        
+        try:
+            self._process = subprocess.Popen(
+                [sys.executable, '-c', _OPENER_LOOP, self._opener],
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL
+            )
+        except OSError as e:
+            print(f"⚠️ Ouvreur externe indisponible: {e}")
+            self._failed = True
+            return False
+        return True
+    
+    def open(self, path: str) -> bool:
+        """
+        Demande l'ouverture d'un fichier
+        
+        Args:
+            path: Chemin du fichier
+        
+        Returns:
+            bool: False si l'auxiliaire ne peut pas s'en charger
+        """
+        data = os.fsencode(path)
+        if b'\n' in data or not self._ensure_started():
+            return False
+        try:
+            self._process.stdin.write(data + b'\n')
+            self._process.stdin.flush()
+        except (OSError, ValueError):
+            return False
+        return True
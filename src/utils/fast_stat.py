@@ -0,0 +1,114 @@
+"""
+Tests de type de fichier rapides pour la découverte des médias
+
+Sous Linux, statx() est appelé avec AT_STATX_DONT_SYNC et le seul masque
+STATX_TYPE: le noyau répond depuis son cache sans resynchroniser les
+systèmes de fichiers distants (NFS, SMB). Ailleurs, ou si statx n'est pas
+disponible, on se rabat sur os.stat.
+"""
+
+import os
+import stat
+import ctypes
+import errno
+import functools
+import sys
+from typing import Callable, Optional, Union
+
+# Constantes de <linux/fcntl.h> et <linux/stat.h>
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+
+# Taille de struct statx côté noyau
+_STATX_SIZE = 256
+
+
+class _Statx(ctypes.Structure):
+    """Début de struct statx (seuls stx_mask et stx_mode sont lus)"""
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('_reste', ctypes.c_uint8 * (_STATX_SIZE - 30)),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _statx_function() -> Optional[Callable]:
+    """
+    Fonction statx de la libc, vérifiée une seule fois
+    
+    Returns:
+        Optional[Callable]: statx, ou None si indisponible (libc ou noyau trop ancien)
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        statx = libc.statx  # glibc >= 2.28
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint,
+                      ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+    
+    # Noyau < 4.11 (ENOSYS) ou appel filtré par seccomp (EPERM)
+    buffer = _Statx()
+    if statx(AT_FDCWD, b"/", AT_STATX_DONT_SYNC, STATX_TYPE, ctypes.byref(buffer)) != 0:
+        return None
+    return statx
+
+
+def _file_mode(path: Union[str, os.PathLike], follow_symlinks: bool) -> Optional[int]:
+    """Mode du fichier (type seulement avec statx), None s'il n'existe pas"""
+    statx = _statx_function()
+    if statx is not None:
+        flags = AT_STATX_DONT_SYNC if follow_symlinks else AT_STATX_DONT_SYNC | AT_SYMLINK_NOFOLLOW
+        buffer = _Statx()
+        if statx(AT_FDCWD, os.fsencode(path), flags, STATX_TYPE, ctypes.byref(buffer)) == 0:
+            if buffer.stx_mask & STATX_TYPE:
+                return buffer.stx_mode
+        elif ctypes.get_errno() in (errno.ENOENT, errno.ENOTDIR):
+            return None
+    
+    # Repli: os.stat (autres systèmes, erreurs inattendues, type non fourni)
+    try:
+        return os.stat(path, follow_symlinks=follow_symlinks).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def is_dir_fast(path: Union[str, os.PathLike], follow_symlinks: bool = True) -> bool:
+    """
+    Vérifie qu'un chemin est un dossier
+    
+    Args:
+        path: Chemin à tester
+        follow_symlinks: Suivre les liens symboliques (comme os.path.isdir)
+    
+    Returns:
+        bool: True si le chemin existe et est un dossier
+    """
+    mode = _file_mode(path, follow_symlinks)
+    return mode is not None and stat.S_ISDIR(mode)
+
+
+def is_file_fast(path: Union[str, os.PathLike], follow_symlinks: bool = True) -> bool:
+    """
+    Vérifie qu'un chemin est un fichier ordinaire
+    
+    Args:
+        path: Chemin à tester
+        follow_symlinks: Suivre les liens symboliques (comme os.path.isfile)
+    
+    Returns:
+        bool: True si le chemin existe et est un fichier
+    """
+    mode = _file_mode(path, follow_symlinks)
+    return mode is not None and stat.S_ISREG(mode)
@@ -2,29 +2,32 @@
 Utilitaires pour la gestion des fichiers
 """
 
+import errno
 import os
+import re
 import shutil
+import stat
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Collection, Iterator, List, Dict, Optional, Tuple
 import mimetypes
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from collections import Counter
+from functools import lru_cache
 
 
-def get_file_size_human(file_path: Path) -> str:
+@lru_cache(maxsize=1024)
+def format_file_size(size: int) -> str:
     """
-    Retourne la taille du fichier dans un format lisible
+    Formate une taille en octets, sans accès disque
     
     Args:
-        file_path: Chemin vers le fichier
+        size: Taille en octets
         
     Returns:
         str: Taille formatée (ex: "1.5 MB")
     """
-    if not file_path.exists():
-        return "0 B"
-    
-    size = file_path.stat().st_size
-    
     # Unités
     units = ['B', 'KB', 'MB', 'GB', 'TB']
     unit_index = 0
@@ -36,6 +39,28 @@ def get_file_size_human(file_path: Path) -> str:
     return f"{size:.1f} {units[unit_index]}"
 
 
+def get_file_size_human(file_path: Path) -> str:
+    """
+    Retourne la taille du fichier dans un format lisible (un seul stat())
+    
+    Args:
+        file_path: Chemin vers le fichier
+        
+    Returns:
+        str: Taille formatée (ex: "1.5 MB")
+    """
+    try:
+        size = os.stat(file_path).st_size
+    except OSError:
+        return "0 B"
+    
+    return format_file_size(size)
+
+
+# Taille des blocs lus pour le hash quand hashlib.file_digest manque (Python < 3.11)
+_HASH_CHUNK_SIZE = 1 << 20
+
+
 def get_file_hash(file_path: Path, algorithm: str = "md5") -> str:
     """
     Calcule le hash d'un fichier
@@ -47,16 +72,22 @@ def get_file_hash(file_path: Path, algorithm: str = "md5") -> str:
     Returns:
         str: Hash du fichier
     """
-    if not file_path.exists():
+    try:
+        with open(file_path, 'rb') as f:
+            # Lecture séquentielle annoncée au noyau (lecture anticipée plus large)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            # Python 3.11+: boucle C avec un grand tampon, GIL relâché pendant le calcul
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            
+            hash_func = hashlib.new(algorithm)
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                hash_func.update(chunk)
+            return hash_func.hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
         return ""
-    
-    hash_func = hashlib.new(algorithm)
-    
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_func.update(chunk)
-    
-    return hash_func.hexdigest()
 
 
 def is_file_accessible(file_path: Path) -> bool:
@@ -75,10 +106,22 @@ def is_file_accessible(file_path: Path) -> bool:
         return False
 
 
+# Caractères interdits dans les noms de fichiers et noms réservés Windows
+_FORBIDDEN_RE = re.compile(r'[<>:"/\\|?*]')
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+
+@lru_cache(maxsize=4096)
 def safe_filename(filename: str, replacement: str = "_") -> str:
     """
     Nettoie un nom de fichier en supprimant les caractères dangereux
     
+    Résultat mis en cache: les mêmes artistes et titres reviennent souvent.
+    
     Args:
         filename: Nom de fichier original
         replacement: Caractère de remplacement
@@ -86,24 +129,12 @@ def safe_filename(filename: str, replacement: str = "_") -> str:
     Returns:
         str: Nom de fichier sécurisé
     """
-    # Caractères interdits dans les noms de fichiers
-    forbidden_chars = '<>:"/\\|?*'
-    
-    clean_name = filename
-    for char in forbidden_chars:
-        clean_name = clean_name.replace(char, replacement)
-    
-    # Supprimer les espaces en début/fin
-    clean_name = clean_name.strip()
+    # Un seul passage pour tous les caractères interdits, puis les espaces en début/fin
+    # (re.sub est nettement plus rapide que str.translate quand il n'y a rien à remplacer)
+    clean_name = _FORBIDDEN_RE.sub(replacement.replace('\\', '\\\\'), filename).strip()
     
     # Éviter les noms réservés Windows
-    reserved_names = [
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    ]
-    
-    if clean_name.upper() in reserved_names:
+    if clean_name.upper() in _RESERVED_NAMES:
         clean_name = f"{clean_name}_{replacement}"
     
     return clean_name
@@ -139,13 +170,30 @@ def create_song_folder_structure(base_path: Path, artist: str, title: str) -> Pa
     return song_folder
 
 
-def scan_folder_for_media(folder_path: Path, extensions: Dict[str, List[str]]) -> Dict[str, List[Path]]:
+def build_extension_map(extensions: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Aplatit les extensions supportées en une table extension -> type
+    
+    Args:
+        extensions: Extensions supportées par type {'documents': [...], 'audio': [...], 'video': [...]}
+        
+    Returns:
+        Dict[str, str]: Type de média par extension (en minuscules)
+    """
+    return {ext.lower(): media_type
+            for media_type, ext_list in extensions.items()
+            for ext in ext_list}
+
+
+def scan_folder_for_media(folder_path: Path, extensions: Dict[str, List[str]],
+                          extension_map: Optional[Dict[str, str]] = None) -> Dict[str, List[Path]]:
     """
     Scanne un dossier à la recherche de fichiers média
     
     Args:
         folder_path: Dossier à scanner
         extensions: Extensions supportées par type {'documents': [...], 'audio': [...], 'video': [...]}
+        extension_map: Table extension -> type déjà calculée (build_extension_map)
         
     Returns:
         Dict[str, List[Path]]: Fichiers trouvés par type
@@ -157,60 +205,203 @@ def scan_folder_for_media(folder_path: Path, extensions: Dict[str, List[str]]) -
         'unknown': []
     }
     
-    if not folder_path.exists() or not folder_path.is_dir():
-        return result
-    
-    # Aplatir les extensions pour la recherche
-    all_extensions = {}
-    for media_type, ext_list in extensions.items():
-        for ext in ext_list:
-            all_extensions[ext.lower()] = media_type
+    # Aplatir les extensions pour la recherche (sauf si déjà fait par l'appelant)
+    all_extensions = extension_map if extension_map is not None else build_extension_map(extensions)
     
-    # Scanner récursivement
-    for file_path in folder_path.rglob("*"):
-        if file_path.is_file():
-            extension = file_path.suffix.lower()
-            media_type = all_extensions.get(extension, 'unknown')
-            result[media_type].append(file_path)
+    for media_type, path in iter_media_files(folder_path, all_extensions):
+        result[media_type].append(Path(path))
     
     return result
 
 
-def copy_file_to_song_folder(source_file: Path, song_folder: Path, media_type: str) -> Optional[Path]:
+def iter_media_files(folder_path: Path, extension_map: Dict[str, str]) -> Iterator[Tuple[str, str]]:
     """
-    Copie un fichier dans le dossier d'une chanson
+    Parcourt un dossier récursivement et classe chaque fichier au passage
+    
+    os.scandir lit le type dans l'entrée de répertoire, sans stat(); les liens
+    symboliques vers des dossiers ne sont pas suivis.
     
     Args:
-        source_file: Fichier source à copier
-        song_folder: Dossier de destination de la chanson
-        media_type: Type de média ('documents', 'audio', 'video')
+        folder_path: Dossier à parcourir
+        extension_map: Table extension -> type (build_extension_map)
+        
+    Yields:
+        Tuple[str, str]: (type de média ou 'unknown', chemin du fichier)
+    """
+    # Dossier absent ou fichier: _walk_files ne produit rien (pas de vérification préalable)
+    for entry, extension in _walk_files(folder_path):
+        yield extension_map.get(extension, 'unknown'), entry.path
+
+
+def _walk_files(root, folders: Optional[List[str]] = None) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Parcourt une arborescence avec os.scandir, sans créer de Path par entrée
+    
+    Le type vient de l'entrée de répertoire (pas de stat()); les liens
+    symboliques vers des dossiers ne sont pas suivis.
+    
+    Args:
+        root: Dossier de départ
+        folders: Liste complétée avec les sous-dossiers rencontrés (optionnel)
+        
+    Yields:
+        Tuple[os.DirEntry, str]: (entrée du fichier, extension en minuscules)
+    """
+    directories = [os.fspath(root)]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                        if folders is not None:
+                            folders.append(entry.path)
+                    elif entry.is_file():
+                        yield entry, _media_extension(entry.name)
+        except OSError:
+            continue
+
+
+# Nombre de sous-dossiers parcourus simultanément dans find_song_folders
+_DISCOVERY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def find_song_folders(base_folder: Path, media_extensions: Collection[str]) -> List[Path]:
+    """
+    Cherche les dossiers de chansons à importer en un seul parcours
+    
+    Le dossier de base est retenu s'il contient des médias (à n'importe quelle
+    profondeur), chaque sous-dossier direct s'il en contient lui-même.
+    
+    Args:
+        base_folder: Dossier sélectionné
+        media_extensions: Extensions supportées, en minuscules (ensemble ou table)
         
     Returns:
-        Optional[Path]: Chemin du fichier copié ou None si erreur
+        List[Path]: Dossiers contenant au moins un fichier média supporté
     """
-    if not source_file.exists():
-        return None
+    base_has_media = False
+    subfolders = []
+    try:
+        with os.scandir(base_folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+                elif not base_has_media and entry.is_file():
+                    base_has_media = _media_extension(entry.name) in media_extensions
+    except OSError:
+        return []
+    
+    # Sous-dossiers parcourus en parallèle: scandir/stat relâchent le GIL
+    with ThreadPoolExecutor(max_workers=_DISCOVERY_WORKERS) as executor:
+        has_media = executor.map(_contains_media, subfolders, repeat(media_extensions))
+        song_folders = [Path(folder) for folder, found in zip(subfolders, has_media) if found]
+    
+    if base_has_media or song_folders:
+        song_folders.insert(0, Path(base_folder))
+    return song_folders
+
+
+def _media_extension(name: str) -> str:
+    """Extension en minuscules d'un nom de fichier ('.bashrc' -> '')"""
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
+
+
+def _contains_media(folder: str, media_extensions: Collection[str]) -> bool:
+    """True dès qu'un fichier média est trouvé dans l'arborescence du dossier"""
+    directories = [folder]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    # Type lu dans l'entrée de répertoire, sans stat()
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.is_file() and _media_extension(entry.name) in media_extensions:
+                        return True
+        except OSError:
+            continue
+    return False
+
+
+def _free_destination(folder: Path, name: str) -> Path:
+    """
+    Trouve un nom libre dans un dossier: name, puis stem_1.ext, stem_2.ext...
+    
+    Les suffixes déjà pris sont bornés par sauts exponentiels puis
+    dichotomie (O(log N) stat).
+    
+    Args:
+        folder: Dossier de destination
+        name: Nom de fichier souhaité
+        
+    Returns:
+        Path: Chemin libre dans le dossier
+    """
+    candidate = folder / name
+    if not os.path.lexists(candidate):
+        return candidate
+    
+    stem, suffix = candidate.stem, candidate.suffix
+    
+    def taken(n: int) -> bool:
+        return os.path.lexists(folder / f"{stem}_{n}{suffix}")
     
+    # Borne haute par sauts exponentiels, puis premier suffixe libre par dichotomie
+    low, high = 0, 1
+    while taken(high):
+        low, high = high, high * 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        if taken(middle):
+            low = middle
+        else:
+            high = middle
+    
+    return folder / f"{stem}_{high}{suffix}"
+
+
+def _song_destination(source_file: Path, song_folder: Path, media_type: str) -> Path:
+    """
+    Prépare la destination d'un fichier dans le dossier d'une chanson
+    
+    Args:
+        source_file: Fichier à placer
+        song_folder: Dossier de la chanson
+        media_type: Type de média ('documents', 'audio', 'video')
+        
+    Returns:
+        Path: Chemin libre du fichier dans le dossier de destination (créé)
+    """
     # Déterminer le dossier de destination
-    if media_type == 'documents':
-        dest_folder = song_folder / "documents"
-    elif media_type == 'audio':
-        dest_folder = song_folder / "audio"
-    elif media_type == 'video':
-        dest_folder = song_folder / "video"
+    if media_type in ('documents', 'audio', 'video'):
+        dest_folder = song_folder / media_type
     else:
         dest_folder = song_folder
     
     dest_folder.mkdir(parents=True, exist_ok=True)
     
     # Gérer les doublons de noms
-    dest_file = dest_folder / source_file.name
-    counter = 1
+    return _free_destination(dest_folder, source_file.name)
+
+
+def copy_file_to_song_folder(source_file: Path, song_folder: Path, media_type: str) -> Optional[Path]:
+    """
+    Copie un fichier dans le dossier d'une chanson
     
-    while dest_file.exists():
-        name_parts = source_file.stem, counter, source_file.suffix
-        dest_file = dest_folder / f"{name_parts[0]}_{name_parts[1]}{name_parts[2]}"
-        counter += 1
+    Args:
+        source_file: Fichier source à copier
+        song_folder: Dossier de destination de la chanson
+        media_type: Type de média ('documents', 'audio', 'video')
+        
+    Returns:
+        Optional[Path]: Chemin du fichier copié ou None si erreur
+    """
+    if not source_file.exists():
+        return None
+    
+    dest_file = _song_destination(source_file, song_folder, media_type)
     
     try:
         shutil.copy2(source_file, dest_file)
@@ -232,6 +423,20 @@ def move_file_to_song_folder(source_file: Path, song_folder: Path, media_type: s
     Returns:
         Optional[Path]: Chemin du fichier déplacé ou None si erreur
     """
+    if not source_file.exists():
+        return None
+    
+    # Même système de fichiers: simple renommage, sans recopier les données
+    dest_file = _song_destination(source_file, song_folder, media_type)
+    try:
+        os.replace(source_file, dest_file)
+        return dest_file
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            print(f"Erreur lors du déplacement de {source_file}: {e}")
+            return None
+    
+    # Autre système de fichiers: copie puis suppression de la source
     dest_file = copy_file_to_song_folder(source_file, song_folder, media_type)
     
     if dest_file:
@@ -246,6 +451,38 @@ def move_file_to_song_folder(source_file: Path, song_folder: Path, media_type: s
     return None
 
 
+# Types MIME des formats supportés par défaut, sans passer par mimetypes
+_EXTENSION_MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.txt': 'text/plain',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.odt': 'application/vnd.oasis.opendocument.text',
+    '.rtf': 'application/rtf',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.tiff': 'image/tiff',
+    '.webp': 'image/webp',
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/x-wav',
+    '.flac': 'audio/flac',
+    '.ogg': 'audio/ogg',
+    '.m4a': 'audio/mp4',
+    '.aac': 'audio/aac',
+    '.wma': 'audio/x-ms-wma',
+    '.mp4': 'video/mp4',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.mkv': 'video/x-matroska',
+    '.wmv': 'video/x-ms-wmv',
+    '.flv': 'video/x-flv',
+    '.webm': 'video/webm',
+}
+
+
 def get_mime_type(file_path: Path) -> str:
     """
     Retourne le type MIME d'un fichier
@@ -256,32 +493,52 @@ def get_mime_type(file_path: Path) -> str:
     Returns:
         str: Type MIME
     """
-    mime_type, _ = mimetypes.guess_type(str(file_path))
+    mime_type = _EXTENSION_MIME_TYPES.get(file_path.suffix.lower())
+    if mime_type is None:
+        # Extension inhabituelle: tables de mimetypes (chargées au premier appel)
+        mime_type, _ = mimetypes.guess_type(str(file_path))
     return mime_type or "application/octet-stream"
 
 
+# Extensions reconnues par les tests de type (ensembles figés, construits une fois)
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'})
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', '.wma'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'})
+DOCUMENT_EXTENSIONS = frozenset({'.pdf', '.txt', '.doc', '.docx', '.odt', '.rtf'})
+
+# Catégorie de chaque extension connue, nommée comme les clés des statistiques
+# et les sous-dossiers de liens: une seule recherche au lieu de quatre tests
+_EXTENSION_KINDS = {
+    extension: kind
+    for kind, extensions in (('images', IMAGE_EXTENSIONS), ('video', VIDEO_EXTENSIONS),
+                             ('audio', AUDIO_EXTENSIONS), ('documents', DOCUMENT_EXTENSIONS))
+    for extension in extensions
+}
+
+
+def _classify_extension(extension: str) -> str:
+    """Catégorie d'une extension en minuscules: 'documents', 'audio', 'video', 'images' ou 'other'"""
+    return _EXTENSION_KINDS.get(extension, 'other')
+
+
 def is_image_file(file_path: Path) -> bool:
     """Vérifie si un fichier est une image"""
-    image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'}
-    return file_path.suffix.lower() in image_extensions
+    return file_path.suffix.lower() in IMAGE_EXTENSIONS
 
 
 def is_audio_file(file_path: Path) -> bool:
     """Vérifie si un fichier est un audio"""
-    audio_extensions = {'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', '.wma'}
-    return file_path.suffix.lower() in audio_extensions
+    return file_path.suffix.lower() in AUDIO_EXTENSIONS
 
 
 def is_video_file(file_path: Path) -> bool:
     """Vérifie si un fichier est une vidéo"""
-    video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
-    return file_path.suffix.lower() in video_extensions
+    return file_path.suffix.lower() in VIDEO_EXTENSIONS
 
 
 def is_document_file(file_path: Path) -> bool:
     """Vérifie si un fichier est un document"""
-    document_extensions = {'.pdf', '.txt', '.doc', '.docx', '.odt', '.rtf'}
-    return file_path.suffix.lower() in document_extensions
+    return file_path.suffix.lower() in DOCUMENT_EXTENSIONS
 
 
 def cleanup_empty_folders(base_path: Path) -> int:
@@ -294,50 +551,114 @@ def cleanup_empty_folders(base_path: Path) -> int:
     Returns:
         int: Nombre de dossiers supprimés
     """
-    deleted_count = 0
-    
-    if not base_path.exists() or not base_path.is_dir():
-        return 0
+    _, deleted_count = _sweep_empty_dirs(os.fspath(base_path))
+    return deleted_count
+
+
+def _sweep_empty_dirs(folder: str) -> Tuple[bool, int]:
+    """
+    Parcours en profondeur (post-ordre): supprime les sous-dossiers vides en remontant
     
-    # Parcourir de bas en haut pour supprimer les dossiers vides
-    for folder_path in sorted(base_path.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-        if folder_path.is_dir():
+    Args:
+        folder: Dossier à balayer (lui-même n'est pas supprimé)
+        
+    Returns:
+        Tuple[bool, int]: (dossier vide après nettoyage, nombre de dossiers supprimés)
+    """
+    empty = True
+    deleted_count = 0
+    try:
+        with os.scandir(folder) as entries:
+            subfolders = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+                else:
+                    empty = False  # Fichier ou lien symbolique
+    except OSError:
+        return False, 0
+    
+    for subfolder in subfolders:
+        sub_empty, sub_deleted = _sweep_empty_dirs(subfolder)
+        deleted_count += sub_deleted
+        if sub_empty:
             try:
-                folder_path.rmdir()  # Ne fonctionne que si le dossier est vide
+                os.rmdir(subfolder)
                 deleted_count += 1
+                continue
             except OSError:
-                # Dossier non vide, on continue
-                pass
+                pass  # Rempli entre-temps ou droits insuffisants
+        empty = False
     
-    return deleted_count
+    return empty, deleted_count
+
+
+# Octets lus pour le hash partiel de find_duplicate_files
+_HEAD_SIZE = 64 * 1024
+
+# Nombre de fichiers hachés simultanément par find_duplicate_files
+_HASH_WORKERS = os.cpu_count() or 1
+
+
+def _head_hash(file_path: Path) -> str:
+    """Hash MD5 du début du fichier (du fichier entier s'il est plus petit que _HEAD_SIZE)"""
+    try:
+        with open(file_path, 'rb') as f:
+            return hashlib.md5(f.read(_HEAD_SIZE)).hexdigest()
+    except OSError:
+        return ""
 
 
 def find_duplicate_files(folder_path: Path) -> Dict[str, List[Path]]:
     """
     Trouve les fichiers dupliqués dans un dossier
     
+    Filtre en trois étapes: taille, hash des 64 premiers Ko, puis hash complet
+    seulement pour les fichiers encore candidats.
+    
     Args:
         folder_path: Dossier à analyser
         
     Returns:
         Dict[str, List[Path]]: Hash -> Liste des fichiers avec ce hash
     """
-    file_hashes = {}
-    
-    if not folder_path.exists() or not folder_path.is_dir():
-        return {}
-    
-    for file_path in folder_path.rglob("*"):
-        if file_path.is_file():
-            file_hash = get_file_hash(file_path)
+    # 1. Taille (déjà lue par scandir sous Windows, un stat ailleurs)
+    by_size: Dict[int, List[Path]] = {}
+    for entry, _ in _walk_files(folder_path):
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            continue
+        by_size.setdefault(size, []).append(Path(entry.path))
+    
+    # Lectures et hash répartis sur plusieurs threads (hashlib relâche le GIL)
+    candidates = [(size, file_path) for size, files in by_size.items() if len(files) > 1
+                  for file_path in files]
+    duplicates = {}
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+        # 2. Début du fichier, pour les tailles partagées
+        by_head: Dict[Tuple[int, str], List[Path]] = {}
+        heads = executor.map(_head_hash, [file_path for _, file_path in candidates])
+        for (size, file_path), head in zip(candidates, heads):
+            if head:
+                by_head.setdefault((size, head), []).append(file_path)
+        
+        # 3. Hash complet (inutile si le début couvrait tout le fichier)
+        to_hash = []
+        for (size, head), same_head in by_head.items():
+            if len(same_head) < 2:
+                continue
+            if size <= _HEAD_SIZE:
+                duplicates.setdefault(head, []).extend(same_head)
+            else:
+                to_hash.extend(same_head)
+        
+        for file_path, file_hash in zip(to_hash, executor.map(get_file_hash, to_hash)):
             if file_hash:
-                if file_hash not in file_hashes:
-                    file_hashes[file_hash] = []
-                file_hashes[file_hash].append(file_path)
+                duplicates.setdefault(file_hash, []).append(file_path)
     
     # Retourner seulement les hash avec plusieurs fichiers
-    duplicates = {h: files for h, files in file_hashes.items() if len(files) > 1}
-    return duplicates
+    return {h: files for h, files in duplicates.items() if len(files) > 1}
 
 
 def validate_file_structure(song_folder: Path) -> Tuple[bool, List[str]]:
@@ -352,34 +673,19 @@ def validate_file_structure(song_folder: Path) -> Tuple[bool, List[str]]:
     """
     errors = []
     
-    if not song_folder.exists():
+    # Un seul stat pour distinguer dossier absent et fichier
+    try:
+        mode = os.stat(song_folder).st_mode
+    except FileNotFoundError:
         errors.append(f"Le dossier {song_folder} n'existe pas")
         return False, errors
     
-    if not song_folder.is_dir():
+    if not stat.S_ISDIR(mode):
         errors.append(f"{song_folder} n'est pas un dossier")
         return False, errors
     
-    # Vérifier la présence des sous-dossiers recommandés
-    recommended_folders = ['documents', 'audio', 'video']
-    for folder_name in recommended_folders:
-        folder_path = song_folder / folder_name
-        if not folder_path.exists():
-            # Pas une erreur, juste une recommandation
-            pass
-    
-    # Vérifier qu'il y a au moins un fichier média
-    has_media = False
-    for file_path in song_folder.rglob("*"):
-        if file_path.is_file():
-            if (is_document_file(file_path) or 
-                is_audio_file(file_path) or 
-                is_video_file(file_path) or
-                is_image_file(file_path)):
-                has_media = True
-                break
-    
-    if not has_media:
+    # Vérifier qu'il y a au moins un fichier média (arrêt au premier trouvé)
+    if not _contains_media(os.fspath(song_folder), _EXTENSION_KINDS):
         errors.append("Aucun fichier média trouvé dans le dossier")
     
     return len(errors) == 0, errors
@@ -406,27 +712,24 @@ def get_folder_statistics(folder_path: Path) -> Dict[str, int]:
         'total_size': 0
     }
     
-    if not folder_path.exists() or not folder_path.is_dir():
-        return stats
+    # Parcours: extensions et tailles dans deux listes simples, comptées ensuite
+    folders = []
+    extensions = []
+    sizes = []
+    for entry, extension in _walk_files(folder_path, folders):
+        extensions.append(extension)
+        try:
+            sizes.append(entry.stat().st_size)
+        except OSError:
+            pass  # Lien cassé ou fichier disparu pendant le parcours
     
-    for item_path in folder_path.rglob("*"):
-        if item_path.is_file():
-            stats['total_files'] += 1
-            stats['total_size'] += item_path.stat().st_size
-            
-            if is_document_file(item_path):
-                stats['documents'] += 1
-            elif is_audio_file(item_path):
-                stats['audio'] += 1
-            elif is_video_file(item_path):
-                stats['video'] += 1
-            elif is_image_file(item_path):
-                stats['images'] += 1
-            else:
-                stats['other'] += 1
-                
-        elif item_path.is_dir():
-            stats['total_folders'] += 1
+    stats['total_files'] = len(extensions)
+    stats['total_size'] = sum(sizes)
+    
+    # Une seule classification par extension distincte
+    for extension, count in Counter(extensions).items():
+        stats[_classify_extension(extension)] += count
+    stats['total_folders'] = len(folders)
     
     return stats
 
@@ -450,47 +753,31 @@ def create_media_symlinks(source_folder: Path, target_folder: Path) -> Dict[str,
         'images': 0,
         'errors': 0
     }
+    created_kinds = set()
     
-    if not source_folder.exists():
-        return links_created
-    
-    target_folder.mkdir(parents=True, exist_ok=True)
-    
-    for file_path in source_folder.rglob("*"):
-        if file_path.is_file():
-            try:
-                # Déterminer le type et le dossier cible
-                if is_document_file(file_path):
-                    subfolder = target_folder / "documents"
-                    links_created['documents'] += 1
-                elif is_audio_file(file_path):
-                    subfolder = target_folder / "audio"
-                    links_created['audio'] += 1
-                elif is_video_file(file_path):
-                    subfolder = target_folder / "video"
-                    links_created['video'] += 1
-                elif is_image_file(file_path):
-                    subfolder = target_folder / "images"
-                    links_created['images'] += 1
-                else:
-                    continue  # Ignorer les autres types
-                
-                subfolder.mkdir(exist_ok=True)
-                link_path = subfolder / file_path.name
-                
-                # Éviter les doublons
-                counter = 1
-                while link_path.exists():
-                    stem = file_path.stem
-                    suffix = file_path.suffix
-                    link_path = subfolder / f"{stem}_{counter}{suffix}"
-                    counter += 1
-                
-                # Créer le lien symbolique
-                link_path.symlink_to(file_path.absolute())
-                
-            except Exception as e:
-                print(f"Erreur lors de la création du lien pour {file_path}: {e}")
-                links_created['errors'] += 1
+    # Racine absolue une fois: les chemins produits par scandir le sont aussi
+    # (pas de Path.absolute() par lien). Source absente: rien n'est créé
+    for entry, extension in _walk_files(os.path.abspath(source_folder)):
+        try:
+            # Déterminer le type et le dossier cible (même nom)
+            kind = _classify_extension(extension)
+            if kind == 'other':
+                continue  # Ignorer les autres types
+            subfolder = target_folder / kind
+            links_created[kind] += 1
+            
+            # Sous-dossier créé au premier lien de son type (pas un mkdir par lien)
+            if kind not in created_kinds:
+                subfolder.mkdir(parents=True, exist_ok=True)
+                created_kinds.add(kind)
+            # Éviter les doublons
+            link_path = _free_destination(subfolder, entry.name)
+            
+            # Créer le lien symbolique
+            os.symlink(entry.path, link_path)
+            
+        except Exception as e:
+            print(f"Erreur lors de la création du lien pour {entry.path}: {e}")
+            links_created['errors'] += 1
     
     return links_created
\ No newline at end of file